@@ -1,37 +1,134 @@
 """
 Admin blog API routes (authentication required).
 """
-from typing import List
-from fastapi import APIRouter, Depends, UploadFile, File
+from typing import List, Optional
+from fastapi import APIRouter, Depends, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
 
-from app.core.database import get_db
+from app.core.database import get_db, get_bulk_db
 from app.middleware.auth import get_current_user
 from app.repositories.blog_repository import BlogRepository
 from app.services.blog_service import BlogService
 from app.services.upload_service import upload_service
-from app.schemas.blog import BlogCreate, BlogUpdate, BlogPublic, BlogListItem
+from app.schemas.blog import (
+    BlogCreate, BlogUpdate, BlogPublic, BlogListPage, BlogImportResult,
+    BlogSearchPage, BlogRevision, BlogRevisionDiff, BlogStats
+)
 from app.schemas.responses import SuccessResponse
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
+TRANSFER_FORMAT = "^(ndjson|csv)$"
+BLOG_STATUS = "^(published|draft|featured)$"
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 
 class BulkActionRequest(BaseModel):
     """Request schema for bulk actions."""
     ids: List[int]
 
 
-@router.get("/blogs", response_model=SuccessResponse[List[BlogListItem]])
+@router.get("/blogs", response_model=SuccessResponse[BlogListPage])
 async def get_all_blogs(
+    limit: int = Query(50, ge=1, le=200),
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    blog_status: Optional[str] = Query(None, alias="status", pattern=BLOG_STATUS),
+    cursor = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get blogs for admin dashboard (including unpublished), newest first.
+    Keyset-paginated: pass next_cursor back as ?cursor= for the next page.
+    ?status= narrows the list to published, draft or featured posts.
+    """
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    page = await blog_service.get_blogs_page(
+        published_only=False,
+        limit=limit,
+        cursor=page_cursor,
+        status=blog_status
+    )
+    return SuccessResponse(data=page)
+
+
+@router.get("/blogs/stats", response_model=SuccessResponse[BlogStats])
+async def get_blog_stats(
     cursor = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get all blogs for admin dashboard (including unpublished)."""
+    """Post totals for the dashboard: all, published, draft and featured."""
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    blogs = blog_service.get_all_blogs(published_only=False)
-    return SuccessResponse(data=blogs)
+    stats = await blog_service.get_blog_stats()
+    return SuccessResponse(data=stats)
+
+
+@router.get("/blogs/search", response_model=SuccessResponse[BlogSearchPage])
+async def search_blogs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    page_cursor: Optional[str] = Query(None, alias="cursor"),
+    cursor = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Full-text search over all blogs, including drafts (not cached)."""
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    page = await blog_service.search_blogs(
+        q,
+        published_only=False,
+        limit=limit,
+        cursor=page_cursor
+    )
+    return SuccessResponse(data=page)
+
+
+@router.get("/blogs/export")
+async def export_blogs(
+    export_format: str = Query("ndjson", alias="format", pattern=TRANSFER_FORMAT),
+    cursor = Depends(get_bulk_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Download every blog as NDJSON (one object per line) or CSV.
+    Streamed from PostgreSQL COPY, so memory use stays flat.
+    """
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    return StreamingResponse(
+        blog_service.export_blogs(export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="blogs.{export_format}"'
+        }
+    )
+
+
+@router.post("/blogs/import", response_model=SuccessResponse[BlogImportResult])
+async def import_blogs(
+    file: UploadFile = File(...),
+    import_format: str = Query("ndjson", alias="format", pattern=TRANSFER_FORMAT),
+    cursor = Depends(get_bulk_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Bulk import blogs from an NDJSON or CSV file (same shape as export).
+    Rows with a taken slug or invalid fields are skipped and reported.
+    """
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    result = await blog_service.import_blogs(file.file, import_format)
+    return SuccessResponse(
+        data=result,
+        message=f"Imported {result.imported} blogs, {result.failed} rejected"
+    )
 
 
 @router.get("/blogs/{blog_id}", response_model=SuccessResponse[BlogPublic])
@@ -44,7 +141,7 @@ async def get_blog(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    blog = blog_service.get_blog_by_id(blog_id)
+    blog = await blog_service.get_blog_by_id(blog_id)
     return SuccessResponse(data=blog)
 
 
@@ -58,7 +155,7 @@ async def create_blog(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    result = blog_service.create_blog(blog_data)
+    result = await blog_service.create_blog(blog_data)
     return SuccessResponse(data=result, message="Blog created successfully")
 
 
@@ -73,10 +170,67 @@ async def update_blog(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    result = blog_service.update_blog(blog_id, blog_data)
+    result = await blog_service.update_blog(blog_id, blog_data)
     return SuccessResponse(data=result, message="Blog updated successfully")
 
 
+@router.get("/blogs/{blog_id}/revisions", response_model=SuccessResponse[List[BlogRevision]])
+async def list_revisions(
+    blog_id: int,
+    cursor = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """List a blog's saved revisions, newest first."""
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    revisions = await blog_service.list_revisions(blog_id)
+    return SuccessResponse(data=revisions)
+
+
+@router.get(
+    "/blogs/{blog_id}/revisions/{revision}/diff",
+    response_model=SuccessResponse[BlogRevisionDiff]
+)
+async def diff_revision(
+    blog_id: int,
+    revision: int,
+    against: Optional[int] = Query(None, ge=0),
+    cursor = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Show what a revision changed, compared with the previous revision
+    or with ?against=N.
+    """
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    diff = await blog_service.diff_revisions(blog_id, revision, against)
+    return SuccessResponse(data=diff)
+
+
+@router.post(
+    "/blogs/{blog_id}/revisions/{revision}/restore",
+    response_model=SuccessResponse[dict]
+)
+async def restore_revision(
+    blog_id: int,
+    revision: int,
+    cursor = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """Restore a blog's content from a revision (saved as a new revision)."""
+    blog_repo = BlogRepository(cursor)
+    blog_service = BlogService(blog_repo)
+    
+    result = await blog_service.restore_revision(blog_id, revision)
+    return SuccessResponse(
+        data=result,
+        message=f"Blog restored to revision {revision}"
+    )
+
+
 @router.delete("/blogs/{blog_id}", response_model=SuccessResponse)
 async def delete_blog(
     blog_id: int,
@@ -87,7 +241,7 @@ async def delete_blog(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    blog_service.delete_blog(blog_id)
+    await blog_service.delete_blog(blog_id)
     return SuccessResponse(message="Blog deleted successfully")
 
 
@@ -101,7 +255,7 @@ async def toggle_publish(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    new_status = blog_service.toggle_published(blog_id)
+    new_status = await blog_service.toggle_published(blog_id)
     return SuccessResponse(
         data={"published": new_status},
         message=f"Blog {'published' if new_status else 'unpublished'}"
@@ -118,7 +272,7 @@ async def toggle_featured(
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    new_status = blog_service.toggle_featured(blog_id)
+    new_status = await blog_service.toggle_featured(blog_id)
     return SuccessResponse(
         data={"is_featured": new_status},
         message=f"Blog {'featured' if new_status else 'unfeatured'}"
@@ -128,14 +282,14 @@ async def toggle_featured(
 @router.post("/blogs/bulk/publish", response_model=SuccessResponse[dict])
 async def bulk_publish(
     request: BulkActionRequest,
-    cursor = Depends(get_db),
+    cursor = Depends(get_bulk_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Bulk publish blogs."""
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    count = blog_service.bulk_publish(request.ids)
+    count = await blog_service.bulk_publish(request.ids)
     return SuccessResponse(
         data={"affected": count},
         message=f"Published {count} blogs"
@@ -145,14 +299,14 @@ async def bulk_publish(
 @router.post("/blogs/bulk/unpublish", response_model=SuccessResponse[dict])
 async def bulk_unpublish(
     request: BulkActionRequest,
-    cursor = Depends(get_db),
+    cursor = Depends(get_bulk_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Bulk unpublish blogs."""
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    count = blog_service.bulk_unpublish(request.ids)
+    count = await blog_service.bulk_unpublish(request.ids)
     return SuccessResponse(
         data={"affected": count},
         message=f"Unpublished {count} blogs"
@@ -162,14 +316,14 @@ async def bulk_unpublish(
 @router.post("/blogs/bulk/delete", response_model=SuccessResponse[dict])
 async def bulk_delete(
     request: BulkActionRequest,
-    cursor = Depends(get_db),
+    cursor = Depends(get_bulk_db),
     current_user: dict = Depends(get_current_user)
 ):
     """Bulk delete blogs."""
     blog_repo = BlogRepository(cursor)
     blog_service = BlogService(blog_repo)
     
-    count = blog_service.bulk_delete(request.ids)
+    count = await blog_service.bulk_delete(request.ids)
     return SuccessResponse(
         data={"affected": count},
         message=f"Deleted {count} blogs"
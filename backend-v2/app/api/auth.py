@@ -27,5 +27,5 @@ async def login(
     user_repo = UserRepository(cursor)
     auth_service = AuthService(user_repo)
     
-    return auth_service.authenticate_user(login_data)
+    return await auth_service.authenticate_user(login_data)
 
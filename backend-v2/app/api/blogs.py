@@ -1,39 +1,132 @@
 """
 Public blog API routes (no authentication required).
+Every route is served from the cache; misses are filled by the service in
+read sessions of their own (see BlogService._loader), so routes open no
+database session.
 """
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+from fastapi import APIRouter, Query
 
-from app.core.database import get_db
-from app.repositories.blog_repository import BlogRepository
 from app.services.blog_service import BlogService
-from app.schemas.blog import BlogPublic, BlogPageData
+from app.schemas.blog import (
+    BlogPublic, BlogListPage, BlogPageData, BlogSearchPage, TagCount, CategoryCount
+)
 from app.schemas.responses import SuccessResponse
 
 router = APIRouter(prefix="/api/blogs", tags=["blogs"])
 
 
 @router.get("/page-data", response_model=SuccessResponse[BlogPageData])
-async def get_blog_page_data(cursor = Depends(get_db)):
+async def get_blog_page_data():
     """
     Get all blog page data in a single optimized request.
     Includes: featured blog, latest blogs, popular blogs, categories.
     Cached for 5 minutes.
     """
-    blog_repo = BlogRepository(cursor)
-    blog_service = BlogService(blog_repo)
+    blog_service = BlogService()
     
-    data = blog_service.get_page_data()
+    data = await blog_service.get_page_data()
     return SuccessResponse(data=data)
 
 
+@router.get("/archive", response_model=SuccessResponse[BlogListPage])
+async def get_blog_archive(
+    limit: int = Query(20, ge=1, le=100),
+    page_cursor: Optional[str] = Query(None, alias="cursor")
+):
+    """
+    Get published blogs newest first, keyset-paginated.
+    Pass next_cursor back as ?cursor= for the next page.
+    Cached for 5 minutes.
+    """
+    blog_service = BlogService()
+    
+    page = await blog_service.get_archive_page(limit=limit, cursor=page_cursor)
+    return SuccessResponse(data=page)
+
+
+@router.get("/tags", response_model=SuccessResponse[List[TagCount]])
+async def get_tag_cloud(
+    limit: int = Query(100, ge=1, le=500)
+):
+    """
+    Get the tag cloud: published post count per tag, most used first.
+    Cached until a write changes tags or published status.
+    """
+    blog_service = BlogService()
+    
+    tags = await blog_service.get_tag_cloud(limit=limit)
+    return SuccessResponse(data=tags)
+
+
+@router.get("/categories", response_model=SuccessResponse[List[CategoryCount]])
+async def get_categories():
+    """
+    Get published post count per category, largest first.
+    Cached until a write changes categories or published status.
+    """
+    blog_service = BlogService()
+    
+    categories = await blog_service.get_category_counts()
+    return SuccessResponse(data=categories)
+
+
+@router.get("/tag/{tag}", response_model=SuccessResponse[BlogListPage])
+async def get_blogs_by_tag(
+    tag: str,
+    limit: int = Query(20, ge=1, le=100),
+    page_cursor: Optional[str] = Query(None, alias="cursor")
+):
+    """
+    Get published blogs with a tag, newest first, keyset-paginated.
+    Cached for 5 minutes.
+    """
+    blog_service = BlogService()
+    
+    page = await blog_service.get_tag_page(tag, limit=limit, cursor=page_cursor)
+    return SuccessResponse(data=page)
+
+
+@router.get("/category/{slug}", response_model=SuccessResponse[BlogListPage])
+async def get_blogs_by_category(
+    slug: str,
+    limit: int = Query(20, ge=1, le=100),
+    page_cursor: Optional[str] = Query(None, alias="cursor")
+):
+    """
+    Get published blogs in a category (by slug), newest first,
+    keyset-paginated. Cached for 5 minutes.
+    """
+    blog_service = BlogService()
+    
+    page = await blog_service.get_category_page(slug, limit=limit, cursor=page_cursor)
+    return SuccessResponse(data=page)
+
+
+@router.get("/search", response_model=SuccessResponse[BlogSearchPage])
+async def search_blogs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    page_cursor: Optional[str] = Query(None, alias="cursor")
+):
+    """
+    Full-text search over published blogs, best match first.
+    Supports "quoted phrases", OR and -exclusions. Each hit carries a
+    snippet with matches wrapped in <mark>. Cached for 5 minutes.
+    """
+    blog_service = BlogService()
+    
+    page = await blog_service.search_blogs(q, limit=limit, cursor=page_cursor)
+    return SuccessResponse(data=page)
+
+
 @router.get("/{slug}", response_model=SuccessResponse[BlogPublic])
-async def get_blog_by_slug(slug: str, cursor = Depends(get_db)):
+async def get_blog_by_slug(slug: str):
     """
     Get a single published blog by slug.
     Cached for 10 minutes.
     """
-    blog_repo = BlogRepository(cursor)
-    blog_service = BlogService(blog_repo)
+    blog_service = BlogService()
     
-    blog = blog_service.get_blog_by_slug(slug)
+    blog = await blog_service.get_blog_by_slug(slug)
     return SuccessResponse(data=blog)
@@ -1,75 +1,309 @@
 """
 Redis cache service with graceful fallback when Redis is unavailable.
+Uses redis.asyncio over one bounded connection pool per process, so cache
+round trips yield to other requests instead of blocking the event loop.
+Hot keys are also held in a small in-process LRU (L1) in front of Redis;
+the blog change feed evicts it in every process, and a short TTL bounds
+staleness when the feed is off. Without Redis the L1 still caches.
+get_or_load() coordinates fills so an expiring key is loaded once, not
+by every request that misses it.
 """
+import asyncio
 import json
-from typing import Any, Optional
-import redis
+import secrets
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+import redis.asyncio as redis
 from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Generation counters each key is stamped with, by longest matching key
+# prefix. Bumping a counter invalidates every key stamped with it in O(1)
+# whatever the keyspace size; the superseded entries fail their stamp
+# check and are overwritten or expire.
+GENERATIONS = {
+    "blog:": ("blog",),
+    # Pages and aggregates that list many posts
+    "blog:page_data": ("blog", "blog_lists"),
+    "blog:archive:": ("blog", "blog_lists"),
+    "blog:tag:": ("blog", "blog_lists"),
+    "blog:category:": ("blog", "blog_lists"),
+    "blog:search:": ("blog", "blog_lists"),
+    "taxonomy:": ("taxonomy",),
+}
+
+GENERATION_KEY = "cache:generation:{}"
+
+# Keys that also carry a generation of their own (named after the key),
+# so evict_blogs() can invalidate one post's page without touching the
+# rest. Those counters expire once no entry stamped with them can be
+# alive; a counter that restarts at "0" only turns newer entries into
+# misses.
+KEY_GENERATION_PREFIXES = ("blog:slug:",)
+KEY_GENERATION_SECONDS = 24 * 60 * 60
+
+# Cross-process fill lock: held while one process loads a key, so others
+# wait for its value instead of loading it too. Expires on its own if the
+# holder dies; fills are bounded by the public statement timeout.
+FILL_LOCK_KEY = "cache:fill:{}"
+FILL_LOCK_SECONDS = 5.0
+
+# How often a process waiting on another's fill re-reads the key
+FILL_POLL_SECONDS = 0.05
+
+
+def _generations(key: str) -> Tuple[str, ...]:
+    """Generation counters a key is stamped with."""
+    matches = [prefix for prefix in GENERATIONS if key.startswith(prefix)]
+    names = GENERATIONS[max(matches, key=len)] if matches else ()
+    if key.startswith(KEY_GENERATION_PREFIXES):
+        names += (key,)
+    return names
+
+
+class LocalCache:
+    """
+    In-process LRU cache with per-entry expiry and a byte budget.
+    Values are returned as stored, shared between callers, so they must
+    not be mutated. version counts deletes, so a value read before one
+    is not stored after it.
+    """
+    
+    def __init__(self, max_bytes: int, ttl: float):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_bytes: Budget for the summed entry sizes (0 disables)
+            ttl: Upper bound on any entry's lifetime in seconds
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.version = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Value for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+    
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        ttl: float,
+        version: Optional[int] = None
+    ) -> None:
+        """
+        Store a value, evicting least recently used entries over budget.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate size in bytes (the serialized length)
+            ttl: Requested lifetime, capped at the cache's own TTL
+            version: The version the value was read at; not stored if
+                anything was deleted since
+        """
+        if version is not None and version != self.version:
+            return
+        self._pop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + min(ttl, self.ttl), size, value)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+    
+    def delete(self, pattern: str) -> None:
+        """Remove keys matching a Redis-style glob pattern."""
+        self.version += 1
+        if not any(char in pattern for char in "*?["):
+            self._pop(pattern)
+            return
+        for key in [key for key in self._entries if fnmatchcase(key, pattern)]:
+            self._pop(key)
+    
+    def _pop(self, key: str) -> None:
+        """Remove one key if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
 
 class CacheService:
-    """Redis cache with fallback to no-op when unavailable."""
+    """Redis cache behind an in-process L1, with fallback when Redis is unavailable."""
     
     def __init__(self):
-        """Initialize Redis connection."""
+        """Initialize an unconnected cache; connect() opens the pool."""
+        self._local = LocalCache(settings.CACHE_L1_MAX_BYTES, settings.CACHE_L1_TTL)
+        # In-flight loads by key: fills shared by the requests waiting on
+        # them, and background refreshes of stale values
+        self._fills: Dict[str, asyncio.Task] = {}
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self._pool: Optional[redis.BlockingConnectionPool] = None
         self._client: Optional[redis.Redis] = None
         self._available = False
-        self._init_redis()
     
-    def _init_redis(self) -> None:
-        """Initialize Redis client."""
+    async def connect(self) -> None:
+        """
+        Create the shared Redis connection pool and check Redis is reachable.
+        Must run inside the event loop (called from the startup hook).
+        """
         if not settings.REDIS_URL:
             logger.warning("REDIS_URL not configured - caching disabled")
             return
         
         try:
-            self._client = redis.from_url(
+            # Blocking pool: a burst waits briefly for a free connection
+            # instead of failing with "Too many connections"
+            self._pool = redis.BlockingConnectionPool.from_url(
                 settings.REDIS_URL,
                 decode_responses=True,
-                socket_connect_timeout=2
+                max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+                timeout=settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=30
             )
+            self._client = redis.Redis(connection_pool=self._pool)
             # Test connection
-            self._client.ping()
+            await self._client.ping()
             self._available = True
-            logger.info("Redis cache initialized")
+            logger.info(f"Redis cache initialized (pool of {settings.REDIS_POOL_MAX_CONNECTIONS})")
         except Exception as e:
             logger.warning(f"Redis unavailable: {e} - running without cache")
+            await self.close()
+    
+    async def close(self) -> None:
+        """Cancel in-flight fills, close the client and disconnect the pool."""
+        for task in [*self._fills.values(), *self._refreshes.values()]:
+            task.cancel()
+        self._available = False
+        if self._client:
+            await self._client.aclose()
             self._client = None
-            self._available = False
+        if self._pool:
+            await self._pool.disconnect()
+            self._pool = None
     
-    def get(self, key: str) -> Optional[Any]:
+    async def _read(self, key: str) -> Optional[Tuple[Any, bool]]:
         """
-        Get value from cache.
+        Read a Redis entry and its generation counters in one round trip.
         
-        Args:
-            key: Cache key
-            
         Returns:
-            Cached value or None if not found/unavailable
+            (value, fresh) or None if missing, invalidated or unavailable;
+            stale values are past their TTL but within CACHE_STALE_TTL
         """
         if not self._available or not self._client:
             return None
         
+        version = self._local.version
         try:
-            data = self._client.get(key)
-            if data:
-                return json.loads(data)
-            return None
+            data, *stamp = await self._client.mget(
+                key, *(GENERATION_KEY.format(name) for name in _generations(key))
+            )
+            if not data:
+                return None
+            entry = json.loads(data)
+            if entry["g"] != [generation or "0" for generation in stamp]:
+                return None
+            fresh = time.time() < entry["f"]
+            if fresh:
+                self._local.set(key, entry["v"], len(data), entry["f"] - time.time(), version)
+            return entry["v"], fresh
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return None
     
-    def set(
+    async def _stamp(self, key: str) -> Optional[List[str]]:
+        """Current generation counters of a key, or None if unavailable."""
+        if not self._available or not self._client:
+            return None
+        
+        try:
+            names = [GENERATION_KEY.format(name) for name in _generations(key)]
+            stamp = await self._client.mget(*names) if names else []
+            return [generation or "0" for generation in stamp]
+        except Exception as e:
+            logger.error(f"Cache get error for generations of {key}: {e}")
+            return None
+    
+    async def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        stamp: Optional[List[str]],
+        version: int
+    ) -> bool:
+        """
+        Store a value stamped in Redis, then in the L1. Redis keeps it for
+        CACHE_STALE_TTL past its TTL so it can be served while refreshed.
+        Nothing is stored if the key's generations moved since the value
+        was read, and the L1 only takes what Redis took (anything when
+        Redis is not in use).
+        
+        Args:
+            stamp: Generations read before the value (None if that failed)
+            version: L1 version read before the value
+        """
+        if not self._available or not self._client:
+            self._local.set(key, value, len(json.dumps(value)), ttl, version)
+            return False
+        
+        if stamp is None or await self._stamp(key) != stamp:
+            return False
+        
+        data = json.dumps({"g": stamp, "f": time.time() + ttl, "v": value})
+        try:
+            await self._client.setex(key, ttl + settings.CACHE_STALE_TTL, data)
+        except Exception as e:
+            logger.error(f"Cache set error for key {key}: {e}")
+            return False
+        self._local.set(key, value, len(data), ttl, version)
+        return True
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value (shared with other callers, do not mutate) or
+            None if not found/expired/invalidated/unavailable
+        """
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        
+        entry = await self._read(key)
+        return entry[0] if entry and entry[1] else None
+    
+    async def set(
         self,
         key: str,
         value: Any,
         ttl: int = settings.CACHE_TTL
     ) -> bool:
         """
-        Set value in cache with TTL.
+        Set value in cache with TTL, stamped with the key's current
+        generation counters.
         
         Args:
             key: Cache key
@@ -77,48 +311,237 @@ class CacheService:
             ttl: Time to live in seconds
             
         Returns:
-            True if successful, False otherwise
+            True if stored in Redis, False otherwise
+        """
+        version = self._local.version
+        return await self._store(key, value, ttl, await self._stamp(key), version)
+    
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        ttl: int = settings.CACHE_TTL
+    ) -> Optional[Any]:
+        """
+        Get value from cache, loading and caching it on a miss.
+        
+        Concurrent misses for a key share one load per process, and a
+        Redis lock lets one process load while the others wait for its
+        value. A value past its TTL is still returned for up to
+        CACHE_STALE_TTL while a single background load refreshes it, so
+        expiry costs no request a load; invalidated values are never
+        served.
+        
+        Args:
+            key: Cache key
+            load: Coroutine function returning the JSON-serializable
+                value, or None for nothing to cache. It may outlive the
+                request that started it, so it must not use that
+                request's database session.
+            ttl: Time to live in seconds
+            
+        Returns:
+            Cached or loaded value (shared with other callers, do not
+            mutate)
+        """
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        
+        entry = await self._read(key)
+        if entry is not None:
+            value, fresh = entry
+            if not fresh:
+                self._fill(key, load, ttl, wait=False)
+            return value
+        
+        # Shielded: a waiter going away must not cancel the shared load
+        return await asyncio.shield(self._fill(key, load, ttl, wait=True))
+    
+    def _fill(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        ttl: int,
+        wait: bool
+    ) -> asyncio.Task:
+        """The key's in-flight fill (or refresh) task, started if there is none."""
+        tasks = self._fills if wait else self._refreshes
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, load, ttl, wait))
+            tasks[key] = task
+            task.add_done_callback(lambda done: self._fill_done(tasks, key, done))
+        return task
+    
+    def _fill_done(self, tasks: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+        """Forget a finished load; refresh failures are logged, nobody awaits them."""
+        if tasks.get(key) is task:
+            del tasks[key]
+        if task.cancelled():
+            return
+        # Retrieved even if every waiter has gone away
+        error = task.exception()
+        if error is not None and tasks is self._refreshes:
+            logger.error(f"Cache refresh failed for key {key}: {error}")
+    
+    async def _load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        ttl: int,
+        wait: bool
+    ) -> Optional[Any]:
+        """
+        Load and store a key under the cross-process fill lock.
+        
+        Args:
+            wait: If another process holds the lock, wait for the value it
+                stores (loading anyway once the lock would have expired);
+                otherwise leave the fill to it and return None
+        """
+        token = await self._lock(key)
+        if token is None:
+            if not wait:
+                return None
+            deadline = time.monotonic() + FILL_LOCK_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(FILL_POLL_SECONDS)
+                entry = await self._read(key)
+                if entry is not None and entry[1]:
+                    return entry[0]
+                # Released without a value (nothing to cache, or failed)
+                if not await self._locked(key):
+                    break
+        
+        try:
+            # Stamped with the generations from before the load, so a
+            # write invalidating the key meanwhile also invalidates this
+            version = self._local.version
+            stamp = await self._stamp(key)
+            value = await load()
+            if value is not None:
+                await self._store(key, value, ttl, stamp, version)
+            return value
+        finally:
+            if token:
+                await self._unlock(key, token)
+    
+    async def _lock(self, key: str) -> Optional[str]:
+        """
+        Take the key's fill lock.
+        
+        Returns:
+            The lock's token, "" if there is no lock to take (Redis
+            unavailable or failing), or None if another process holds it
         """
         if not self._available or not self._client:
-            return False
+            return ""
         
+        token = secrets.token_hex(8)
         try:
-            self._client.setex(
-                key,
-                ttl,
-                json.dumps(value)
+            taken = await self._client.set(
+                FILL_LOCK_KEY.format(key), token, nx=True, px=int(FILL_LOCK_SECONDS * 1000)
             )
-            return True
+            return token if taken else None
         except Exception as e:
-            logger.error(f"Cache set error for key {key}: {e}")
+            logger.error(f"Cache lock error for key {key}: {e}")
+            return ""
+    
+    async def _locked(self, key: str) -> bool:
+        """Whether the key's fill lock is held (False if Redis fails)."""
+        try:
+            return bool(await self._client.exists(FILL_LOCK_KEY.format(key)))
+        except Exception as e:
+            logger.error(f"Cache lock error for key {key}: {e}")
             return False
     
-    def delete(self, pattern: str) -> bool:
+    async def _unlock(self, key: str, token: str) -> None:
         """
-        Delete keys matching pattern.
+        Release a fill lock if still ours. Check and delete are separate
+        commands; in the rare case the lock expires and is retaken in
+        between, the worst outcome is one extra concurrent load.
+        """
+        if not self._client:
+            return
+        
+        lock_key = FILL_LOCK_KEY.format(key)
+        try:
+            if await self._client.get(lock_key) == token:
+                await self._client.delete(lock_key)
+        except Exception as e:
+            logger.error(f"Cache unlock error for key {key}: {e}")
+    
+    async def invalidate(self, name: str) -> bool:
+        """
+        Invalidate every key stamped with a generation counter.
         
         Args:
-            pattern: Key pattern (supports wildcards)
+            name: Generation name from GENERATIONS
             
         Returns:
             True if successful, False otherwise
         """
+        for prefix, names in GENERATIONS.items():
+            if name in names:
+                self._local.delete(f"{prefix}*")
+        
         if not self._available or not self._client:
             return False
         
         try:
-            keys = self._client.keys(pattern)
-            if keys:
-                self._client.delete(*keys)
+            await self._client.incr(GENERATION_KEY.format(name))
             return True
         except Exception as e:
-            logger.error(f"Cache delete error for pattern {pattern}: {e}")
+            logger.error(f"Cache invalidate error for generation {name}: {e}")
             return False
     
-    def invalidate_blog_cache(self) -> None:
+    async def evict_blogs(
+        self,
+        slugs: Iterable[str],
+        taxonomy: bool = False,
+        lists: bool = True
+    ) -> None:
+        """
+        Evict cache entries affected by changes to specific posts: their
+        detail pages and the list pages and aggregates they may appear in.
+        Other posts' detail pages stay cached. Each detail page's own
+        generation is bumped, so a fill that read the post before the
+        change cannot store it afterwards.
+        
+        Args:
+            slugs: Slugs of the changed posts (old and new on a rename)
+            taxonomy: Whether tag or category counts changed as well
+            lists: Whether the posts were or are listed (published), so
+                list pages and page data may show them
+        """
+        keys = [f"blog:slug:{slug}" for slug in slugs]
+        try:
+            if keys and self._available and self._client:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    pipe.delete(*keys)
+                    for key in keys:
+                        pipe.incr(GENERATION_KEY.format(key))
+                        pipe.expire(GENERATION_KEY.format(key), KEY_GENERATION_SECONDS)
+                    await pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache evict error for slugs {keys}: {e}")
+        for key in keys:
+            self._local.delete(key)
+        if lists:
+            await self.invalidate("blog_lists")
+        if taxonomy:
+            await self.invalidate("taxonomy")
+    
+    async def invalidate_blog_cache(self) -> None:
         """Invalidate all blog-related cache keys."""
-        self.delete("blog:*")
+        await self.invalidate("blog")
         logger.info("Blog cache invalidated")
+    
+    async def invalidate_taxonomy_cache(self) -> None:
+        """Invalidate tag cloud and category counts (only change with taxonomy)."""
+        await self.invalidate("taxonomy")
+        logger.info("Taxonomy cache invalidated")
 
 
 # Singleton cache instance
@@ -2,6 +2,7 @@
 Core configuration module using Pydantic Settings for type-safe environment variables.
 All required configuration is validated at startup - fail fast on misconfiguration.
 """
+import math
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator, model_validator
@@ -27,9 +28,46 @@ class Settings(BaseSettings):
     # Database - REQUIRED
     DATABASE_URL: str
     
+    # Read replicas (optional) - comma-separated URLs for public read traffic
+    DATABASE_REPLICA_URLS: str | None = None
+    READ_YOUR_WRITES_SECONDS: int = 10  # reads stick to primary after a write
+    
+    # Database connection pool
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 20
+    DB_POOL_TIMEOUT: float = 10.0  # seconds to wait for a free connection
+    DB_POOL_MAX_WAITING: int = 200  # queued checkouts before failing fast (0 = unbounded)
+    DB_POOL_MAX_IDLE: float = 300.0  # close surplus connections idle this long
+    DB_POOL_MAX_LIFETIME: float = 1800.0  # recycle connections after this age
+    DB_POOL_CHECK_ON_CHECKOUT: bool = False  # ping before handing out (serverless Postgres)
+    DB_PREPARED_STATEMENTS: bool = True  # disable behind poolers without prepared statement support
+    
+    # Statement timeouts per route class, in milliseconds (0 = no limit)
+    DB_STATEMENT_TIMEOUT_PUBLIC_MS: int = 2000  # public reads
+    DB_STATEMENT_TIMEOUT_ADMIN_MS: int = 10000  # admin and auth
+    DB_STATEMENT_TIMEOUT_BULK_MS: int = 300000  # export, import, bulk ops
+    
+    # Bulk blog import
+    BLOG_IMPORT_BATCH_SIZE: int = 1000  # rows per COPY transaction
+    
+    # Full-text search
+    SEARCH_MAX_CANDIDATES: int = 2000  # newest matches ranked per search
+    
+    # View counting (write-behind)
+    VIEW_COUNT_FLUSH_SECONDS: float = 10.0  # how often counted views are written
+    POPULARITY_HALF_LIFE_HOURS: float = 48.0  # a view's weight in "popular" halves this often
+    
     # Redis Cache
     REDIS_URL: str | None = None
+    REDIS_POOL_MAX_CONNECTIONS: int = 50  # per worker process
+    REDIS_POOL_TIMEOUT: float = 1.0  # seconds to wait for a free connection
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # per command; a slow cache counts as a miss
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
     CACHE_TTL: int = 300  # 5 minutes default
+    CACHE_STALE_TTL: int = 300  # serve expired entries this long while one refresh runs
+    CACHE_L1_MAX_BYTES: int = 32 * 1024 * 1024  # in-process cache per worker, 0 disables
+    CACHE_L1_TTL: float = 30.0  # max seconds an in-process entry is served
+    CACHE_CHANGE_FEED: bool = True  # evict on blog NOTIFY; needs LISTEN (not a transaction pooler)
     
     # Cloudinary
     CLOUDINARY_CLOUD_NAME: str
@@ -77,6 +115,22 @@ class Settings(BaseSettings):
     def cors_origins(self) -> List[str]:
         """Get CORS origins as a list."""
         return self._cors_origins_list
+    
+    @property
+    def database_replica_urls(self) -> List[str]:
+        """Get read replica URLs as a list."""
+        if not self.DATABASE_REPLICA_URLS:
+            return []
+        return [
+            url.strip()
+            for url in self.DATABASE_REPLICA_URLS.split(",")
+            if url.strip()
+        ]
+    
+    @property
+    def popularity_decay_rate(self) -> float:
+        """Popularity decay constant per second (ln 2 / half-life)."""
+        return math.log(2) / (self.POPULARITY_HALF_LIFE_HOURS * 3600)
 
 
 # Singleton settings instance
@@ -0,0 +1,246 @@
+"""
+Write-time content processing for blog posts.
+Content is HTML from the rich editor or the site's light Markdown dialect.
+It is rendered once per save to sanitized HTML with anchored headings, and
+the word count, read time, table of contents and fallback excerpt are
+derived from that HTML, so reads serve stored results.
+"""
+import html
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+import nh3
+from slugify import slugify
+
+# Reading speed for read_time (words per minute)
+WORDS_PER_MINUTE = 200
+
+# Longest auto-excerpt, cut at a word boundary
+EXCERPT_MAX_CHARS = 200
+
+# Sanitizer allow-lists, matching what the public site let through before
+ALLOWED_TAGS = {
+    "p", "br", "strong", "b", "em", "i", "u", "s", "h1", "h2", "h3", "h4",
+    "h5", "h6", "ul", "ol", "li", "blockquote", "pre", "code", "a", "img",
+    "iframe", "div", "span", "table", "thead", "tbody", "tr", "td", "th",
+    "hr", "figure", "figcaption",
+}
+ALLOWED_ATTRIBUTES = {
+    "*": {"class", "id", "title", "style"},
+    "a": {"href", "target"},
+    "img": {"src", "alt", "width", "height"},
+    "iframe": {"src", "width", "height", "frameborder", "allow", "allowfullscreen"},
+    "td": {"colspan", "rowspan"},
+    "th": {"colspan", "rowspan"},
+}
+ALLOWED_STYLE_PROPERTIES = {
+    "text-align", "color", "background-color", "font-weight", "font-style",
+    "text-decoration", "width", "height", "max-width",
+}
+URL_SCHEMES = {"http", "https", "mailto", "tel"}
+
+# Video embeds only; any other iframe loses its src
+EMBED_PREFIXES = (
+    "https://www.youtube.com/embed/",
+    "https://www.youtube-nocookie.com/embed/",
+    "https://player.vimeo.com/video/",
+)
+
+# Columns written from render_content(), in the order it documents
+DERIVED_COLUMNS = ("content_html", "word_count", "read_time", "toc", "auto_excerpt")
+
+# Headings listed in the table of contents
+TOC_LEVELS = "234"
+
+# Control characters (STX/ETX) ts_headline wraps matches in; ASCII so any
+# database encoding takes them. search_snippet() turns them into <mark>
+# tags after escaping everything else.
+SNIPPET_START = "\x02"
+SNIPPET_STOP = "\x03"
+
+# Same detection the public site used: these tags mean rich-editor HTML
+HTML_MARKERS = ("<p>", "<h2>", "<iframe")
+
+_HEADING = re.compile(r"<h([%s])([^>]*)>(.*?)</h\1>" % TOC_LEVELS, re.S)
+_ID_ATTRIBUTE = re.compile(r'\sid="([^"]*)"')
+_PARAGRAPH = re.compile(r"<p\b[^>]*>(.*?)</p>", re.S)
+_TAG = re.compile(r'<(?:[^>"]|"[^"]*")*>')
+_NUMBERED_ITEM = re.compile(r"(?:^|\n)\d+\.\s")
+
+_INLINE_RULES = (
+    (re.compile(r"\*\*(.*?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"\*(.*?)\*"), r"<em>\1</em>"),
+    (re.compile(r"`(.*?)`"), r"<code>\1</code>"),
+    (re.compile(r"\[(.*?)\]\((.*?)\)"), r'<a href="\2" target="_blank">\1</a>'),
+)
+
+
+def _filter_attribute(tag: str, attribute: str, value: str) -> Optional[str]:
+    """Drop iframe sources that are not a known video player."""
+    if tag == "iframe" and attribute == "src" and not value.startswith(EMBED_PREFIXES):
+        return None
+    return value
+
+
+def sanitize_html(markup: str) -> str:
+    """
+    Strip everything outside the allow-lists (scripts, handlers, unsafe URLs).
+    
+    Args:
+        markup: Untrusted HTML
+        
+    Returns:
+        Safe HTML fragment
+    """
+    return nh3.clean(
+        markup,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        attribute_filter=_filter_attribute,
+        url_schemes=URL_SCHEMES,
+        filter_style_properties=ALLOWED_STYLE_PROPERTIES,
+    )
+
+
+def _render_inline(text: str) -> str:
+    """Escape text, then apply bold, italic, code and link markup."""
+    text = html.escape(text, quote=True)
+    for pattern, replacement in _INLINE_RULES:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _render_markdown(content: str) -> str:
+    """
+    Render the site's Markdown dialect: blank-line separated blocks of
+    headings (## to ####), lists, numbered lists, quotes, code fences
+    and paragraphs.
+    """
+    blocks = []
+    for block in content.replace("\r\n", "\n").split("\n\n"):
+        if not block.strip():
+            continue
+        heading = re.match(r"(#{2,4}) (.*)", block, re.S)
+        if heading:
+            level = len(heading.group(1))
+            blocks.append(f"<h{level}>{_render_inline(heading.group(2).strip())}</h{level}>")
+        elif block.startswith("```"):
+            code = re.sub(r"^```\w*\n?", "", block)
+            code = re.sub(r"```\s*$", "", code)
+            blocks.append(f"<pre><code>{html.escape(code)}</code></pre>")
+        elif block.startswith("- ") or "\n- " in block:
+            items = [item for item in re.split(r"(?:^|\n)- ", block) if item.strip()]
+            blocks.append(
+                "<ul>" + "".join(f"<li>{_render_inline(item)}</li>" for item in items) + "</ul>"
+            )
+        elif re.match(r"\d+\.\s", block):
+            items = [item for item in _NUMBERED_ITEM.split(block) if item.strip()]
+            blocks.append(
+                "<ol>" + "".join(f"<li>{_render_inline(item)}</li>" for item in items) + "</ol>"
+            )
+        elif block.startswith("> "):
+            blocks.append(f"<blockquote>{_render_inline(block[2:])}</blockquote>")
+        else:
+            blocks.append(f"<p>{_render_inline(block)}</p>")
+    return "\n".join(blocks)
+
+
+def _plain_text(markup: str) -> str:
+    """Text of sanitized HTML, one space between elements."""
+    return " ".join(html.unescape(_TAG.sub(" ", markup)).split())
+
+
+def _anchor_headings(markup: str) -> Tuple[str, List[dict]]:
+    """
+    Give every TOC-level heading an id and collect the table of contents.
+    Existing ids are kept; generated ones are made unique.
+    
+    Returns:
+        (HTML with heading ids, list of TOC entries)
+    """
+    toc = []
+    used = set(_ID_ATTRIBUTE.findall(markup))
+    
+    def anchor(match):
+        level, attributes, inner = match.groups()
+        text = _plain_text(inner)
+        existing = _ID_ATTRIBUTE.search(attributes)
+        if existing:
+            anchor_id = existing.group(1)
+        else:
+            base = slugify(text) or "section"
+            anchor_id, suffix = base, 2
+            while anchor_id in used:
+                anchor_id, suffix = f"{base}-{suffix}", suffix + 1
+            used.add(anchor_id)
+            attributes = f' id="{anchor_id}"{attributes}'
+        if text:
+            toc.append({"level": int(level), "id": anchor_id, "text": text})
+        return f"<h{level}{attributes}>{inner}</h{level}>"
+    
+    return _HEADING.sub(anchor, markup), toc
+
+
+def _excerpt(markup: str) -> Optional[str]:
+    """Opening paragraphs (or all text) cut to EXCERPT_MAX_CHARS."""
+    paragraphs = [_plain_text(p) for p in _PARAGRAPH.findall(markup)]
+    text = " ".join(p for p in paragraphs if p) or _plain_text(markup)
+    if len(text) <= EXCERPT_MAX_CHARS:
+        return text or None
+    cut = text[:EXCERPT_MAX_CHARS + 1].rsplit(" ", 1)[0].rstrip(" ,.;:")
+    return cut + "…"
+
+
+def render_content(content: str) -> Dict[str, object]:
+    """
+    Derive every stored field that depends on a post's content.
+    
+    Args:
+        content: Raw post content (HTML or Markdown)
+        
+    Returns:
+        Dict of column values: content_html, word_count, read_time,
+        toc (JSON text) and auto_excerpt
+    """
+    if any(marker in content for marker in HTML_MARKERS):
+        markup = content
+    else:
+        markup = _render_markdown(content)
+    
+    content_html, toc = _anchor_headings(sanitize_html(markup))
+    word_count = len(_plain_text(content_html).split())
+    
+    return {
+        "content_html": content_html,
+        "word_count": word_count,
+        "read_time": max(1, round(word_count / WORDS_PER_MINUTE)),
+        "toc": json.dumps(toc),
+        "auto_excerpt": _excerpt(content_html),
+    }
+
+
+def search_snippet(headline: Optional[str]) -> Optional[str]:
+    """
+    Make a ts_headline result safe to render as HTML.
+    The headline is built from tag-stripped content_html, but entities in
+    it decode to markup again, so all text is escaped and only the
+    SNIPPET_START/SNIPPET_STOP markers become <mark> tags.
+    
+    Args:
+        headline: ts_headline output, matches between the marker characters
+        
+    Returns:
+        HTML snippet with matches wrapped in <mark></mark>, or None
+    """
+    if headline is None:
+        return None
+    marked = []
+    for part in re.split(f"([{SNIPPET_START}{SNIPPET_STOP}])", headline):
+        if part == SNIPPET_START:
+            marked.append("<mark>")
+        elif part == SNIPPET_STOP:
+            marked.append("</mark>")
+        else:
+            marked.append(html.escape(html.unescape(part), quote=False))
+    return "".join(marked)
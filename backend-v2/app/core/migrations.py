@@ -1,10 +1,15 @@
 """
 Database migrations module for PostgreSQL.
-Automatically creates required tables on application startup.
-Uses idempotent CREATE TABLE IF NOT EXISTS for safety.
+Applies versioned migrations on application startup, once per database:
+applied versions are recorded in schema_migrations and a Postgres advisory
+lock ensures only one process migrates while the others wait.
 """
+from typing import Iterator, List, Set
+
+from psycopg.errors import UndefinedTable
+
 from app.core.logging import get_logger
-from app.core.database import database
+from app.core.database import database, session_scope
 
 logger = get_logger(__name__)
 
@@ -58,9 +63,415 @@ CREATE INDEX IF NOT EXISTS idx_blogs_slug ON blogs(slug);
 CREATE INDEX IF NOT EXISTS idx_blogs_published ON blogs(published);
 CREATE INDEX IF NOT EXISTS idx_blogs_featured ON blogs(is_featured);
 CREATE INDEX IF NOT EXISTS idx_blogs_created_at ON blogs(created_at);
+CREATE INDEX IF NOT EXISTS idx_blogs_created_at_id ON blogs(created_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_blogs_category ON blogs(category);
 """
 
+# Full-text search: weighted tsvector kept current by PostgreSQL itself
+# (generated column), so every write path - including COPY - stays indexed.
+# Weights: title A, tags B, excerpt C, content D. Adding the column rewrites
+# the whole table under an ACCESS EXCLUSIVE lock. Replaced by migration 17,
+# which bounds the indexed content.
+BLOGS_SEARCH_SQL = """
+ALTER TABLE blogs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'english'::regconfig, coalesce(tags, '[]'::jsonb), '["string"]'
+        ), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(excerpt, '')), 'C') ||
+        setweight(to_tsvector('english'::regconfig, content), 'D')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_blogs_search ON blogs USING GIN (search_vector);
+"""
+
+# Tag/category browsing: GIN index for tag containment, keyset index per
+# category, and per-tag/per-category counts of published posts kept by a
+# trigger so the tag cloud never scans blogs. Counts are backfilled once.
+BLOGS_TAXONOMY_SQL = """
+CREATE INDEX IF NOT EXISTS idx_blogs_tags ON blogs USING GIN (tags jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_blogs_category_created_at_id
+    ON blogs(category, created_at DESC, id DESC);
+
+CREATE TABLE IF NOT EXISTS blog_tag_counts (
+    tag TEXT PRIMARY KEY,
+    post_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS blog_category_counts (
+    category VARCHAR(100) PRIMARY KEY,
+    post_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION update_blog_taxonomy_counts()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' AND OLD.published THEN
+        UPDATE blog_tag_counts SET post_count = post_count - 1
+        WHERE tag IN (
+            SELECT jsonb_array_elements_text(COALESCE(OLD.tags, '[]'::jsonb))
+        );
+        UPDATE blog_category_counts SET post_count = post_count - 1
+        WHERE category = OLD.category;
+    END IF;
+    
+    IF TG_OP <> 'DELETE' AND NEW.published THEN
+        INSERT INTO blog_tag_counts (tag, post_count)
+        SELECT DISTINCT tag, 1
+        FROM jsonb_array_elements_text(COALESCE(NEW.tags, '[]'::jsonb)) AS tag
+        ON CONFLICT (tag) DO UPDATE
+            SET post_count = blog_tag_counts.post_count + 1;
+        IF COALESCE(NEW.category, '') <> '' THEN
+            INSERT INTO blog_category_counts (category, post_count)
+            VALUES (NEW.category, 1)
+            ON CONFLICT (category) DO UPDATE
+                SET post_count = blog_category_counts.post_count + 1;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS blogs_taxonomy_counts_insert_delete ON blogs;
+CREATE TRIGGER blogs_taxonomy_counts_insert_delete
+    AFTER INSERT OR DELETE ON blogs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_blog_taxonomy_counts();
+
+DROP TRIGGER IF EXISTS blogs_taxonomy_counts_update ON blogs;
+CREATE TRIGGER blogs_taxonomy_counts_update
+    AFTER UPDATE OF published, tags, category ON blogs
+    FOR EACH ROW
+    WHEN (
+        OLD.published IS DISTINCT FROM NEW.published
+        OR OLD.tags IS DISTINCT FROM NEW.tags
+        OR OLD.category IS DISTINCT FROM NEW.category
+    )
+    EXECUTE FUNCTION update_blog_taxonomy_counts();
+
+INSERT INTO blog_tag_counts (tag, post_count)
+SELECT post_tags.tag, COUNT(*)
+FROM blogs b
+CROSS JOIN LATERAL (
+    SELECT DISTINCT tag
+    FROM jsonb_array_elements_text(COALESCE(b.tags, '[]'::jsonb)) AS tag
+) post_tags
+WHERE b.published = TRUE AND NOT EXISTS (SELECT 1 FROM blog_tag_counts)
+GROUP BY post_tags.tag;
+
+INSERT INTO blog_category_counts (category, post_count)
+SELECT category, COUNT(*)
+FROM blogs
+WHERE published = TRUE AND category IS NOT NULL AND category <> ''
+    AND NOT EXISTS (SELECT 1 FROM blog_category_counts)
+GROUP BY category;
+"""
+
+# Time-decayed popularity (see app/services/popularity.py). score is
+# log(sum of exp(decay * view_time)), so ordering by it ranks posts by
+# exponentially decayed views without ever rewriting old scores. Scores
+# depend on the decay rate, so they are seeded by the application
+# (sync_decay_rate) rather than here; see BLOG_POPULARITY_SEED_SQL.
+BLOG_POPULARITY_SQL = """
+CREATE TABLE IF NOT EXISTS blog_popularity (
+    blog_id INTEGER PRIMARY KEY REFERENCES blogs(id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_blog_popularity_score ON blog_popularity(score DESC);
+"""
+
+# Indexes shaped for the repository queries (checked by
+# tests/test_query_plans.py). Public reads all filter published = TRUE, so
+# they get partial indexes in their sort order; the boolean and duplicate
+# single-column indexes never served a query and only slowed writes.
+# Built and dropped CONCURRENTLY, so blogs stays writable during deploy. A
+# failed concurrent build leaves an invalid index that IF NOT EXISTS would
+# keep, so each build first drops any leftover (this only reruns after a
+# failure).
+BLOGS_QUERY_INDEXES_SQL = (
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published_created_at_id",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blogs_published_created_at_id
+        ON blogs(created_at DESC, id DESC) WHERE published = TRUE
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_featured_created_at",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blogs_featured_created_at
+        ON blogs(created_at DESC) WHERE published = TRUE AND is_featured = TRUE
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published_category_created_at_id",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blogs_published_category_created_at_id
+        ON blogs(category, created_at DESC, id DESC) WHERE published = TRUE
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_category_created_at_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_category",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_published",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_featured",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_created_at",
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_slug",
+)
+
+# Write-time derived content (see app/core/content.py). Rows saved before
+# these columns existed have content_html NULL until backfill_rendered_content
+# reaches them; the partial index finds them and is empty afterwards.
+# Backfill transactions set cms.backfill so they leave updated_at alone.
+BLOGS_DERIVED_CONTENT_SQL = """
+ALTER TABLE blogs
+    ADD COLUMN IF NOT EXISTS content_html TEXT,
+    ADD COLUMN IF NOT EXISTS word_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS toc JSONB NOT NULL DEFAULT '[]'::jsonb,
+    ADD COLUMN IF NOT EXISTS auto_excerpt TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_blogs_render_pending
+    ON blogs(id) WHERE content_html IS NULL;
+
+DROP TRIGGER IF EXISTS update_blogs_updated_at ON blogs;
+CREATE TRIGGER update_blogs_updated_at
+    BEFORE UPDATE ON blogs
+    FOR EACH ROW
+    WHEN (
+        OLD.view_count IS NOT DISTINCT FROM NEW.view_count
+        AND current_setting('cms.backfill', true) IS DISTINCT FROM 'on'
+    )
+    EXECUTE FUNCTION update_updated_at_column();
+"""
+
+# Revision history (see app/core/revisions.py), kept out of the blogs row.
+# Each save is a zlib-compressed delta against the previous revision, with
+# a full snapshot whenever the delta chain outgrows one; data is stored
+# EXTERNAL since it is already compressed.
+BLOG_REVISIONS_SQL = """
+CREATE TABLE IF NOT EXISTS blog_revisions (
+    blog_id INTEGER NOT NULL REFERENCES blogs(id) ON DELETE CASCADE,
+    revision INTEGER NOT NULL,
+    is_snapshot BOOLEAN NOT NULL,
+    data BYTEA NOT NULL,
+    fields TEXT[] NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (blog_id, revision)
+);
+
+ALTER TABLE blog_revisions ALTER COLUMN data SET STORAGE EXTERNAL;
+"""
+
+# Change feed for cache eviction (see app/services/change_feed.py). One
+# statement-level trigger per event NOTIFYs the ids and slugs it touched
+# (old and new on a rename) once the transaction commits. View count
+# flushes are skipped. Chunks are sized by BLOGS_CHANGE_FEED_CHUNKS_SQL.
+BLOGS_CHANGE_FEED_SQL = """
+CREATE OR REPLACE FUNCTION notify_blog_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changes JSONB;
+    payload TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', published))
+        INTO changes
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', published))
+        INTO changes
+        FROM old_rows;
+    ELSE
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', taxonomy))
+        INTO changes
+        FROM (
+            SELECT n.id, s.slug,
+                (o.published OR n.published)
+                AND (o.published, o.tags, o.category)
+                    IS DISTINCT FROM (n.published, n.tags, n.category) AS taxonomy
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            CROSS JOIN LATERAL (SELECT DISTINCT unnest(ARRAY[o.slug, n.slug])) AS s(slug)
+            WHERE o.view_count IS NOT DISTINCT FROM n.view_count
+        ) changed;
+    END IF;
+    
+    FOR payload IN
+        SELECT json_build_object(
+            'op', TG_OP,
+            'ids', json_agg(DISTINCT (change->>'id')::int),
+            'slugs', json_agg(DISTINCT change->>'slug'),
+            'taxonomy', bool_or((change->>'taxonomy')::boolean)
+        )::text
+        FROM (
+            SELECT change, (row_number() OVER () - 1) / 25 AS chunk
+            FROM jsonb_array_elements(changes) AS change
+        ) numbered
+        GROUP BY chunk
+    LOOP
+        PERFORM pg_notify('blog_changes', payload);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS blogs_notify_insert ON blogs;
+CREATE TRIGGER blogs_notify_insert
+    AFTER INSERT ON blogs
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_blog_changes();
+
+DROP TRIGGER IF EXISTS blogs_notify_update ON blogs;
+CREATE TRIGGER blogs_notify_update
+    AFTER UPDATE ON blogs
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_blog_changes();
+
+DROP TRIGGER IF EXISTS blogs_notify_delete ON blogs;
+CREATE TRIGGER blogs_notify_delete
+    AFTER DELETE ON blogs
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_blog_changes();
+"""
+
+# Version 13 cut notifications every 25 changes, which long slugs could
+# push past the payload limit; chunk by size instead
+BLOGS_CHANGE_FEED_CHUNKS_SQL = """
+CREATE OR REPLACE FUNCTION notify_blog_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    changes JSONB;
+    change JSONB;
+    change_bytes INTEGER;
+    chunk_bytes INTEGER := 0;
+    chunk_ids INTEGER[] := '{}';
+    chunk_slugs TEXT[] := '{}';
+    chunk_taxonomy BOOLEAN := FALSE;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', published))
+        INTO changes
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', published))
+        INTO changes
+        FROM old_rows;
+    ELSE
+        SELECT jsonb_agg(jsonb_build_object('id', id, 'slug', slug, 'taxonomy', taxonomy))
+        INTO changes
+        FROM (
+            SELECT n.id, s.slug,
+                (o.published OR n.published)
+                AND (o.published, o.tags, o.category)
+                    IS DISTINCT FROM (n.published, n.tags, n.category) AS taxonomy
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            CROSS JOIN LATERAL (SELECT DISTINCT unnest(ARRAY[o.slug, n.slug])) AS s(slug)
+            WHERE o.view_count IS NOT DISTINCT FROM n.view_count
+        ) changed;
+    END IF;
+    
+    -- Greedy chunks: each change's JSON length bounds what it adds to
+    -- the payload, so a chunk never passes NOTIFY's 8000-byte limit
+    -- (a failed pg_notify aborts the write that fired it)
+    FOR change IN SELECT value FROM jsonb_array_elements(changes) LOOP
+        change_bytes := octet_length(change::text);
+        IF chunk_bytes > 0 AND chunk_bytes + change_bytes > 7000 THEN
+            PERFORM pg_notify('blog_changes', json_build_object(
+                'op', TG_OP, 'ids', chunk_ids, 'slugs', chunk_slugs, 'taxonomy', chunk_taxonomy
+            )::text);
+            chunk_ids := '{}';
+            chunk_slugs := '{}';
+            chunk_taxonomy := FALSE;
+            chunk_bytes := 0;
+        END IF;
+        IF NOT (change->>'id')::int = ANY(chunk_ids) THEN
+            chunk_ids := chunk_ids || (change->>'id')::int;
+        END IF;
+        IF NOT change->>'slug' = ANY(chunk_slugs) THEN
+            chunk_slugs := chunk_slugs || (change->>'slug');
+        END IF;
+        chunk_taxonomy := chunk_taxonomy OR (change->>'taxonomy')::boolean;
+        chunk_bytes := chunk_bytes + change_bytes;
+    END LOOP;
+    IF chunk_bytes > 0 THEN
+        PERFORM pg_notify('blog_changes', json_build_object(
+            'op', TG_OP, 'ids', chunk_ids, 'slugs', chunk_slugs, 'taxonomy', chunk_taxonomy
+        )::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Decay rate the popularity scores were built with, kept in a one-row
+# table by sync_decay_rate() so no migration depends on settings. New posts
+# start with no views, timestamped at creation; until the application has
+# stored a rate they get no row, and its first sync seeds every post.
+BLOG_POPULARITY_SEED_SQL = """
+CREATE TABLE IF NOT EXISTS blog_popularity_settings (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    decay_rate DOUBLE PRECISION NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION seed_blog_popularity()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO blog_popularity (blog_id, score)
+    SELECT NEW.id, s.decay_rate * extract(epoch FROM NEW.created_at)
+    FROM blog_popularity_settings s
+    ON CONFLICT (blog_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS blogs_seed_popularity ON blogs;
+CREATE TRIGGER blogs_seed_popularity
+    AFTER INSERT ON blogs
+    FOR EACH ROW
+    EXECUTE FUNCTION seed_blog_popularity();
+"""
+
+# search_vector over at most the first 100k characters of content, tags
+# stripped: an unbounded tsvector fails the write once it passes
+# PostgreSQL's 1MB limit, so very large posts could not be saved. Words
+# past the cap are not searchable. Generated expressions cannot be altered
+# (before PostgreSQL 17), so the column is dropped and re-added, which
+# rewrites the whole table under an ACCESS EXCLUSIVE lock: apply it in a
+# quiet window on large tables.
+BLOGS_SEARCH_BOUNDED_SQL = """
+ALTER TABLE blogs DROP COLUMN IF EXISTS search_vector;
+
+ALTER TABLE blogs ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(jsonb_to_tsvector(
+            'english'::regconfig, coalesce(tags, '[]'::jsonb), '["string"]'
+        ), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(excerpt, '')), 'C') ||
+        setweight(to_tsvector(
+            'english'::regconfig,
+            left(regexp_replace(content, '<[^>]*>', ' ', 'g'), 100000)
+        ), 'D')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_blogs_search ON blogs USING GIN (search_vector);
+"""
+
+# Admin dashboard status filters (see PAGE_STATEMENTS in the blog
+# repository); drafts and featured posts are few, so both stay small.
+# Built CONCURRENTLY like migration 10.
+BLOGS_ADMIN_INDEXES_SQL = (
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_draft_created_at_id",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blogs_draft_created_at_id
+        ON blogs(created_at DESC, id DESC) WHERE published = FALSE
+    """,
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_blogs_featured_created_at_id",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_blogs_featured_created_at_id
+        ON blogs(created_at DESC, id DESC) WHERE is_featured = TRUE
+    """,
+)
+
 # PostgreSQL-compatible SQL for users table
 USERS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS users (
@@ -105,11 +516,13 @@ $$ language 'plpgsql';
 """
 
 # Triggers for auto-updating updated_at
+# (view count flushes are not edits and leave updated_at alone)
 BLOGS_TRIGGER = """
 DROP TRIGGER IF EXISTS update_blogs_updated_at ON blogs;
 CREATE TRIGGER update_blogs_updated_at
     BEFORE UPDATE ON blogs
     FOR EACH ROW
+    WHEN (OLD.view_count IS NOT DISTINCT FROM NEW.view_count)
     EXECUTE FUNCTION update_updated_at_column();
 """
 
@@ -122,52 +535,180 @@ CREATE TRIGGER update_users_updated_at
 """
 
 # All migration scripts in order
+# Applied in version order, each once, recorded in schema_migrations.
+# Never edit or renumber an applied migration; append a new version.
+# Versions 1-9 are the original idempotent schema, so databases created
+# before versioning adopt them safely on first run.
+# (version, name, SQL). A SQL string runs in one transaction with its
+# schema_migrations row; a tuple of statements runs one statement at a
+# time outside a transaction (CONCURRENTLY index builds cannot run inside
+# one), and the version is recorded once all of them succeeded.
 MIGRATIONS = [
-    ("blogs", BLOGS_TABLE_SQL),
-    ("users", USERS_TABLE_SQL),
-    ("categories", CATEGORIES_TABLE_SQL),
-    ("update_function", UPDATE_TIMESTAMP_FUNCTION),
-    ("blogs_trigger", BLOGS_TRIGGER),
-    ("users_trigger", USERS_TRIGGER),
+    (1, "blogs", BLOGS_TABLE_SQL),
+    (2, "blogs_search", BLOGS_SEARCH_SQL),
+    (3, "blogs_taxonomy", BLOGS_TAXONOMY_SQL),
+    (4, "blog_popularity", BLOG_POPULARITY_SQL),
+    (5, "users", USERS_TABLE_SQL),
+    (6, "categories", CATEGORIES_TABLE_SQL),
+    (7, "update_function", UPDATE_TIMESTAMP_FUNCTION),
+    (8, "blogs_trigger", BLOGS_TRIGGER),
+    (9, "users_trigger", USERS_TRIGGER),
+    (10, "blogs_query_indexes", BLOGS_QUERY_INDEXES_SQL),
+    (11, "blogs_derived_content", BLOGS_DERIVED_CONTENT_SQL),
+    (12, "blog_revisions", BLOG_REVISIONS_SQL),
+    (13, "blogs_change_feed", BLOGS_CHANGE_FEED_SQL),
+    (14, "blogs_change_feed_chunks", BLOGS_CHANGE_FEED_CHUNKS_SQL),
+    (15, "blog_popularity_seed", BLOG_POPULARITY_SEED_SQL),
+    (16, "blogs_admin_indexes", BLOGS_ADMIN_INDEXES_SQL),
+    (17, "blogs_search_bounded", BLOGS_SEARCH_BOUNDED_SQL),
 ]
 
+SCHEMA_MIGRATIONS_SQL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+"""
 
-def run_migrations() -> bool:
+# Session-level advisory lock held by the one process applying migrations
+# (arbitrary constant, unique to this application)
+MIGRATION_LOCK_ID = 7_215_640_901
+
+
+def schema_statements(transactional: bool = True) -> Iterator[str]:
     """
-    Run all database migrations.
-    Creates tables if they don't exist.
-    Safe to run multiple times (idempotent).
+    Every migration's SQL in order, for building a scratch schema (tests).
     
-    Returns:
-        True if all migrations succeeded, False otherwise
+    Args:
+        transactional: Drop CONCURRENTLY, so the whole schema can be
+            built, and rolled back, in one transaction
+            
+    Yields:
+        SQL to execute
     """
-    logger.info("Starting PostgreSQL database migrations...")
+    for _, _, sql in MIGRATIONS:
+        if isinstance(sql, str):
+            yield sql
+            continue
+        for statement in sql:
+            yield statement.replace(" CONCURRENTLY", "") if transactional else statement
+
+
+async def _applied_versions(conn) -> Set[int]:
+    """
+    Read applied migration versions (empty before the first run).
     
+    Args:
+        conn: Database connection; its transaction is ended
+        
+    Returns:
+        Set of applied versions
+    """
+    cursor = conn.cursor()
     try:
-        conn = database.get_connection()
-        cursor = conn.cursor()
+        await cursor.execute("SELECT version FROM schema_migrations")
+        return {row["version"] for row in await cursor.fetchall()}
+    except UndefinedTable:
+        return set()
+    finally:
+        await conn.rollback()
+        await cursor.close()
+
+
+async def _apply_pending(conn) -> bool:
+    """
+    Apply pending migrations; the caller holds the migration lock.
+    Each migration commits together with its schema_migrations row, or
+    for statement tuples, records it once every statement committed.
+    
+    Args:
+        conn: Database connection
         
-        for name, sql in MIGRATIONS:
+    Returns:
+        True if all pending migrations succeeded, False otherwise
+    """
+    cursor = conn.cursor()
+    await cursor.execute(SCHEMA_MIGRATIONS_SQL)
+    await conn.commit()
+    
+    # Re-read under the lock: another process may have just finished
+    applied = await _applied_versions(conn)
+    try:
+        for version, name, sql in MIGRATIONS:
+            if version in applied:
+                continue
             try:
-                cursor.execute(sql)
-                conn.commit()
-                logger.info(f"Migration completed: {name}")
+                if isinstance(sql, str):
+                    await cursor.execute(sql)
+                else:
+                    await conn.set_autocommit(True)
+                    try:
+                        for statement in sql:
+                            await cursor.execute(statement)
+                    finally:
+                        await conn.set_autocommit(False)
+                await cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (version, name)
+                )
+                await conn.commit()
+                logger.info(f"Migration {version} completed: {name}")
             except Exception as e:
-                conn.rollback()
-                logger.error(f"Migration failed for {name}: {e}")
+                await conn.rollback()
+                logger.error(f"Migration {version} failed for {name}: {e}")
+                return False
+        return True
+    finally:
+        await cursor.close()
+
+
+async def run_migrations() -> bool:
+    """
+    Apply pending database migrations.
+    When the schema is current this is a single SELECT and takes no locks;
+    otherwise one process applies the pending versions under an advisory
+    lock while the others wait, then find nothing left to do.
+    
+    Returns:
+        True if the schema is up to date, False otherwise
+    """
+    try:
+        conn = await database.get_connection()
+    except Exception as e:
+        logger.error(f"Migration error: {e}", exc_info=True)
+        return False
+    
+    try:
+        applied = await _applied_versions(conn)
+        pending = [version for version, _, _ in MIGRATIONS if version not in applied]
+        if not pending:
+            logger.info(f"Database schema up to date (version {max(applied)})")
+            return True
+        
+        logger.info(f"Applying database migrations {pending}...")
+        async with conn.cursor() as cursor:
+            await cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        await conn.commit()
+        try:
+            if not await _apply_pending(conn):
                 return False
+        finally:
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+            await conn.commit()
         
-        cursor.close()
-        database.return_connection(conn)
         logger.info("All database migrations completed successfully")
         return True
-        
+    
     except Exception as e:
         logger.error(f"Migration error: {e}", exc_info=True)
         return False
+    finally:
+        await database.return_connection(conn)
 
 
-def create_default_admin(email: str, password: str) -> bool:
+async def create_default_admin(email: str, password: str) -> bool:
     """
     Create default admin user if no users exist.
     
@@ -181,34 +722,107 @@ def create_default_admin(email: str, password: str) -> bool:
     from app.core.security import security_service
     
     try:
-        conn = database.get_connection()
+        conn = await database.get_connection()
         cursor = conn.cursor()
         
         # Check if any users exist
-        cursor.execute("SELECT COUNT(*) as count FROM users")
-        result = cursor.fetchone()
+        await cursor.execute("SELECT COUNT(*) as count FROM users")
+        result = await cursor.fetchone()
         
-        if result and result[0] > 0:
+        if result and result["count"] > 0:
             logger.info("Users already exist, skipping default admin creation")
-            cursor.close()
-            database.return_connection(conn)
+            await cursor.close()
+            await conn.rollback()
+            await database.return_connection(conn)
             return True
         
         # Create default admin
         password_hash = security_service.hash_password(password)
-        cursor.execute(
+        await cursor.execute(
             """
             INSERT INTO users (email, password_hash, name, role, is_active)
             VALUES (%s, %s, %s, %s, %s)
             """,
             (email, password_hash, "Admin", "admin", True)
         )
-        conn.commit()
-        cursor.close()
-        database.return_connection(conn)
+        await conn.commit()
+        await cursor.close()
+        await database.return_connection(conn)
         logger.info(f"Default admin user created: {email}")
         return True
-        
+    
     except Exception as e:
         logger.error(f"Failed to create default admin: {e}")
         return False
+
+
+# Posts rendered per backfill transaction
+BACKFILL_BATCH_SIZE = 200
+
+BACKFILL_PENDING_SQL = """
+SELECT id, content, updated_at FROM blogs
+WHERE content_html IS NULL AND id > %s
+ORDER BY id
+LIMIT %s
+"""
+
+# Skips rows saved (and so rendered) since they were read
+BACKFILL_UPDATE_SQL = """
+UPDATE blogs AS b
+SET content_html = v.content_html, word_count = v.word_count,
+    read_time = v.read_time, toc = v.toc, auto_excerpt = v.auto_excerpt
+FROM unnest(
+    %s::int[], %s::timestamptz[], %s::text[], %s::int[], %s::int[], %s::jsonb[], %s::text[]
+) AS v(id, updated_at, content_html, word_count, read_time, toc, auto_excerpt)
+WHERE b.id = v.id
+    AND b.content_html IS NULL
+    AND b.updated_at IS NOT DISTINCT FROM v.updated_at
+"""
+
+
+async def backfill_rendered_content() -> int:
+    """
+    Render derived content for posts saved before it was stored.
+    Each batch is read without locks and rendered in a worker thread, then
+    written only to rows nobody saved meanwhile, so startup and writers
+    never wait on rendering. Workers starting together may render the
+    same batch; the conditional update makes that harmless. With nothing
+    pending it is one probe of an empty index.
+    
+    Returns:
+        Number of posts rendered
+    """
+    from fastapi.concurrency import run_in_threadpool
+    
+    from app.core.content import DERIVED_COLUMNS, render_content
+    
+    def render(rows: List[dict]) -> List[dict]:
+        return [render_content(row["content"]) for row in rows]
+    
+    rendered = 0
+    last_id = 0
+    try:
+        while True:
+            async with session_scope(database) as session:
+                await session.execute(BACKFILL_PENDING_SQL, (last_id, BACKFILL_BATCH_SIZE))
+                rows = await session.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            
+            derived = await run_in_threadpool(render, rows)
+            async with session_scope(database) as session:
+                await session.execute("SET LOCAL cms.backfill = 'on'")
+                await session.execute(BACKFILL_UPDATE_SQL, (
+                    [row["id"] for row in rows],
+                    [row["updated_at"] for row in rows],
+                    *([fields[column] for fields in derived] for column in DERIVED_COLUMNS)
+                ))
+                rendered += session.rowcount
+    except Exception as e:
+        logger.error(f"Content backfill stopped after {rendered} posts: {e}")
+        return rendered
+    
+    if rendered:
+        logger.info(f"Rendered derived content for {rendered} existing posts")
+    return rendered
@@ -0,0 +1,103 @@
+"""
+Keyset pagination helpers.
+Cursors are opaque URL-safe tokens encoding the sort key of the last row
+on a page - (created_at, id) for listings, (rank, id) for search - so
+every page costs the same index seek.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+
+def _encode(values: list) -> str:
+    """Pack a JSON-serialisable sort key into a URL-safe token."""
+    payload = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    """Unpack a token produced by _encode."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a keyset position as an opaque cursor.
+    
+    Args:
+        created_at: Sort timestamp of the last row on the page
+        row_id: ID of the last row on the page (tie-breaker)
+        
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([created_at.isoformat(), row_id])
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Decode an opaque cursor back into a keyset position.
+    
+    Args:
+        cursor: Cursor from a previous page, or None for the first page
+        
+    Returns:
+        (created_at, id) tuple, or None for the first page
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    
+    try:
+        created_at, row_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        ) from e
+
+
+def encode_rank_cursor(rank: float, row_id: int) -> str:
+    """
+    Encode a search result position as an opaque cursor.
+    
+    Args:
+        rank: Relevance score of the last row on the page
+        row_id: ID of the last row on the page (tie-breaker)
+        
+    Returns:
+        URL-safe cursor string
+    """
+    return _encode([rank, row_id])
+
+
+def decode_rank_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """
+    Decode a search cursor back into a (rank, id) position.
+    
+    Args:
+        cursor: Cursor from a previous page, or None for the first page
+        
+    Returns:
+        (rank, id) tuple, or None for the first page
+        
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    
+    try:
+        rank, row_id = _decode(cursor)
+        return float(rank), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        ) from e
@@ -0,0 +1,149 @@
+"""
+Revision encoding for blog history.
+A revision is the post's editable fields. Each save is stored as a delta
+against the previous revision: changed short fields are stored whole and
+content is diffed as a token sequence, so a delta grows with the edit
+rather than the post. Deltas and snapshots are zlib-compressed JSON.
+"""
+import difflib
+import json
+import re
+import zlib
+from typing import Dict, List, Optional
+
+# Fields tracked per revision; publish and feature state are not content
+# and are left alone by restores
+REVISION_FIELDS = (
+    "title", "content", "excerpt", "slug", "category", "tags",
+    "featured_image_url", "author_name", "author_bio", "author_avatar_url",
+    "author_twitter", "author_linkedin", "author_facebook",
+    "author_instagram", "author_github", "author_website",
+    "cta_text", "cta_url", "cta_style", "cta_position",
+)
+
+# Fields diffed token by token instead of stored whole when changed
+PATCHED_FIELDS = ("content",)
+
+COMPRESSION_LEVEL = 6
+
+# Tokens end at a newline or a tag's closing ">", so edits to rich-editor
+# HTML (often a single line) touch only the paragraphs that changed
+_TOKEN_END = re.compile(r"(?<=[\n>])")
+
+Revision = Dict[str, object]
+
+
+def revision_state(blog: dict) -> Revision:
+    """
+    Tracked fields of a blog row or schema dump.
+    
+    Args:
+        blog: Blog dict with at least REVISION_FIELDS
+        
+    Returns:
+        Revision state
+    """
+    return {field: blog.get(field) for field in REVISION_FIELDS}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into diff tokens; joining them gives the text back."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_END.split(text) if token]
+
+
+def changed_fields(old: Revision, new: Revision) -> List[str]:
+    """Tracked fields whose values differ between two revisions."""
+    return [field for field in REVISION_FIELDS if old.get(field) != new.get(field)]
+
+
+def _compress(value) -> bytes:
+    """Compact JSON, zlib-compressed."""
+    text = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _decompress(data: bytes):
+    """Inverse of _compress."""
+    return json.loads(zlib.decompress(data))
+
+
+def _patch(old: List[str], new: List[str]) -> list:
+    """Edit script turning token list old into new: [start, end, tokens]."""
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    return [
+        [i1, i2, new[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def _apply_patch(old: List[str], ops: list) -> str:
+    """Apply an edit script from _patch."""
+    parts, position = [], 0
+    for start, end, tokens in ops:
+        parts.extend(old[position:start])
+        parts.extend(tokens)
+        position = end
+    parts.extend(old[position:])
+    return "".join(parts)
+
+
+def encode_snapshot(state: Revision) -> bytes:
+    """Compress a full revision."""
+    return _compress(state)
+
+
+def encode_delta(old: Revision, new: Revision) -> bytes:
+    """
+    Compress the changes from one revision to the next.
+    
+    Args:
+        old: Previous revision
+        new: Revision being saved
+        
+    Returns:
+        Compressed delta for apply_delta()
+    """
+    values, patches = {}, {}
+    for field in changed_fields(old, new):
+        if field in PATCHED_FIELDS and old.get(field) and new.get(field):
+            patches[field] = _patch(tokenize(old[field]), tokenize(new[field]))
+        else:
+            values[field] = new.get(field)
+    return _compress({"set": values, "patch": patches})
+
+
+def decode_snapshot(data: bytes) -> Revision:
+    """Decompress a snapshot from encode_snapshot()."""
+    return revision_state(_decompress(data))
+
+
+def apply_delta(state: Revision, data: bytes) -> Revision:
+    """
+    Rebuild a revision from its predecessor and its stored delta.
+    
+    Args:
+        state: Previous revision
+        data: Delta from encode_delta()
+        
+    Returns:
+        The next revision
+    """
+    delta = _decompress(data)
+    state = {**state, **delta["set"]}
+    for field, ops in delta["patch"].items():
+        state[field] = _apply_patch(tokenize(state[field]), ops)
+    return state
+
+
+def unified_diff(old: Optional[str], new: Optional[str], field: str) -> str:
+    """Readable token-per-line unified diff of one text field."""
+    return "\n".join(difflib.unified_diff(
+        [token.rstrip("\n") for token in tokenize(old)],
+        [token.rstrip("\n") for token in tokenize(new)],
+        fromfile=f"{field} (before)",
+        tofile=f"{field} (after)",
+        lineterm=""
+    ))
@@ -2,6 +2,8 @@
 FastAPI application entry point.
 Clean, minimal main file - all logic is in modules.
 """
+import asyncio
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -9,9 +11,15 @@ from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
-from app.core.database import database
+from app.core.database import (
+    database, db_router, PoolBusyError, QueryTimeoutError, ClientDisconnectedError
+)
 from app.core.cache import cache_service
 from app.middleware.rate_limit import limiter
+from app.middleware.read_your_writes import read_your_writes
+from app.services.popularity import sync_decay_rate
+from app.services.view_counter import view_counter
+from app.services.change_feed import change_feed
 from app.schemas.responses import HealthCheckResponse, ErrorResponse
 
 # API route imports
@@ -42,6 +50,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Pin public reads to the primary right after admin writes
+app.middleware("http")(read_your_writes)
+
 
 # Include routers
 app.include_router(auth.router)
@@ -56,14 +67,15 @@ async def health_check():
     Health check endpoint for monitoring.
     Checks database and cache connectivity.
     """
-    db_healthy = database.health_check()
+    db_healthy = await database.health_check()
     cache_healthy = cache_service._available
     
     return HealthCheckResponse(
         status="healthy" if db_healthy else "unhealthy",
         version=settings.APP_VERSION,
         database=db_healthy,
-        cache=cache_healthy
+        cache=cache_healthy,
+        database_pool=db_router.stats()
     )
 
 
@@ -82,6 +94,49 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# Database pool exhausted handler
+@app.exception_handler(PoolBusyError)
+async def pool_busy_handler(request: Request, exc: PoolBusyError):
+    """Shed load with a retryable 503 instead of a 500."""
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "1"},
+        content=ErrorResponse(
+            error="Service unavailable",
+            detail="The server is busy. Please try again shortly."
+        ).model_dump()
+    )
+
+
+# Statement timeout handler
+@app.exception_handler(QueryTimeoutError)
+async def query_timeout_handler(request: Request, exc: QueryTimeoutError):
+    """A query ran past the route's statement timeout."""
+    logger.warning(f"Statement timeout on {request.method} {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": "5"},
+        content=ErrorResponse(
+            error="Service unavailable",
+            detail="The request took too long. Please try again shortly."
+        ).model_dump()
+    )
+
+
+# Client went away while its queries ran
+@app.exception_handler(ClientDisconnectedError)
+async def client_disconnected_handler(request: Request, exc: ClientDisconnectedError):
+    """Nobody is listening; answer with nginx's 499 for the access log."""
+    logger.info(f"Client disconnected, cancelled queries for {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=499,
+        content=ErrorResponse(
+            error="Client closed request",
+            detail="The client disconnected before the response was ready."
+        ).model_dump()
+    )
+
+
 # Rate limit exception handler
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
@@ -103,14 +158,30 @@ async def startup():
     logger.info(f"Environment: {'Development' if settings.DEBUG else 'Production'}")
     logger.info(f"CORS origins: {settings.cors_origins}")
     
-    # Run database migrations
-    from app.core.migrations import run_migrations, create_default_admin
-    if not run_migrations():
+    # Open the database pools and run migrations
+    await db_router.open()
+    await cache_service.connect()
+    from app.core.migrations import (
+        run_migrations, create_default_admin, backfill_rendered_content
+    )
+    if not await run_migrations():
         logger.warning("Database migrations failed - some features may not work")
     
+    # Popularity scores follow POPULARITY_HALF_LIFE_HOURS
+    await sync_decay_rate()
+    
     # Create default admin if configured and no users exist
     if settings.ADMIN_EMAIL and settings.ADMIN_PASSWORD:
-        create_default_admin(settings.ADMIN_EMAIL, settings.ADMIN_PASSWORD)
+        await create_default_admin(settings.ADMIN_EMAIL, settings.ADMIN_PASSWORD)
+    
+    # Render posts saved before derived content existed, off the startup path
+    app.state.content_backfill = asyncio.create_task(backfill_rendered_content())
+    
+    # Write-behind view counting
+    view_counter.start()
+    
+    # Evict cache entries for posts changed anywhere (other workers, SQL)
+    change_feed.start()
 
 
 # Shutdown event
@@ -118,6 +189,11 @@ async def startup():
 async def shutdown():
     """Cleanup on shutdown."""
     logger.info("Shutting down application")
+    app.state.content_backfill.cancel()
+    await change_feed.stop()
+    await view_counter.stop()
+    await db_router.close()
+    await cache_service.close()
 
 
 # Root endpoint
@@ -0,0 +1,26 @@
+"""
+Read-your-writes middleware for read replica routing.
+After a successful admin write, pins this process's public reads to the
+primary for a short window so editors see their own changes. Other
+processes are pinned by the blog change feed when the write commits.
+"""
+from fastapi import Request
+
+from app.core.database import db_router
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+async def read_your_writes(request: Request, call_next):
+    """Mark successful admin writes."""
+    response = await call_next(request)
+    
+    if (
+        db_router.has_replicas
+        and request.method in WRITE_METHODS
+        and request.url.path.startswith("/api/admin")
+        and response.status_code < 400
+    ):
+        db_router.mark_write()
+    
+    return response
@@ -3,15 +3,443 @@ Blog repository - handles all database operations for blogs.
 Implements the Repository pattern to separate data access from business logic.
 PostgreSQL compatible.
 """
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import json
 from datetime import datetime
 
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.content import DERIVED_COLUMNS, SNIPPET_START, SNIPPET_STOP, render_content
 from app.core.logging import get_logger
-from app.schemas.blog import BlogCreate, BlogUpdate
+from app.repositories.statements import statements
+from app.schemas.blog import BlogCreate, BlogUpdate, BlogListItem, BlogImportRow
 
 logger = get_logger(__name__)
 
+# Slugs tried per create: the requested one plus timestamped fallbacks.
+SLUG_ATTEMPTS = 5
+
+# Columns written by bulk import, in COPY order.
+IMPORT_COLUMNS = (
+    "title", "content", "excerpt", "slug", "category", "tags",
+    "featured_image_url", "author_name", "author_bio", "author_avatar_url",
+    "author_twitter", "author_linkedin", "author_facebook",
+    "author_instagram", "author_github", "author_website",
+    "cta_text", "cta_url", "cta_style", "cta_position",
+    "published", "is_featured", "created_at", *DERIVED_COLUMNS,
+)
+_IMPORT_COLUMN_LIST = ", ".join(IMPORT_COLUMNS)
+_IMPORT_SELECT_LIST = ", ".join(
+    "COALESCE(created_at, CURRENT_TIMESTAMP)" if c == "created_at" else c
+    for c in IMPORT_COLUMNS
+)
+
+# Flush streamed NDJSON export output in chunks of about this many bytes.
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Every stored column except search_vector and the derived content columns
+# (content_html, word_count, toc, auto_excerpt), which writes rebuild
+BLOG_COLUMNS = (
+    "id", "title", "slug", "content", "excerpt", "category", "tags",
+    "featured_image_url", "author_name", "author_bio", "author_avatar_url",
+    "author_twitter", "author_linkedin", "author_facebook",
+    "author_instagram", "author_github", "author_website",
+    "cta_text", "cta_url", "cta_style", "cta_position",
+    "published", "is_featured", "read_time", "view_count",
+    "created_at", "updated_at",
+)
+
+_EXPORT_COLUMN_LIST = ", ".join(BLOG_COLUMNS)
+
+# Authored columns plus the derived content BlogPublic serves
+FULL_COLUMNS = (*BLOG_COLUMNS, "content_html", "word_count", "toc")
+
+# Public reads fall back to the derived excerpt when the author left none
+PUBLIC_EXCERPT = "COALESCE(NULLIF(excerpt, ''), auto_excerpt) AS excerpt"
+
+
+def _public_column_list(columns) -> str:
+    """Join columns for a public read, swapping in PUBLIC_EXCERPT."""
+    return ", ".join(PUBLIC_EXCERPT if column == "excerpt" else column for column in columns)
+
+
+# Column projections: each read method selects only what its target
+# schema renders. "list" never touches content (no TOAST detoasting).
+PROJECTIONS = {
+    "full": ", ".join(FULL_COLUMNS),
+    "list": _public_column_list(BlogListItem.model_fields),
+}
+
+# ts_headline settings for search snippets. Matches are wrapped in marker
+# characters, not tags, so search_snippet() can escape the text around them.
+SEARCH_HEADLINE_OPTIONS = (
+    f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, "
+    "MaxFragments=2, MaxWords=30, MinWords=10"
+)
+
+
+def _register_projected(name: str, sql: str) -> Dict[str, str]:
+    """
+    Register one prepared statement per projection.
+    
+    Args:
+        name: Base statement name
+        sql: SQL text with a {columns} placeholder
+        
+    Returns:
+        Dict mapping projection name to statement name
+    """
+    return {
+        projection: statements.register(
+            f"{name}.{projection}",
+            sql.format(columns=columns)
+        )
+        for projection, columns in PROJECTIONS.items()
+    }
+
+
+# Hot read paths - executed as prepared statements
+GET_BY_SLUG = statements.register(
+    "blog.get_by_slug",
+    f"SELECT {_public_column_list(FULL_COLUMNS)} FROM blogs "
+    "WHERE slug = %s AND published = TRUE"
+)
+# Keyset pages ordered by (created_at, id) - backed by idx_blogs_created_at_id,
+# or idx_blogs_published_created_at_id for the published variants
+GET_PAGE_FIRST = _register_projected(
+    "blog.get_page_first",
+    "SELECT {columns} FROM blogs ORDER BY created_at DESC, id DESC LIMIT %s"
+)
+GET_PAGE_AFTER = _register_projected(
+    "blog.get_page_after",
+    """
+    SELECT {columns} FROM blogs
+    WHERE (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_PUBLISHED_PAGE_FIRST = _register_projected(
+    "blog.get_published_page_first",
+    """
+    SELECT {columns} FROM blogs
+    WHERE published = TRUE
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_PUBLISHED_PAGE_AFTER = _register_projected(
+    "blog.get_published_page_after",
+    """
+    SELECT {columns} FROM blogs
+    WHERE published = TRUE AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+# Admin dashboard filters, on the small idx_blogs_draft_created_at_id and
+# idx_blogs_featured_created_at_id partial indexes
+GET_DRAFT_PAGE_FIRST = _register_projected(
+    "blog.get_draft_page_first",
+    """
+    SELECT {columns} FROM blogs
+    WHERE published = FALSE
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_DRAFT_PAGE_AFTER = _register_projected(
+    "blog.get_draft_page_after",
+    """
+    SELECT {columns} FROM blogs
+    WHERE published = FALSE AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_FEATURED_PAGE_FIRST = _register_projected(
+    "blog.get_featured_page_first",
+    """
+    SELECT {columns} FROM blogs
+    WHERE is_featured = TRUE
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_FEATURED_PAGE_AFTER = _register_projected(
+    "blog.get_featured_page_after",
+    """
+    SELECT {columns} FROM blogs
+    WHERE is_featured = TRUE AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+
+# Keyset page statements per status filter: (first page, later pages)
+PAGE_STATEMENTS = {
+    None: (GET_PAGE_FIRST, GET_PAGE_AFTER),
+    "published": (GET_PUBLISHED_PAGE_FIRST, GET_PUBLISHED_PAGE_AFTER),
+    "draft": (GET_DRAFT_PAGE_FIRST, GET_DRAFT_PAGE_AFTER),
+    "featured": (GET_FEATURED_PAGE_FIRST, GET_FEATURED_PAGE_AFTER),
+}
+
+# Full-text search, keyset-paginated on (rank, id). Only the newest
+# SEARCH_MAX_CANDIDATES matches are ranked, which bounds the cost of very
+# common terms. rank is float8 so it survives the cursor round trip, and
+# snippets are only built for the rows on the page, from the plain text of
+# the sanitized HTML (raw content may hold markup the sanitizer removes).
+_SEARCH_SQL = """
+    WITH matches AS (
+        SELECT id, search_vector FROM blogs
+        WHERE search_vector @@ websearch_to_tsquery('english', %(query)s){published}
+        ORDER BY created_at DESC, id DESC
+        LIMIT %(candidates)s
+    ),
+    ranked AS (
+        SELECT id, ts_rank(
+            search_vector, websearch_to_tsquery('english', %(query)s)
+        )::float8 AS rank
+        FROM matches
+    ),
+    page AS (
+        SELECT id, rank FROM ranked{after}
+        ORDER BY rank DESC, id DESC
+        LIMIT %(limit)s
+    )
+    SELECT {columns}, page.rank, ts_headline(
+        'english',
+        translate(
+            regexp_replace(COALESCE(b.content_html, b.content), '<[^>]*>', ' ', 'g'),
+            '{markers}', ''
+        ),
+        websearch_to_tsquery('english', %(query)s),
+        '{headline}'
+    ) AS snippet
+    FROM page JOIN blogs b USING (id)
+    ORDER BY page.rank DESC, page.id DESC
+"""
+# Not prepared: the planner needs the actual query terms to choose between
+# the GIN index (rare terms) and a created_at scan (common terms).
+SEARCH_SQL = {
+    (published_only, paged): _SEARCH_SQL.format(
+        columns=PROJECTIONS["list"],
+        published=" AND published = TRUE" if published_only else "",
+        after="\n        WHERE (rank, id) < (%(rank)s, %(id)s)" if paged else "",
+        markers=SNIPPET_START + SNIPPET_STOP,
+        headline=SEARCH_HEADLINE_OPTIONS
+    )
+    for published_only in (False, True)
+    for paged in (False, True)
+}
+
+# Published posts by tag (idx_blogs_tags) or category
+# (idx_blogs_published_category_created_at_id), keyset-paginated like the archive
+GET_TAG_PAGE_FIRST = statements.register(
+    "blog.get_tag_page_first",
+    f"""
+    SELECT {PROJECTIONS['list']} FROM blogs
+    WHERE published = TRUE AND tags @> %s::jsonb
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_TAG_PAGE_AFTER = statements.register(
+    "blog.get_tag_page_after",
+    f"""
+    SELECT {PROJECTIONS['list']} FROM blogs
+    WHERE published = TRUE AND tags @> %s::jsonb AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_CATEGORY_PAGE_FIRST = statements.register(
+    "blog.get_category_page_first",
+    f"""
+    SELECT {PROJECTIONS['list']} FROM blogs
+    WHERE published = TRUE AND category = %s
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+GET_CATEGORY_PAGE_AFTER = statements.register(
+    "blog.get_category_page_after",
+    f"""
+    SELECT {PROJECTIONS['list']} FROM blogs
+    WHERE published = TRUE AND category = %s AND (created_at, id) < (%s, %s)
+    ORDER BY created_at DESC, id DESC
+    LIMIT %s
+    """
+)
+
+# Trigger-maintained counts (see BLOGS_TAXONOMY_SQL) - no scan of blogs
+GET_TAG_COUNTS = statements.register(
+    "blog.get_tag_counts",
+    """
+    SELECT tag AS name, post_count AS count
+    FROM blog_tag_counts
+    WHERE post_count > 0
+    ORDER BY post_count DESC, tag
+    LIMIT %s
+    """
+)
+GET_CATEGORY_COUNTS = statements.register(
+    "blog.get_category_counts",
+    """
+    SELECT c.id, cc.category AS name, c.slug, c.description, cc.post_count AS count
+    FROM blog_category_counts cc
+    LEFT JOIN categories c ON c.name = cc.category
+    WHERE cc.post_count > 0
+    ORDER BY cc.post_count DESC, cc.category
+    """
+)
+
+# Everything the public blog page needs in one round trip: featured,
+# latest, popular (top blog_popularity scores, see services/popularity.py)
+# and per-category post counts
+GET_PAGE_DATA = statements.register(
+    "blog.get_page_data",
+    """
+    WITH featured AS (
+        SELECT {columns} FROM blogs
+        WHERE published = TRUE AND is_featured = TRUE
+        ORDER BY created_at DESC
+        LIMIT 1
+    ),
+    latest AS (
+        SELECT {columns} FROM blogs
+        WHERE published = TRUE
+        ORDER BY created_at DESC, id DESC
+        LIMIT %s
+    ),
+    popular AS (
+        SELECT {columns}, p.score AS popularity
+        FROM blog_popularity p
+        JOIN blogs ON blogs.id = p.blog_id
+        WHERE published = TRUE
+        ORDER BY p.score DESC
+        LIMIT %s
+    ),
+    category_counts AS (
+        SELECT category AS name, post_count
+        FROM blog_category_counts
+        WHERE post_count > 0
+    )
+    SELECT
+        (SELECT row_to_json(f) FROM featured f) AS featured,
+        (
+            SELECT COALESCE(json_agg(l ORDER BY l.created_at DESC, l.id DESC), '[]')
+            FROM latest l
+        ) AS latest,
+        (
+            SELECT COALESCE(
+                json_agg(p ORDER BY p.popularity DESC), '[]'
+            )
+            FROM popular p
+        ) AS popular,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'id', c.id,
+                'name', cc.name,
+                'slug', c.slug,
+                'description', c.description,
+                'count', cc.post_count
+            ) ORDER BY cc.post_count DESC, cc.name), '[]')
+            FROM category_counts cc
+            LEFT JOIN categories c ON c.name = cc.name
+        ) AS categories
+    """.format(columns=PROJECTIONS["list"])
+)
+
+GET_BY_ID = statements.register(
+    "blog.get_by_id",
+    f"SELECT {PROJECTIONS['full']} FROM blogs WHERE id = %s"
+)
+
+# Dashboard totals in one pass over blogs (admin only, executed unprepared)
+STATS_SQL = """
+    SELECT count(*) AS total,
+        count(*) FILTER (WHERE published) AS published,
+        count(*) FILTER (WHERE is_featured) AS featured
+    FROM blogs
+"""
+
+# Admin writes, executed unprepared. Each reaches its rows through
+# blogs_pkey (checked by tests/test_query_plans.py).
+
+# The old row is read under the lock, so old_slug and was_published are
+# what this update replaced (the trigger handles updated_at). A post with
+# no history yet also returns that row as its revision baseline.
+UPDATE_SQL = """
+    UPDATE blogs b SET
+        title = %s, content = %s, excerpt = %s, slug = %s,
+        category = %s, tags = %s, featured_image_url = %s,
+        author_name = %s, author_bio = %s, author_avatar_url = %s,
+        author_twitter = %s, author_linkedin = %s,
+        author_facebook = %s, author_instagram = %s,
+        author_github = %s, author_website = %s,
+        cta_text = %s, cta_url = %s, cta_style = %s,
+        cta_position = %s, published = %s, is_featured = %s,
+        content_html = %s, word_count = %s, read_time = %s,
+        toc = %s, auto_excerpt = %s
+    FROM (
+        SELECT * FROM blogs
+        WHERE id = %s
+        FOR UPDATE
+    ) old
+    WHERE b.id = old.id
+    RETURNING b.id, b.slug, old.slug AS old_slug,
+        old.published AS was_published,
+        (b.published, b.tags, b.category)
+            IS DISTINCT FROM (old.published, old.tags, old.category)
+            AS taxonomy_changed,
+        CASE WHEN NOT EXISTS (
+            SELECT 1 FROM blog_revisions r WHERE r.blog_id = old.id
+        ) THEN to_jsonb(old) END AS baseline
+"""
+DELETE_SQL = "DELETE FROM blogs WHERE id = %s RETURNING id, slug, published"
+TOGGLE_PUBLISHED_SQL = """
+    UPDATE blogs SET published = NOT published WHERE id = %s
+    RETURNING id, slug, published
+"""
+TOGGLE_FEATURED_SQL = """
+    UPDATE blogs SET is_featured = NOT is_featured WHERE id = %s
+    RETURNING id, slug, published, is_featured
+"""
+# Rows are locked in id order so concurrent bulk updates cannot deadlock,
+# and the old status is read under the lock
+BULK_UPDATE_PUBLISHED_SQL = """
+    UPDATE blogs b SET published = %s
+    FROM (
+        SELECT id, published FROM blogs
+        WHERE id = ANY(%s::int[])
+        ORDER BY id
+        FOR UPDATE
+    ) old
+    WHERE b.id = old.id
+    RETURNING b.slug, old.published IS DISTINCT FROM b.published AS changed
+"""
+BULK_DELETE_SQL = """
+    DELETE FROM blogs WHERE id = ANY(%s::int[]) RETURNING slug, published
+"""
+
+# Export queries, streamed out by COPY in id order off blogs_pkey
+EXPORT_CSV_SQL = f"SELECT {_EXPORT_COLUMN_LIST} FROM blogs ORDER BY id"
+EXPORT_NDJSON_SQL = f"SELECT row_to_json(b) FROM ({EXPORT_CSV_SQL}) b"
+
+# Import batches are COPYed into blog_import, then moved into blogs in row
+# order; the slug conflict check uses blogs_slug_key
+IMPORT_STAGING_SQL = (
+    "CREATE TEMP TABLE blog_import ON COMMIT DROP AS "
+    f"SELECT 0 AS row_no, {_IMPORT_COLUMN_LIST} FROM blogs WITH NO DATA"
+)
+IMPORT_INSERT_SQL = (
+    f"INSERT INTO blogs ({_IMPORT_COLUMN_LIST}) "
+    f"SELECT {_IMPORT_SELECT_LIST} FROM blog_import ORDER BY row_no "
+    "ON CONFLICT (slug) DO NOTHING RETURNING slug"
+)
+
 
 class BlogRepository:
     """Repository for blog CRUD operations."""
@@ -21,7 +449,7 @@ class BlogRepository:
         Initialize repository with database cursor.
         
         Args:
-            cursor: PostgreSQL cursor from dependency injection
+            cursor: Database session (lazy cursor) from dependency injection
         """
         self.cursor = cursor
     
@@ -30,7 +458,7 @@ class BlogRepository:
         if not blog:
             return blog
         
-        # Convert RealDictRow to regular dict if needed
+        # Copy the row so callers can mutate it freely
         blog = dict(blog)
         
         # PostgreSQL JSONB returns as list/dict directly, no need to parse
@@ -44,7 +472,7 @@ class BlogRepository:
         
         return blog
     
-    def get_by_id(self, blog_id: int) -> Optional[dict]:
+    async def get_by_id(self, blog_id: int) -> Optional[dict]:
         """
         Retrieve blog by ID.
         
@@ -54,14 +482,11 @@ class BlogRepository:
         Returns:
             Blog dict or None if not found
         """
-        self.cursor.execute(
-            "SELECT * FROM blogs WHERE id = %s",
-            (blog_id,)
-        )
-        blog = self.cursor.fetchone()
+        await statements.execute(self.cursor, GET_BY_ID, (blog_id,))
+        blog = await self.cursor.fetchone()
         return self._parse_json_fields(blog) if blog else None
     
-    def get_by_slug(self, slug: str) -> Optional[dict]:
+    async def get_by_slug(self, slug: str) -> Optional[dict]:
         """
         Retrieve published blog by slug.
         
@@ -71,78 +496,214 @@ class BlogRepository:
         Returns:
             Blog dict or None if not found
         """
-        self.cursor.execute(
-            "SELECT * FROM blogs WHERE slug = %s AND published = TRUE",
-            (slug,)
-        )
-        blog = self.cursor.fetchone()
+        await statements.execute(self.cursor, GET_BY_SLUG, (slug,))
+        blog = await self.cursor.fetchone()
         return self._parse_json_fields(blog) if blog else None
     
-    def get_all(
+    async def get_page(
         self,
-        published_only: bool = False,
-        limit: Optional[int] = None
+        status: Optional[str] = None,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, int]] = None,
+        projection: str = "full"
     ) -> List[dict]:
         """
-        Retrieve all blogs with optional filtering.
+        Retrieve one keyset page, newest first.
         
         Args:
-            published_only: If True, only return published blogs
+            status: Only return "published", "draft" or "featured" blogs
+                (None for all)
             limit: Maximum number of blogs to return
+            after: (created_at, id) of the last row of the previous page
+            projection: Column set to select ("full" or "list")
             
         Returns:
             List of blog dicts
         """
-        query = "SELECT * FROM blogs"
-        params = []
+        first, later = PAGE_STATEMENTS[status]
+        if after:
+            statement = later
+            params = (*after, limit)
+        else:
+            statement = first
+            params = (limit,)
+        
+        await statements.execute(self.cursor, statement[projection], params)
+        blogs = await self.cursor.fetchall()
+        
+        return [self._parse_json_fields(blog) for blog in blogs]
+    
+    async def get_page_by_tag(
+        self,
+        tag: str,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[dict]:
+        """
+        Retrieve one keyset page of published blogs with a tag, newest first.
+        
+        Args:
+            tag: Exact tag value
+            limit: Maximum number of blogs to return
+            after: (created_at, id) of the last row of the previous page
+            
+        Returns:
+            List of list-projection blog dicts
+        """
+        tag_json = json.dumps([tag])
+        if after:
+            await statements.execute(
+                self.cursor, GET_TAG_PAGE_AFTER, (tag_json, *after, limit)
+            )
+        else:
+            await statements.execute(self.cursor, GET_TAG_PAGE_FIRST, (tag_json, limit))
+        blogs = await self.cursor.fetchall()
+        
+        return [self._parse_json_fields(blog) for blog in blogs]
+    
+    async def get_page_by_category(
+        self,
+        category: str,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, int]] = None
+    ) -> List[dict]:
+        """
+        Retrieve one keyset page of published blogs in a category, newest first.
+        
+        Args:
+            category: Category name as stored on blogs
+            limit: Maximum number of blogs to return
+            after: (created_at, id) of the last row of the previous page
+            
+        Returns:
+            List of list-projection blog dicts
+        """
+        if after:
+            await statements.execute(
+                self.cursor, GET_CATEGORY_PAGE_AFTER, (category, *after, limit)
+            )
+        else:
+            await statements.execute(
+                self.cursor, GET_CATEGORY_PAGE_FIRST, (category, limit)
+            )
+        blogs = await self.cursor.fetchall()
+        
+        return [self._parse_json_fields(blog) for blog in blogs]
+    
+    async def get_stats(self) -> dict:
+        """
+        Count blogs for the admin dashboard.
         
-        if published_only:
-            query += " WHERE published = TRUE"
+        Returns:
+            Dict with total, published and featured counts
+        """
+        await self.cursor.execute(STATS_SQL)
+        return dict(await self.cursor.fetchone())
+    
+    async def get_tag_counts(self, limit: int = 100) -> List[dict]:
+        """
+        Get published post counts per tag, most used first.
         
-        query += " ORDER BY created_at DESC"
+        Args:
+            limit: Maximum number of tags
+            
+        Returns:
+            List of dicts with name and count
+        """
+        await statements.execute(self.cursor, GET_TAG_COUNTS, (limit,))
+        return await self.cursor.fetchall()
+    
+    async def get_category_counts(self) -> List[dict]:
+        """
+        Get published post counts per category, largest first.
         
-        if limit:
-            query += " LIMIT %s"
-            params.append(limit)
+        Returns:
+            List of dicts with id, name, slug, description (from the
+            categories table when the category is registered) and count
+        """
+        await statements.execute(self.cursor, GET_CATEGORY_COUNTS)
+        return await self.cursor.fetchall()
+    
+    async def search(
+        self,
+        query: str,
+        published_only: bool = True,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None
+    ) -> List[dict]:
+        """
+        Full-text search, best match first.
         
-        self.cursor.execute(query, tuple(params) if params else None)
-        blogs = self.cursor.fetchall()
+        Args:
+            query: Web-search style query ("quoted phrases", -exclusions, or)
+            published_only: If True, only search published blogs
+            limit: Maximum number of results to return
+            after: (rank, id) of the last row of the previous page
+            
+        Returns:
+            List of list-projection blog dicts with rank and snippet
+        """
+        params = {
+            "query": query,
+            "candidates": settings.SEARCH_MAX_CANDIDATES,
+            "limit": limit,
+        }
+        if after:
+            params["rank"], params["id"] = after
+        
+        await self.cursor.execute(
+            SEARCH_SQL[(published_only, after is not None)], params, prepare=False
+        )
+        blogs = await self.cursor.fetchall()
         
         return [self._parse_json_fields(blog) for blog in blogs]
     
-    def get_featured(self) -> Optional[dict]:
+    async def get_page_data(
+        self,
+        latest_limit: int = 6,
+        popular_limit: int = 6
+    ) -> dict:
         """
-        Get the most recent featured blog.
+        Get all public blog page blocks in a single statement.
         
+        Args:
+            latest_limit: Number of latest blogs
+            popular_limit: Number of popular blogs
+            
         Returns:
-            Featured blog dict or None
-        """
-        self.cursor.execute(
-            """
-            SELECT id, title, slug, excerpt, featured_image_url,
-                   author_name, created_at, tags, category, read_time
-            FROM blogs
-            WHERE published = TRUE AND is_featured = TRUE
-            ORDER BY created_at DESC
-            LIMIT 1
-            """
+            Dict with featured (dict or None), latest, popular and categories
+        """
+        await statements.execute(
+            self.cursor,
+            GET_PAGE_DATA,
+            (latest_limit, popular_limit)
         )
-        blog = self.cursor.fetchone()
-        return self._parse_json_fields(blog) if blog else None
+        row = await self.cursor.fetchone()
+        
+        return {
+            "featured": self._parse_json_fields(row["featured"]),
+            "latest": [self._parse_json_fields(blog) for blog in row["latest"]],
+            "popular": [self._parse_json_fields(blog) for blog in row["popular"]],
+            "categories": row["categories"]
+        }
     
-    def create(self, blog_data: BlogCreate) -> int:
+    async def create(self, blog_data: BlogCreate) -> Optional[dict]:
         """
-        Create a new blog.
+        Create a new blog, resolving slug collisions in the INSERT itself.
+        
+        ON CONFLICT (slug) DO NOTHING turns a taken slug into an empty
+        RETURNING instead of an error, so the uniqueness check and the
+        write are one statement and concurrent creates cannot race.
         
         Args:
             blog_data: Blog creation data
             
         Returns:
-            ID of created blog
+            Dict with the new row's id and slug, or None if no free slug
+            was found
         """
-        # Calculate read time (avg 200 words per minute)
-        word_count = len(blog_data.content.split())
-        read_time = max(1, round(word_count / 200))
+        # Markdown and sanitizing are CPU-bound; keep them off the event loop
+        derived = await run_in_threadpool(render_content, blog_data.content)
         
         # Prepare data - PostgreSQL JSONB accepts Python lists directly
         tags_json = json.dumps(blog_data.tags)
@@ -155,16 +716,18 @@ class BlogRepository:
                 author_twitter, author_linkedin, author_facebook,
                 author_instagram, author_github, author_website,
                 cta_text, cta_url, cta_style, cta_position,
-                published, is_featured, read_time
+                published, is_featured, content_html, word_count,
+                read_time, toc, auto_excerpt
             ) VALUES (
                 %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
                 %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s
+                %s, %s, %s, %s, %s, %s, %s
             )
-            RETURNING id
+            ON CONFLICT (slug) DO NOTHING
+            RETURNING id, slug
         """
         
-        params = (
+        params = [
             blog_data.title, blog_data.content, blog_data.excerpt,
             blog_data.slug, blog_data.category, tags_json,
             blog_data.featured_image_url, blog_data.author_name,
@@ -174,14 +737,28 @@ class BlogRepository:
             blog_data.author_github, blog_data.author_website,
             blog_data.cta_text, blog_data.cta_url,
             blog_data.cta_style, blog_data.cta_position,
-            blog_data.published, blog_data.is_featured, read_time
-        )
-        
-        self.cursor.execute(query, params)
-        result = self.cursor.fetchone()
-        return result["id"] if result else 0
+            blog_data.published, blog_data.is_featured,
+            *(derived[column] for column in DERIVED_COLUMNS)
+        ]
+        
+        for slug in self._slug_candidates(blog_data.slug):
+            params[3] = slug
+            await self.cursor.execute(query, params)
+            result = await self.cursor.fetchone()
+            if result:
+                return dict(result)
+        return None
+    
+    @staticmethod
+    def _slug_candidates(slug: str):
+        """Yield the requested slug, then timestamped fallbacks."""
+        yield slug
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        yield f"{slug}-{timestamp}"
+        for attempt in range(2, SLUG_ATTEMPTS):
+            yield f"{slug}-{timestamp}-{attempt}"
     
-    def update(self, blog_id: int, blog_data: BlogUpdate) -> bool:
+    async def update(self, blog_id: int, blog_data: BlogUpdate) -> Optional[dict]:
         """
         Update an existing blog.
         
@@ -190,29 +767,15 @@ class BlogRepository:
             blog_data: Updated blog data
             
         Returns:
-            True if updated successfully
+            Dict with the updated row's id, slug, old_slug, was_published,
+            taxonomy_changed (whether published, tags or category changed)
+            and baseline (the old row if the blog had no revisions, else
+            None), or None if blog not found
         """
-        # Calculate read time
-        word_count = len(blog_data.content.split())
-        read_time = max(1, round(word_count / 200))
+        derived = await run_in_threadpool(render_content, blog_data.content)
         
         tags_json = json.dumps(blog_data.tags)
         
-        # PostgreSQL uses CURRENT_TIMESTAMP (trigger handles updated_at)
-        query = """
-            UPDATE blogs SET
-                title = %s, content = %s, excerpt = %s, slug = %s,
-                category = %s, tags = %s, featured_image_url = %s,
-                author_name = %s, author_bio = %s, author_avatar_url = %s,
-                author_twitter = %s, author_linkedin = %s,
-                author_facebook = %s, author_instagram = %s,
-                author_github = %s, author_website = %s,
-                cta_text = %s, cta_url = %s, cta_style = %s,
-                cta_position = %s, published = %s, is_featured = %s,
-                read_time = %s
-            WHERE id = %s
-        """
-        
         params = (
             blog_data.title, blog_data.content, blog_data.excerpt,
             blog_data.slug, blog_data.category, tags_json,
@@ -223,13 +786,15 @@ class BlogRepository:
             blog_data.author_github, blog_data.author_website,
             blog_data.cta_text, blog_data.cta_url,
             blog_data.cta_style, blog_data.cta_position,
-            blog_data.published, blog_data.is_featured, read_time, blog_id
+            blog_data.published, blog_data.is_featured,
+            *(derived[column] for column in DERIVED_COLUMNS), blog_id
         )
         
-        self.cursor.execute(query, params)
-        return self.cursor.rowcount > 0
+        await self.cursor.execute(UPDATE_SQL, params)
+        result = await self.cursor.fetchone()
+        return dict(result) if result else None
     
-    def delete(self, blog_id: int) -> bool:
+    async def delete(self, blog_id: int) -> Optional[dict]:
         """
         Delete a blog.
         
@@ -237,62 +802,44 @@ class BlogRepository:
             blog_id: Blog ID to delete
             
         Returns:
-            True if deleted successfully
+            Dict with the deleted row's id, slug and published, or None if
+            blog not found
         """
-        self.cursor.execute("DELETE FROM blogs WHERE id = %s", (blog_id,))
-        return self.cursor.rowcount > 0
+        await self.cursor.execute(DELETE_SQL, (blog_id,))
+        result = await self.cursor.fetchone()
+        return dict(result) if result else None
     
-    def toggle_published(self, blog_id: int) -> Optional[bool]:
+    async def toggle_published(self, blog_id: int) -> Optional[dict]:
         """
-        Toggle blog published status.
+        Toggle blog published status in a single UPDATE.
         
         Args:
             blog_id: Blog ID
             
         Returns:
-            New published status, or None if blog not found
+            Dict with id, slug and the new published value, or None if blog
+            not found
         """
-        self.cursor.execute(
-            "SELECT published FROM blogs WHERE id = %s",
-            (blog_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return None
-        
-        new_status = not result["published"]
-        self.cursor.execute(
-            "UPDATE blogs SET published = %s WHERE id = %s",
-            (new_status, blog_id)
-        )
-        return new_status
+        await self.cursor.execute(TOGGLE_PUBLISHED_SQL, (blog_id,))
+        result = await self.cursor.fetchone()
+        return dict(result) if result else None
     
-    def toggle_featured(self, blog_id: int) -> Optional[bool]:
+    async def toggle_featured(self, blog_id: int) -> Optional[dict]:
         """
-        Toggle blog featured status.
+        Toggle blog featured status in a single UPDATE.
         
         Args:
             blog_id: Blog ID
             
         Returns:
-            New featured status, or None if blog not found
+            Dict with id, slug, published and the new is_featured value, or
+            None if blog not found
         """
-        self.cursor.execute(
-            "SELECT is_featured FROM blogs WHERE id = %s",
-            (blog_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return None
-        
-        new_status = not result["is_featured"]
-        self.cursor.execute(
-            "UPDATE blogs SET is_featured = %s WHERE id = %s",
-            (new_status, blog_id)
-        )
-        return new_status
+        await self.cursor.execute(TOGGLE_FEATURED_SQL, (blog_id,))
+        result = await self.cursor.fetchone()
+        return dict(result) if result else None
     
-    def bulk_update_published(self, blog_ids: List[int], published: bool) -> int:
+    async def bulk_update_published(self, blog_ids: List[int], published: bool) -> List[dict]:
         """
         Bulk update published status.
         
@@ -301,19 +848,16 @@ class BlogRepository:
             published: New published status
             
         Returns:
-            Number of blogs updated
+            One dict per blog updated, with slug and changed (whether its
+            published status was different before)
         """
         if not blog_ids:
-            return 0
-        
-        placeholders = ','.join(['%s'] * len(blog_ids))
-        query = f"UPDATE blogs SET published = %s WHERE id IN ({placeholders})"
-        params = (published, *blog_ids)
+            return []
         
-        self.cursor.execute(query, params)
-        return self.cursor.rowcount
+        await self.cursor.execute(BULK_UPDATE_PUBLISHED_SQL, (published, blog_ids))
+        return [dict(row) for row in await self.cursor.fetchall()]
     
-    def bulk_delete(self, blog_ids: List[int]) -> int:
+    async def bulk_delete(self, blog_ids: List[int]) -> List[dict]:
         """
         Bulk delete blogs.
         
@@ -321,13 +865,90 @@ class BlogRepository:
             blog_ids: List of blog IDs
             
         Returns:
-            Number of blogs deleted
+            One dict per blog deleted, with slug and published
         """
         if not blog_ids:
-            return 0
+            return []
         
-        placeholders = ','.join(['%s'] * len(blog_ids))
-        query = f"DELETE FROM blogs WHERE id IN ({placeholders})"
+        await self.cursor.execute(BULK_DELETE_SQL, (blog_ids,))
+        return [dict(row) for row in await self.cursor.fetchall()]
+    
+    async def export_rows(self, fmt: str) -> AsyncIterator[bytes]:
+        """
+        Stream every blog out with COPY, oldest first.
+        
+        Args:
+            fmt: "csv" (header row, one column per field) or "ndjson"
+                (one JSON object per line)
+                
+        Yields:
+            Encoded chunks ready to send to the client
+        """
+        if fmt == "csv":
+            async with self.cursor.copy(
+                f"COPY ({EXPORT_CSV_SQL}) TO STDOUT WITH (FORMAT csv, HEADER)"
+            ) as copy:
+                async for block in copy:
+                    yield bytes(block)
+            return
+        
+        buffer = []
+        size = 0
+        async with self.cursor.copy(f"COPY ({EXPORT_NDJSON_SQL}) TO STDOUT") as copy:
+            async for (line,) in copy.rows():
+                buffer.append(line)
+                size += len(line)
+                if size >= EXPORT_CHUNK_BYTES:
+                    yield ("\n".join(buffer) + "\n").encode()
+                    buffer = []
+                    size = 0
+        if buffer:
+            yield ("\n".join(buffer) + "\n").encode()
+    
+    async def import_batch(self, rows: List[Tuple[int, str, tuple]]) -> List[int]:
+        """
+        Insert one batch of import rows in its own transaction.
+        
+        Rows are COPYed into a temporary staging table and moved into
+        blogs with a single INSERT ... SELECT. Rows whose slug is taken,
+        by an existing blog or an earlier row of the batch, are skipped.
         
-        self.cursor.execute(query, tuple(blog_ids))
-        return self.cursor.rowcount
+        Args:
+            rows: (row number, slug, import_values() of the row) triples
+            
+        Returns:
+            Row numbers that were inserted
+        """
+        try:
+            await self.cursor.execute(IMPORT_STAGING_SQL, prepare=False)
+            async with self.cursor.copy(
+                f"COPY blog_import (row_no, {_IMPORT_COLUMN_LIST}) FROM STDIN"
+            ) as copy:
+                for row_no, _, values in rows:
+                    await copy.write_row((row_no, *values))
+            await self.cursor.execute(IMPORT_INSERT_SQL, prepare=False)
+            inserted_slugs = {row["slug"] for row in await self.cursor.fetchall()}
+            await self.cursor.commit()
+        except Exception:
+            await self.cursor.rollback()
+            raise
+        
+        # The first row (by row number) holding each inserted slug won
+        inserted = []
+        for row_no, slug, _ in rows:
+            if slug in inserted_slugs:
+                inserted_slugs.discard(slug)
+                inserted.append(row_no)
+        return inserted
+    
+    @staticmethod
+    def import_values(blog: BlogImportRow) -> tuple:
+        """
+        Values for one import row, in IMPORT_COLUMNS order.
+        Renders the content, so callers on the event loop should run it
+        in a worker thread.
+        """
+        data = blog.model_dump()
+        data["tags"] = json.dumps(blog.tags)
+        data.update(render_content(blog.content))
+        return tuple(data[column] for column in IMPORT_COLUMNS)
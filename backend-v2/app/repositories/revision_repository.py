@@ -0,0 +1,188 @@
+"""
+Revision repository - handles database operations for blog history.
+Revisions live in blog_revisions, one row per save, so the blogs row stays
+the same width however often a post is edited. PostgreSQL compatible.
+"""
+from typing import List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.logging import get_logger
+from app.core.revisions import (
+    Revision, apply_delta, changed_fields, decode_snapshot, encode_delta,
+    encode_snapshot
+)
+
+logger = get_logger(__name__)
+
+# The next save is stored as a full snapshot once the deltas since the
+# last one would outgrow this multiple of a snapshot. Snapshots then cost
+# no more than the edits between them, and rebuilding any revision reads
+# at most about this many snapshots' worth of data.
+SNAPSHOT_CHAIN_RATIO = 1.0
+
+# Upper bound for "latest revision" chain lookups
+HEAD = 2_147_483_647
+
+# A revision and the rows needed to rebuild it: the nearest snapshot at or
+# before it and the deltas in between
+CHAIN_SQL = """
+    SELECT revision, is_snapshot, data
+    FROM blog_revisions
+    WHERE blog_id = %(blog_id)s
+        AND revision <= %(revision)s
+        AND revision >= (
+            SELECT max(revision) FROM blog_revisions
+            WHERE blog_id = %(blog_id)s
+                AND revision <= %(revision)s
+                AND is_snapshot
+        )
+    ORDER BY revision
+"""
+
+
+def _rebuild(rows: List[dict]) -> Optional[Tuple[int, Revision, int]]:
+    """
+    Rebuild the last revision of a CHAIN_SQL result.
+    
+    Returns:
+        (revision number, state, bytes of deltas since the snapshot),
+        or None if there are no rows
+    """
+    if not rows:
+        return None
+    state = decode_snapshot(rows[0]["data"])
+    for row in rows[1:]:
+        state = apply_delta(state, row["data"])
+    chain_bytes = sum(len(row["data"]) for row in rows[1:])
+    return rows[-1]["revision"], state, chain_bytes
+
+
+def _encode_next(
+    rows: List[dict],
+    state: Revision,
+    baseline: Optional[Revision]
+) -> Tuple[int, List[tuple]]:
+    """
+    Encode a save against the head of its chain. Decompressing, diffing
+    and compressing are CPU-bound, so record() runs this in a thread.
+    
+    Args:
+        rows: CHAIN_SQL rows of the latest revision
+        state: Fields as just saved
+        baseline: Fields before the save, for a blog without history
+        
+    Returns:
+        (number of the revision holding state, rows to insert as
+        (revision, is_snapshot, data, fields) tuples)
+    """
+    head = _rebuild(rows)
+    inserts = []
+    if head is None and baseline is not None and changed_fields(baseline, state):
+        inserts.append((1, True, encode_snapshot(baseline), changed_fields({}, baseline)))
+        head = 1, baseline, 0
+    
+    if head is None:
+        return 1, [(1, True, encode_snapshot(state), changed_fields({}, state))]
+    
+    number, previous, chain_bytes = head
+    fields = changed_fields(previous, state)
+    if not fields:
+        return number, inserts
+    
+    delta = encode_delta(previous, state)
+    snapshot = encode_snapshot(state)
+    if chain_bytes + len(delta) > len(snapshot) * SNAPSHOT_CHAIN_RATIO:
+        inserts.append((number + 1, True, snapshot, fields))
+    else:
+        inserts.append((number + 1, False, delta, fields))
+    return number + 1, inserts
+
+
+class RevisionRepository:
+    """Repository for blog revision history."""
+    
+    def __init__(self, cursor):
+        """
+        Initialize repository with database cursor.
+        
+        Args:
+            cursor: Database session (lazy cursor) from dependency injection
+        """
+        self.cursor = cursor
+    
+    async def _chain(self, blog_id: int, revision: int) -> List[dict]:
+        """Rows needed to rebuild a revision (see CHAIN_SQL)."""
+        await self.cursor.execute(CHAIN_SQL, {"blog_id": blog_id, "revision": revision})
+        return await self.cursor.fetchall()
+    
+    async def get(self, blog_id: int, revision: int) -> Optional[Revision]:
+        """
+        Retrieve one revision's fields.
+        
+        Args:
+            blog_id: Blog ID
+            revision: Revision number
+            
+        Returns:
+            Revision state or None if not found
+        """
+        loaded = await run_in_threadpool(_rebuild, await self._chain(blog_id, revision))
+        if not loaded or loaded[0] != revision:
+            return None
+        return loaded[1]
+    
+    async def list(self, blog_id: int) -> List[dict]:
+        """
+        List a blog's revisions, newest first, without their contents.
+        
+        Args:
+            blog_id: Blog ID
+            
+        Returns:
+            List of dicts with revision, fields (changed since the
+            previous revision), stored_bytes and created_at
+        """
+        await self.cursor.execute(
+            """
+            SELECT revision, fields, octet_length(data) AS stored_bytes, created_at
+            FROM blog_revisions
+            WHERE blog_id = %s
+            ORDER BY revision DESC
+            """,
+            (blog_id,)
+        )
+        return [dict(row) for row in await self.cursor.fetchall()]
+    
+    async def record(
+        self,
+        blog_id: int,
+        state: Revision,
+        baseline: Optional[Revision] = None
+    ) -> int:
+        """
+        Record a save as the blog's next revision.
+        Call after writing the blog row, so its lock orders concurrent saves.
+        
+        Args:
+            blog_id: Blog ID
+            state: Fields as just saved
+            baseline: Fields before the save, recorded first as revision 1
+                when the blog has no history yet
+                
+        Returns:
+            Number of the revision holding state (the latest existing one
+            if nothing changed)
+        """
+        number, inserts = await run_in_threadpool(
+            _encode_next, await self._chain(blog_id, HEAD), state, baseline
+        )
+        for revision, is_snapshot, data, fields in inserts:
+            await self.cursor.execute(
+                """
+                INSERT INTO blog_revisions (blog_id, revision, is_snapshot, data, fields)
+                VALUES (%s, %s, %s, %s, %s)
+                """,
+                (blog_id, revision, is_snapshot, data, fields)
+            )
+        return number
@@ -0,0 +1,81 @@
+"""
+Prepared statement registry for hot repository queries.
+Registered statements are prepared once per pooled connection and then
+executed by name, so Postgres skips parsing and planning on every call.
+PostgreSQL compatible.
+"""
+from typing import Dict, List, Optional
+
+from psycopg import errors
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Raised when a prepared plan is stale (schema change) or the server no
+# longer knows the statement (reconnect, DISCARD ALL, connection pooler)
+STALE_STATEMENT_ERRORS = (
+    errors.FeatureNotSupported,
+    errors.InvalidSqlStatementName,
+)
+
+
+class StatementRegistry:
+    """Named SQL statements executed as server-side prepared statements."""
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._statements: Dict[str, str] = {}
+    
+    def register(self, name: str, sql: str) -> str:
+        """
+        Register a statement.
+        
+        Args:
+            name: Unique statement name (e.g. "blog.get_by_slug")
+            sql: SQL text with %s placeholders
+            
+        Returns:
+            The statement name, for use with execute()
+        """
+        if name in self._statements and self._statements[name] != sql:
+            raise ValueError(f"Statement {name} is already registered")
+        self._statements[name] = sql
+        return name
+    
+    def sql(self, name: str) -> str:
+        """Get the SQL text of a registered statement."""
+        return self._statements[name]
+    
+    def names(self) -> List[str]:
+        """Get the names of all registered statements."""
+        return list(self._statements)
+    
+    async def execute(self, session, name: str, params: Optional[tuple] = None):
+        """
+        Execute a registered statement, preparing it on first use per connection.
+        Re-prepares transparently if the cached plan was invalidated, as
+        long as no earlier statement in the transaction would be lost.
+        
+        Args:
+            session: Database session from dependency injection
+            name: Registered statement name
+            params: Query parameters
+        """
+        sql = self._statements[name]
+        prepare = True if settings.DB_PREPARED_STATEMENTS else False
+        
+        try:
+            return await session.execute(sql, params, prepare=prepare)
+        except STALE_STATEMENT_ERRORS as e:
+            if session.statements_in_transaction:
+                raise
+            # Rolling back also discards the connection's prepared statements
+            logger.info(f"Re-preparing statement {name}: {e}")
+            await session.rollback()
+            return await session.execute(sql, params, prepare=prepare)
+
+
+# Singleton registry shared by all repositories
+statements = StatementRegistry()
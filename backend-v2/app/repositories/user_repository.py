@@ -5,9 +5,15 @@ PostgreSQL compatible.
 from typing import Optional
 
 from app.core.logging import get_logger
+from app.repositories.statements import statements
 
 logger = get_logger(__name__)
 
+GET_BY_EMAIL = statements.register(
+    "user.get_by_email",
+    "SELECT * FROM users WHERE email = %s"
+)
+
 
 class UserRepository:
     """Repository for user CRUD operations."""
@@ -17,11 +23,11 @@ class UserRepository:
         Initialize repository with database cursor.
         
         Args:
-            cursor: PostgreSQL cursor from dependency injection
+            cursor: Database session (lazy cursor) from dependency injection
         """
         self.cursor = cursor
     
-    def get_by_email(self, email: str) -> Optional[dict]:
+    async def get_by_email(self, email: str) -> Optional[dict]:
         """
         Retrieve user by email.
         
@@ -31,14 +37,11 @@ class UserRepository:
         Returns:
             User dict or None if not found
         """
-        self.cursor.execute(
-            "SELECT * FROM users WHERE email = %s",
-            (email,)
-        )
-        result = self.cursor.fetchone()
+        await statements.execute(self.cursor, GET_BY_EMAIL, (email,))
+        result = await self.cursor.fetchone()
         return dict(result) if result else None
     
-    def get_by_id(self, user_id: int) -> Optional[dict]:
+    async def get_by_id(self, user_id: int) -> Optional[dict]:
         """
         Retrieve user by ID.
         
@@ -48,14 +51,14 @@ class UserRepository:
         Returns:
             User dict or None if not found
         """
-        self.cursor.execute(
+        await self.cursor.execute(
             "SELECT * FROM users WHERE id = %s",
             (user_id,)
         )
-        result = self.cursor.fetchone()
+        result = await self.cursor.fetchone()
         return dict(result) if result else None
     
-    def create(self, email: str, name: str, password_hash: str) -> int:
+    async def create(self, email: str, name: str, password_hash: str) -> int:
         """
         Create a new user.
         
@@ -74,11 +77,11 @@ class UserRepository:
             RETURNING id
         """
         
-        self.cursor.execute(query, (email, name, password_hash))
-        result = self.cursor.fetchone()
+        await self.cursor.execute(query, (email, name, password_hash))
+        result = await self.cursor.fetchone()
         return result["id"] if result else 0
     
-    def update_last_login(self, user_id: int) -> bool:
+    async def update_last_login(self, user_id: int) -> bool:
         """
         Update user's last login timestamp.
         
@@ -88,7 +91,7 @@ class UserRepository:
         Returns:
             True if updated
         """
-        self.cursor.execute(
+        await self.cursor.execute(
             "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = %s",
             (user_id,)
         )
@@ -2,9 +2,9 @@
 Pydantic schemas for blog-related requests and responses.
 All API boundaries use these schemas for validation.
 """
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from slugify import slugify
 
 
@@ -54,6 +54,29 @@ class BlogCreate(BlogBase):
         return None
 
 
+class BlogImportRow(BlogCreate):
+    """One row of a bulk import; created_at is kept when migrating content."""
+    created_at: Optional[datetime] = None
+    
+    @field_validator("created_at", mode="before")
+    @classmethod
+    def parse_postgres_timestamp(cls, v):
+        """Accept PostgreSQL's text form ('+00' offsets) from CSV exports."""
+        if isinstance(v, str):
+            try:
+                return datetime.fromisoformat(v)
+            except ValueError:
+                return v
+        return v
+    
+    @model_validator(mode="after")
+    def ensure_slug(self):
+        """Rows without a slug get one from the title."""
+        if not self.slug:
+            self.slug = slugify(self.title)
+        return self
+
+
 class BlogUpdate(BlogBase):
     """Schema for updating an existing blog."""
     title: Optional[str] = Field(None, min_length=1, max_length=500)
@@ -71,6 +94,13 @@ class BlogInDB(BlogBase):
         from_attributes = True
 
 
+class TocEntry(BaseModel):
+    """Table of contents entry; id is the heading's anchor in content_html."""
+    level: int
+    id: str
+    text: str
+
+
 class BlogPublic(BaseModel):
     """Public blog response (no sensitive fields)."""
     id: int
@@ -99,6 +129,11 @@ class BlogPublic(BaseModel):
     is_featured: bool
     created_at: datetime
     updated_at: datetime
+    
+    # Derived at write time (None until an older post is backfilled)
+    content_html: Optional[str] = None  # sanitized, headings anchored
+    word_count: int = 0
+    toc: List[TocEntry] = Field(default_factory=list)
 
 
 class BlogListItem(BaseModel):
@@ -117,9 +152,86 @@ class BlogListItem(BaseModel):
     created_at: datetime
 
 
+class BlogListPage(BaseModel):
+    """One keyset-paginated page of list items."""
+    items: List[BlogListItem]
+    next_cursor: Optional[str] = None
+
+
+class BlogStats(BaseModel):
+    """Admin dashboard totals, drafts included."""
+    total: int
+    published: int
+    draft: int
+    featured: int
+
+
+class BlogSearchResult(BlogListItem):
+    """Search hit: list item plus relevance and a highlighted snippet."""
+    rank: float
+    snippet: Optional[str] = None  # escaped text, matches wrapped in <mark></mark>
+
+
+class BlogSearchPage(BaseModel):
+    """One page of search results, best match first."""
+    items: List[BlogSearchResult]
+    next_cursor: Optional[str] = None
+
+
+class TagCount(BaseModel):
+    """Tag cloud entry: published posts carrying a tag."""
+    name: str
+    count: int
+
+
+class CategoryCount(BaseModel):
+    """Published posts per category (id/description set when registered)."""
+    id: Optional[int] = None
+    name: str
+    slug: str
+    description: Optional[str] = None
+    count: int
+
+
 class BlogPageData(BaseModel):
     """Aggregated data for blog page (single API call)."""
     featured: Optional[BlogListItem]
     latest: List[BlogListItem]
     popular: List[BlogListItem]
-    categories: List[dict]
+    categories: List[CategoryCount]
+
+
+class BlogImportError(BaseModel):
+    """Why one import row was rejected (rows are numbered from 1)."""
+    row: int
+    error: str
+
+
+class BlogImportResult(BaseModel):
+    """Outcome of a bulk import."""
+    imported: int
+    failed: int
+    errors: List[BlogImportError]
+
+
+class BlogRevision(BaseModel):
+    """One saved revision in a blog's history (contents not included)."""
+    revision: int
+    fields: List[str]  # changed since the previous revision
+    stored_bytes: int  # compressed size on disk
+    created_at: datetime
+
+
+class BlogRevisionChange(BaseModel):
+    """One field that differs between two revisions."""
+    field: str
+    before: Optional[Any] = None
+    after: Optional[Any] = None
+    diff: Optional[str] = None  # unified diff, instead of before/after for content
+
+
+class BlogRevisionDiff(BaseModel):
+    """Changes from one revision (against) to another (revision)."""
+    revision: int
+    against: int
+    changes: List[BlogRevisionChange]
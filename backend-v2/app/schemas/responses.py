@@ -27,3 +27,4 @@ class HealthCheckResponse(BaseModel):
     version: str
     database: bool
     cache: bool
+    database_pool: Optional[dict] = None
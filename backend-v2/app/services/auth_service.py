@@ -25,7 +25,7 @@ class AuthService:
         """
         self.user_repo = user_repo
     
-    def authenticate_user(self, login_data: LoginRequest) -> LoginResponse:
+    async def authenticate_user(self, login_data: LoginRequest) -> LoginResponse:
         """
         Authenticate user and generate token.
         
@@ -39,7 +39,7 @@ class AuthService:
             HTTPException: If credentials are invalid
         """
         # Find user by email
-        user = self.user_repo.get_by_email(login_data.email)
+        user = await self.user_repo.get_by_email(login_data.email)
         
         if not user:
             logger.warning(f"Login attempt for non-existent email: {login_data.email}")
@@ -2,31 +2,203 @@
 Blog service - handles blog business logic.
 Orchestrates between repositories and cache layer.
 """
-from typing import List, Optional
-from fastapi import HTTPException, status
+import csv
+import hashlib
+import json
 from datetime import datetime
+from typing import (
+    Any, AsyncIterator, Awaitable, BinaryIO, Callable, Iterator, List, Optional, Tuple
+)
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from psycopg import Error as DatabaseError
+from psycopg.errors import UniqueViolation
+from pydantic import ValidationError
+from slugify import slugify
 
 from app.core.cache import cache_service
+from app.core.config import settings
+from app.core.content import search_snippet
+from app.core.database import QueryTimeoutError, database, db_router, session_scope
 from app.core.logging import get_logger
+from app.core.pagination import (
+    encode_cursor, decode_cursor, encode_rank_cursor, decode_rank_cursor
+)
+from app.core.revisions import PATCHED_FIELDS, changed_fields, revision_state, unified_diff
 from app.repositories.blog_repository import BlogRepository
+from app.repositories.revision_repository import RevisionRepository
+from app.services.view_counter import view_counter
 from app.schemas.blog import (
-    BlogCreate, BlogUpdate, BlogPublic, BlogListItem, BlogPageData
+    BlogCreate, BlogUpdate, BlogPublic, BlogListItem, BlogListPage, BlogPageData,
+    BlogStats, BlogImportRow, BlogImportError, BlogImportResult,
+    BlogSearchResult, BlogSearchPage, TagCount, CategoryCount,
+    BlogRevision, BlogRevisionChange, BlogRevisionDiff
 )
 
 logger = get_logger(__name__)
 
+# Tag/category counts are invalidated precisely on taxonomy-changing
+# writes, so they can live much longer than list pages
+TAXONOMY_CACHE_TTL = 3600
+
+# Blog content easily exceeds csv's default 128 KiB field limit; CSV
+# imports allow fields up to this many characters
+IMPORT_MAX_FIELD_CHARS = 16 * 1024 * 1024
+
+
+def _parse_tags(value: str) -> List[str]:
+    """CSV tags are a JSON array (as exported) or a comma-separated list."""
+    if value.startswith("["):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
+def _read_import_rows(
+    file: BinaryIO,
+    fmt: str
+) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """
+    Parse an uploaded import file lazily.
+    
+    Yields:
+        (row number, parsed fields, parse error) - exactly one of the
+        last two is set
+    """
+    if fmt == "csv":
+        # The limit is process-wide, so it is only ever raised, to a bound
+        if csv.field_size_limit() < IMPORT_MAX_FIELD_CHARS:
+            csv.field_size_limit(IMPORT_MAX_FIELD_CHARS)
+        lines = (line.decode("utf-8", errors="replace") for line in file)
+        reader = csv.DictReader(lines)
+        row_no = 0
+        while True:
+            row_no += 1
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader cannot resync after a malformed record
+                yield row_no, None, f"Invalid CSV, import stopped here: {e}"
+                return
+            # Empty cells mean "not set" so schema defaults apply
+            data = {k: v for k, v in row.items() if k and v not in ("", None)}
+            if "tags" in data:
+                data["tags"] = _parse_tags(data["tags"])
+            yield row_no, data, None
+    
+    for row_no, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield row_no, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield row_no, None, "Expected a JSON object"
+            continue
+        yield row_no, data, None
+
+
+def _prepare_import_batch(
+    rows: Iterator[Tuple[int, Optional[dict], Optional[str]]]
+) -> Tuple[List[Tuple[int, str, tuple]], List[BlogImportError]]:
+    """
+    Parse, validate and render import rows until a batch is full.
+    CPU-bound, so import_blogs() runs it in a worker thread.
+    
+    Args:
+        rows: Iterator from _read_import_rows(), resumed on each call
+        
+    Returns:
+        (up to BLOG_IMPORT_BATCH_SIZE (row number, slug, values) triples
+        ready for BlogRepository.import_batch, rejected rows) - a short
+        batch means the file is exhausted
+    """
+    batch: List[Tuple[int, str, tuple]] = []
+    errors: List[BlogImportError] = []
+    for row_no, data, parse_error in rows:
+        if parse_error:
+            errors.append(BlogImportError(row=row_no, error=parse_error))
+            continue
+        try:
+            blog = BlogImportRow.model_validate(data)
+        except ValidationError as e:
+            errors.append(BlogImportError(
+                row=row_no, error=_describe_validation_error(e)
+            ))
+            continue
+        batch.append((row_no, blog.slug, BlogRepository.import_values(blog)))
+        if len(batch) >= settings.BLOG_IMPORT_BATCH_SIZE:
+            break
+    return batch, errors
+
+
+def _describe_validation_error(error: ValidationError) -> str:
+    """Compact one-line summary of a pydantic validation error."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
 
 class BlogService:
     """Service for blog operations."""
     
-    def __init__(self, blog_repo: BlogRepository):
+    def __init__(
+        self,
+        blog_repo: Optional[BlogRepository] = None,
+        revision_repo: Optional[RevisionRepository] = None
+    ):
         """
         Initialize blog service.
         
         Args:
-            blog_repo: Blog repository instance
+            blog_repo: Blog repository instance; None for public reads,
+                which are filled through sessions of their own (_loader)
+            revision_repo: Revision repository (defaults to one on the
+                blog repository's session, so saves and history commit
+                together)
         """
         self.blog_repo = blog_repo
+        if revision_repo is None and blog_repo is not None:
+            revision_repo = RevisionRepository(blog_repo.cursor)
+        self.revision_repo = revision_repo
+    
+    @staticmethod
+    def _loader(method: Callable[..., Awaitable[Any]], *args) -> Callable[[], Awaitable[Any]]:
+        """
+        Cache loader running a BlogService method in its own read session.
+        A fill is shared by every request waiting on the key and may finish
+        after the request that started it, so it cannot use a request's
+        session, and it is bounded by the public statement timeout rather
+        than cancelled when a client disconnects. Fills read a replica
+        except within READ_YOUR_WRITES_SECONDS of a blog write, when a
+        replica could still hold a post the write has just evicted.
+        
+        Args:
+            method: Unbound BlogService method returning a schema, a list
+                of schemas or None
+            *args: Arguments for method
+            
+        Returns:
+            Coroutine function returning the result as JSON-ready data
+        """
+        async def load():
+            db = db_router.for_read()
+            fallback = database if db is not database else None
+            async with session_scope(
+                db, fallback, statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_PUBLIC_MS
+            ) as session:
+                result = await method(BlogService(BlogRepository(session)), *args)
+            if isinstance(result, list):
+                return [item.model_dump(mode="json") for item in result]
+            return result.model_dump(mode="json") if result is not None else None
+        return load
     
     def _blog_to_public(self, blog: dict) -> BlogPublic:
         """Convert database blog dict to public schema."""
@@ -56,7 +228,10 @@ class BlogService:
             published=blog.get("published", False),
             is_featured=blog.get("is_featured", False),
             created_at=blog["created_at"],
-            updated_at=blog["updated_at"]
+            updated_at=blog["updated_at"],
+            content_html=blog.get("content_html"),
+            word_count=blog.get("word_count", 0),
+            toc=blog.get("toc") or []
         )
     
     def _blog_to_list_item(self, blog: dict) -> BlogListItem:
@@ -76,9 +251,10 @@ class BlogService:
             created_at=blog["created_at"]
         )
     
-    def get_blog_by_slug(self, slug: str) -> BlogPublic:
+    async def get_blog_by_slug(self, slug: str) -> BlogPublic:
         """
         Get published blog by slug with caching.
+        Counts a view whether the blog comes from cache or the database.
         
         Args:
             slug: Blog URL slug
@@ -89,29 +265,25 @@ class BlogService:
         Raises:
             HTTPException: If blog not found
         """
-        # Try cache first
-        cache_key = f"blog:slug:{slug}"
-        cached = cache_service.get(cache_key)
-        if cached:
-            logger.debug(f"Cache hit for blog slug: {slug}")
-            return BlogPublic(**cached)
-        
-        # Fetch from database
-        blog = self.blog_repo.get_by_slug(slug)
-        if not blog:
+        # Cache for 10 minutes
+        cached = await cache_service.get_or_load(
+            f"blog:slug:{slug}", self._loader(BlogService._load_public, slug), ttl=600
+        )
+        if not cached:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
         
-        blog_public = self._blog_to_public(blog)
-        
-        # Cache for 10 minutes
-        cache_service.set(cache_key, blog_public.model_dump(), ttl=600)
-        
-        return blog_public
+        view_counter.record(cached["id"])
+        return BlogPublic(**cached)
+    
+    async def _load_public(self, slug: str) -> Optional[BlogPublic]:
+        """Published blog by slug from the database, or None."""
+        blog = await self.blog_repo.get_by_slug(slug)
+        return self._blog_to_public(blog) if blog else None
     
-    def get_blog_by_id(self, blog_id: int) -> BlogPublic:
+    async def get_blog_by_id(self, blog_id: int) -> BlogPublic:
         """
         Get blog by ID (admin access).
         
@@ -124,7 +296,7 @@ class BlogService:
         Raises:
             HTTPException: If blog not found
         """
-        blog = self.blog_repo.get_by_id(blog_id)
+        blog = await self.blog_repo.get_by_id(blog_id)
         if not blog:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -133,20 +305,297 @@ class BlogService:
         
         return self._blog_to_public(blog)
     
-    def get_all_blogs(self, published_only: bool = False) -> List[BlogListItem]:
+    async def get_blogs_page(
+        self,
+        published_only: bool = False,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> BlogListPage:
         """
-        Get all blogs with optional filtering.
+        Get one keyset-paginated page of blogs, newest first.
         
         Args:
             published_only: If True, only return published blogs
+            limit: Page size
+            cursor: Opaque cursor from the previous page's next_cursor
+            status: Admin filter - "published", "draft" or "featured"
+                (ignored when published_only is set)
+                
+        Returns:
+            BlogListPage with items and next_cursor (None on the last page)
+        """
+        after = decode_cursor(cursor)
+        
+        # Fetch one extra row to know whether another page exists
+        blogs = await self.blog_repo.get_page(
+            status="published" if published_only else status,
+            limit=limit + 1,
+            after=after,
+            projection="list"
+        )
+        return self._to_list_page(blogs, limit)
+    
+    async def get_blog_stats(self) -> BlogStats:
+        """
+        Get post totals for the admin dashboard (not cached).
+        
+        Returns:
+            BlogStats with total, published, draft and featured counts
+        """
+        stats = await self.blog_repo.get_stats()
+        return BlogStats(draft=stats["total"] - stats["published"], **stats)
+    
+    def _to_list_page(self, blogs: List[dict], limit: int) -> BlogListPage:
+        """
+        Build a keyset page from up to limit + 1 rows, newest first.
+        The extra row only signals that another page exists.
+        """
+        has_more = len(blogs) > limit
+        blogs = blogs[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = blogs[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"])
+        
+        return BlogListPage(
+            items=[self._blog_to_list_item(blog) for blog in blogs],
+            next_cursor=next_cursor
+        )
+    
+    async def get_archive_page(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> BlogListPage:
+        """
+        Get a page of the public archive (published blogs) with caching.
+        Cached for 5 minutes.
+        
+        Args:
+            limit: Page size
+            cursor: Opaque cursor from the previous page's next_cursor
+            
+        Returns:
+            BlogListPage
+        """
+        # Reject a malformed cursor before it becomes a cache key
+        decode_cursor(cursor)
+        
+        cached = await cache_service.get_or_load(
+            f"blog:archive:{limit}:{cursor or 'first'}",
+            self._loader(BlogService.get_blogs_page, True, limit, cursor),
+            ttl=300
+        )
+        return BlogListPage(**cached)
+    
+    async def get_tag_page(
+        self,
+        tag: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> BlogListPage:
+        """
+        Get a page of published blogs with a tag, newest first.
+        Cached for 5 minutes.
+        
+        Args:
+            tag: Exact tag value
+            limit: Page size
+            cursor: Opaque cursor from the previous page's next_cursor
+            
+        Returns:
+            BlogListPage
+        """
+        after = decode_cursor(cursor)
+        
+        cached = await cache_service.get_or_load(
+            f"blog:tag:{tag}:{limit}:{cursor or 'first'}",
+            self._loader(BlogService._load_tag_page, tag, limit, after),
+            ttl=300
+        )
+        return BlogListPage(**cached)
+    
+    async def _load_tag_page(
+        self,
+        tag: str,
+        limit: int,
+        after: Optional[Tuple[datetime, int]]
+    ) -> BlogListPage:
+        """Tag page from the database."""
+        blogs = await self.blog_repo.get_page_by_tag(tag, limit=limit + 1, after=after)
+        return self._to_list_page(blogs, limit)
+    
+    async def get_category_page(
+        self,
+        slug: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> BlogListPage:
+        """
+        Get a page of published blogs in a category, newest first.
+        Cached for 5 minutes.
+        
+        Args:
+            slug: Category slug (as returned by the category counts)
+            limit: Page size
+            cursor: Opaque cursor from the previous page's next_cursor
+            
+        Returns:
+            BlogListPage
+            
+        Raises:
+            HTTPException: If no published blog is in the category
+        """
+        after = decode_cursor(cursor)
+        
+        cached = await cache_service.get_or_load(
+            f"blog:category:{slug}:{limit}:{cursor or 'first'}",
+            self._loader(BlogService._load_category_page, slug, limit, after),
+            ttl=300
+        )
+        return BlogListPage(**cached)
+    
+    async def _load_category_page(
+        self,
+        slug: str,
+        limit: int,
+        after: Optional[Tuple[datetime, int]]
+    ) -> BlogListPage:
+        """Category page from the database; raises 404 for unknown categories."""
+        # Blogs store the category name; resolve the slug via the counts
+        categories = await self.get_category_counts()
+        name = next((c.name for c in categories if c.slug == slug), None)
+        if name is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Category not found"
+            )
+        
+        blogs = await self.blog_repo.get_page_by_category(
+            name, limit=limit + 1, after=after
+        )
+        return self._to_list_page(blogs, limit)
+    
+    async def get_tag_cloud(self, limit: int = 100) -> List[TagCount]:
+        """
+        Get published post counts per tag, most used first.
+        Cached until a write changes tags or published status.
+        
+        Args:
+            limit: Maximum number of tags
+            
+        Returns:
+            List of TagCount
+        """
+        cached = await cache_service.get_or_load(
+            f"taxonomy:tags:{limit}",
+            self._loader(BlogService._load_tag_cloud, limit),
+            ttl=TAXONOMY_CACHE_TTL
+        )
+        return [TagCount(**tag) for tag in cached]
+    
+    async def _load_tag_cloud(self, limit: int) -> List[TagCount]:
+        """Tag counts from the database."""
+        return [TagCount(**row) for row in await self.blog_repo.get_tag_counts(limit)]
+    
+    async def get_category_counts(self) -> List[CategoryCount]:
+        """
+        Get published post counts per category, largest first.
+        Cached until a write changes categories or published status.
+        
+        Returns:
+            List of CategoryCount
+        """
+        cached = await cache_service.get_or_load(
+            "taxonomy:categories",
+            self._loader(BlogService._load_category_counts),
+            ttl=TAXONOMY_CACHE_TTL
+        )
+        return [CategoryCount(**category) for category in cached]
+    
+    async def _load_category_counts(self) -> List[CategoryCount]:
+        """Category counts from the database."""
+        return [
+            self._to_category_count(row)
+            for row in await self.blog_repo.get_category_counts()
+        ]
+    
+    @staticmethod
+    def _to_category_count(row: dict) -> CategoryCount:
+        """Category count row; unregistered categories get a derived slug."""
+        return CategoryCount(**{**row, "slug": row["slug"] or slugify(row["name"])})
+    
+    async def search_blogs(
+        self,
+        query: str,
+        published_only: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> BlogSearchPage:
+        """
+        Full-text search over title, tags, excerpt and content.
+        Public (published-only) searches are cached for 5 minutes.
+        
+        Args:
+            query: Search terms (web-search syntax)
+            published_only: If True, only search published blogs
+            limit: Page size
+            cursor: Opaque cursor from the previous page's next_cursor
             
         Returns:
-            List of BlogListItem
+            BlogSearchPage with ranked items and next_cursor
         """
-        blogs = self.blog_repo.get_all(published_only=published_only)
-        return [self._blog_to_list_item(blog) for blog in blogs]
+        after = decode_rank_cursor(cursor)
+        
+        if not published_only:
+            return await self._load_search_page(query, False, limit, after)
+        
+        digest = hashlib.sha1(" ".join(query.lower().split()).encode()).hexdigest()
+        cached = await cache_service.get_or_load(
+            f"blog:search:{digest}:{limit}:{cursor or 'first'}",
+            self._loader(BlogService._load_search_page, query, True, limit, after),
+            ttl=300
+        )
+        return BlogSearchPage(**cached)
+    
+    async def _load_search_page(
+        self,
+        query: str,
+        published_only: bool,
+        limit: int,
+        after: Optional[Tuple[float, int]]
+    ) -> BlogSearchPage:
+        """Search results page from the database."""
+        # Fetch one extra row to know whether another page exists
+        blogs = await self.blog_repo.search(
+            query,
+            published_only=published_only,
+            limit=limit + 1,
+            after=after
+        )
+        has_more = len(blogs) > limit
+        blogs = blogs[:limit]
+        
+        next_cursor = None
+        if has_more:
+            last = blogs[-1]
+            next_cursor = encode_rank_cursor(last["rank"], last["id"])
+        
+        return BlogSearchPage(
+            items=[
+                BlogSearchResult(
+                    **self._blog_to_list_item(blog).model_dump(),
+                    rank=blog["rank"],
+                    snippet=search_snippet(blog.get("snippet"))
+                )
+                for blog in blogs
+            ],
+            next_cursor=next_cursor
+        )
     
-    def get_page_data(self) -> BlogPageData:
+    async def get_page_data(self) -> BlogPageData:
         """
         Get aggregated blog page data (optimized single endpoint).
         Cached for 5 minutes.
@@ -154,40 +603,31 @@ class BlogService:
         Returns:
             BlogPageData with featured, latest, popular, categories
         """
-        # Try cache first
-        cache_key = "blog:page_data"
-        cached = cache_service.get(cache_key)
-        if cached:
-            logger.debug("Cache hit for blog page data")
-            return BlogPageData(**cached)
+        cached = await cache_service.get_or_load(
+            "blog:page_data", self._loader(BlogService._load_page_data), ttl=300
+        )
+        return BlogPageData(**cached)
+    
+    async def _load_page_data(self) -> BlogPageData:
+        """Page data from the database."""
+        # Featured, latest, popular and categories in one round trip
+        data = await self.blog_repo.get_page_data(latest_limit=6, popular_limit=6)
         
-        # Get featured blog
-        featured_dict = self.blog_repo.get_featured()
+        featured_dict = data["featured"]
         featured = self._blog_to_list_item(featured_dict) if featured_dict else None
+        latest = [self._blog_to_list_item(blog) for blog in data["latest"]]
+        popular = [self._blog_to_list_item(blog) for blog in data["popular"]]
         
-        # Get latest blogs
-        latest_blogs = self.blog_repo.get_all(published_only=True, limit=6)
-        latest = [self._blog_to_list_item(blog) for blog in latest_blogs]
+        categories = [self._to_category_count(row) for row in data["categories"]]
         
-        # For now, popular = latest (can add view count later)
-        popular = latest
-        
-        # Categories (empty for now - can add categories table)
-        categories = []
-        
-        page_data = BlogPageData(
+        return BlogPageData(
             featured=featured,
             latest=latest,
             popular=popular,
             categories=categories
         )
-        
-        # Cache for 5 minutes
-        cache_service.set(cache_key, page_data.model_dump(), ttl=300)
-        
-        return page_data
     
-    def create_blog(self, blog_data: BlogCreate) -> dict:
+    async def create_blog(self, blog_data: BlogCreate) -> dict:
         """
         Create a new blog.
         
@@ -197,23 +637,28 @@ class BlogService:
         Returns:
             Dict with blog_id and slug
         """
-        # Check for slug uniqueness
-        existing = self.blog_repo.get_by_slug(blog_data.slug)
-        if existing:
-            # Append timestamp to make unique
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            blog_data.slug = f"{blog_data.slug}-{timestamp}"
+        created = await self.blog_repo.create(blog_data)
+        if not created:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Could not find a free slug for this blog"
+            )
         
-        blog_id = self.blog_repo.create(blog_data)
+        await self.revision_repo.record(
+            created["id"],
+            revision_state({**blog_data.model_dump(), "slug": created["slug"]})
+        )
         
-        # Invalidate cache
-        cache_service.invalidate_blog_cache()
+        # Drafts appear in no public list
+        await cache_service.evict_blogs(
+            [created["slug"]], taxonomy=blog_data.published, lists=blog_data.published
+        )
         
-        logger.info(f"Created blog: {blog_id} - {blog_data.title}")
+        logger.info(f"Created blog: {created['id']} - {blog_data.title}")
         
-        return {"id": blog_id, "slug": blog_data.slug}
+        return created
     
-    def update_blog(self, blog_id: int, blog_data: BlogUpdate) -> dict:
+    async def update_blog(self, blog_id: int, blog_data: BlogUpdate) -> dict:
         """
         Update an existing blog.
         
@@ -222,35 +667,151 @@ class BlogService:
             blog_data: Updated blog data
             
         Returns:
-            Dict with slug
+            Dict with slug and the revision number of the saved version
+            
+        Raises:
+            HTTPException: If blog not found
+        """
+        try:
+            updated = await self.blog_repo.update(blog_id, blog_data)
+        except UniqueViolation:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Slug is already used by another blog"
+            )
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Blog not found"
+            )
+        
+        # Posts saved before history existed keep their pre-edit version
+        baseline = updated["baseline"]
+        revision = await self.revision_repo.record(
+            blog_id,
+            revision_state({**blog_data.model_dump(), "slug": updated["slug"]}),
+            revision_state(baseline) if baseline else None
+        )
+        
+        await cache_service.evict_blogs(
+            {updated["old_slug"], updated["slug"]},
+            taxonomy=updated["taxonomy_changed"],
+            lists=updated["was_published"] or blog_data.published
+        )
+        
+        logger.info(f"Updated blog: {blog_id} (revision {revision})")
+        
+        return {"slug": updated["slug"], "revision": revision}
+    
+    async def list_revisions(self, blog_id: int) -> List[BlogRevision]:
+        """
+        List a blog's saved revisions, newest first.
+        
+        Args:
+            blog_id: Blog ID
+            
+        Returns:
+            List of BlogRevision (empty for posts not edited since
+            history was introduced)
             
         Raises:
             HTTPException: If blog not found
         """
-        # Verify blog exists
-        existing = self.blog_repo.get_by_id(blog_id)
-        if not existing:
+        revisions = await self.revision_repo.list(blog_id)
+        if not revisions and not await self.blog_repo.get_by_id(blog_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
+        return [BlogRevision(**revision) for revision in revisions]
+    
+    async def _get_revision(self, blog_id: int, revision: int) -> dict:
+        """Load a revision's fields or raise 404."""
+        state = await self.revision_repo.get(blog_id, revision)
+        if state is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Revision not found"
+            )
+        return state
+    
+    async def diff_revisions(
+        self,
+        blog_id: int,
+        revision: int,
+        against: Optional[int] = None
+    ) -> BlogRevisionDiff:
+        """
+        Compare two revisions of a blog.
+        
+        Args:
+            blog_id: Blog ID
+            revision: Revision to show
+            against: Revision to compare with (default: the previous one;
+                0 compares with an empty post)
+                
+        Returns:
+            BlogRevisionDiff with one entry per changed field
+            
+        Raises:
+            HTTPException: If either revision is not found
+        """
+        if against is None:
+            against = revision - 1
+        
+        new = await self._get_revision(blog_id, revision)
+        old = await self._get_revision(blog_id, against) if against else revision_state({})
+        
+        changes = []
+        for field in changed_fields(old, new):
+            if field in PATCHED_FIELDS:
+                changes.append(BlogRevisionChange(
+                    field=field, diff=unified_diff(old[field], new[field], field)
+                ))
+            else:
+                changes.append(BlogRevisionChange(
+                    field=field, before=old[field], after=new[field]
+                ))
+        
+        return BlogRevisionDiff(revision=revision, against=against, changes=changes)
+    
+    async def restore_revision(self, blog_id: int, revision: int) -> dict:
+        """
+        Restore a blog's fields from an earlier revision.
+        Saved as a new revision, so the restore itself can be undone;
+        published and featured state are kept as they are.
         
-        # Update
-        success = self.blog_repo.update(blog_id, blog_data)
-        if not success:
+        Args:
+            blog_id: Blog ID
+            revision: Revision to restore
+            
+        Returns:
+            Dict with slug and the new revision number
+            
+        Raises:
+            HTTPException: If blog or revision not found, or the old slug
+                is now used by another blog
+        """
+        state = await self._get_revision(blog_id, revision)
+        current = await self.blog_repo.get_by_id(blog_id)
+        if not current:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update blog"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Blog not found"
             )
         
-        # Invalidate cache
-        cache_service.invalidate_blog_cache()
+        blog_data = BlogUpdate(
+            **state,
+            published=current["published"],
+            is_featured=current["is_featured"]
+        )
+        result = await self.update_blog(blog_id, blog_data)
         
-        logger.info(f"Updated blog: {blog_id}")
+        logger.info(f"Restored blog {blog_id} to revision {revision}")
         
-        return {"slug": blog_data.slug}
+        return result
     
-    def delete_blog(self, blog_id: int) -> None:
+    async def delete_blog(self, blog_id: int) -> None:
         """
         Delete a blog.
         
@@ -260,19 +821,20 @@ class BlogService:
         Raises:
             HTTPException: If blog not found
         """
-        success = self.blog_repo.delete(blog_id)
-        if not success:
+        deleted = await self.blog_repo.delete(blog_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
         
-        # Invalidate cache
-        cache_service.invalidate_blog_cache()
+        await cache_service.evict_blogs(
+            [deleted["slug"]], taxonomy=deleted["published"], lists=deleted["published"]
+        )
         
         logger.info(f"Deleted blog: {blog_id}")
     
-    def toggle_published(self, blog_id: int) -> bool:
+    async def toggle_published(self, blog_id: int) -> bool:
         """
         Toggle blog published status.
         
@@ -285,17 +847,18 @@ class BlogService:
         Raises:
             HTTPException: If blog not found
         """
-        new_status = self.blog_repo.toggle_published(blog_id)
-        if new_status is None:
+        toggled = await self.blog_repo.toggle_published(blog_id)
+        if toggled is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
-        cache_service.invalidate_blog_cache()
+        new_status = toggled["published"]
+        await cache_service.evict_blogs([toggled["slug"]], taxonomy=True)
         logger.info(f"Toggled published for blog {blog_id}: {new_status}")
         return new_status
     
-    def toggle_featured(self, blog_id: int) -> bool:
+    async def toggle_featured(self, blog_id: int) -> bool:
         """
         Toggle blog featured status.
         
@@ -308,33 +871,113 @@ class BlogService:
         Raises:
             HTTPException: If blog not found
         """
-        new_status = self.blog_repo.toggle_featured(blog_id)
-        if new_status is None:
+        toggled = await self.blog_repo.toggle_featured(blog_id)
+        if toggled is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Blog not found"
             )
-        cache_service.invalidate_blog_cache()
+        new_status = toggled["is_featured"]
+        await cache_service.evict_blogs([toggled["slug"]], lists=toggled["published"])
         logger.info(f"Toggled featured for blog {blog_id}: {new_status}")
         return new_status
     
-    def bulk_publish(self, blog_ids: List[int]) -> int:
+    async def bulk_publish(self, blog_ids: List[int]) -> int:
         """Bulk publish blogs."""
-        count = self.blog_repo.bulk_update_published(blog_ids, True)
-        cache_service.invalidate_blog_cache()
-        logger.info(f"Bulk published {count} blogs")
-        return count
+        return await self._bulk_set_published(blog_ids, True)
     
-    def bulk_unpublish(self, blog_ids: List[int]) -> int:
+    async def bulk_unpublish(self, blog_ids: List[int]) -> int:
         """Bulk unpublish blogs."""
-        count = self.blog_repo.bulk_update_published(blog_ids, False)
-        cache_service.invalidate_blog_cache()
-        logger.info(f"Bulk unpublished {count} blogs")
-        return count
+        return await self._bulk_set_published(blog_ids, False)
     
-    def bulk_delete(self, blog_ids: List[int]) -> int:
+    async def _bulk_set_published(self, blog_ids: List[int], published: bool) -> int:
+        """Set published on many blogs, evicting only those that changed."""
+        rows = await self.blog_repo.bulk_update_published(blog_ids, published)
+        changed = [row["slug"] for row in rows if row["changed"]]
+        if changed:
+            await cache_service.evict_blogs(changed, taxonomy=True)
+        logger.info(f"Bulk {'published' if published else 'unpublished'} {len(rows)} blogs")
+        return len(rows)
+    
+    async def bulk_delete(self, blog_ids: List[int]) -> int:
         """Bulk delete blogs."""
-        count = self.blog_repo.bulk_delete(blog_ids)
-        cache_service.invalidate_blog_cache()
-        logger.info(f"Bulk deleted {count} blogs")
-        return count
+        rows = await self.blog_repo.bulk_delete(blog_ids)
+        if rows:
+            listed = any(row["published"] for row in rows)
+            await cache_service.evict_blogs(
+                [row["slug"] for row in rows], taxonomy=listed, lists=listed
+            )
+        logger.info(f"Bulk deleted {len(rows)} blogs")
+        return len(rows)
+    
+    def export_blogs(self, fmt: str) -> AsyncIterator[bytes]:
+        """
+        Stream every blog as NDJSON or CSV, straight from COPY.
+        
+        Args:
+            fmt: "ndjson" or "csv"
+            
+        Returns:
+            Async iterator of encoded chunks
+        """
+        return self.blog_repo.export_rows(fmt)
+    
+    async def import_blogs(self, file: BinaryIO, fmt: str) -> BlogImportResult:
+        """
+        Bulk import blogs from an NDJSON or CSV upload.
+        
+        Rows are parsed, validated and rendered a batch at a time in a
+        worker thread, keeping the event loop free, and written in COPY
+        batches of BLOG_IMPORT_BATCH_SIZE, each in its own transaction, so
+        a bad batch does not undo earlier ones. The cache is invalidated
+        once.
+        
+        Args:
+            file: Uploaded file object (binary)
+            fmt: "ndjson" or "csv"
+            
+        Returns:
+            Imported/failed counts and a per-row error report
+        """
+        errors: List[BlogImportError] = []
+        imported = 0
+        rows = _read_import_rows(file, fmt)
+        
+        while True:
+            batch, rejected = await run_in_threadpool(_prepare_import_batch, rows)
+            errors.extend(rejected)
+            if batch:
+                imported += await self._import_batch(batch, errors)
+            if len(batch) < settings.BLOG_IMPORT_BATCH_SIZE:
+                break
+        
+        # New posts have no cached detail pages yet, only lists to refresh
+        if imported:
+            await cache_service.evict_blogs([], taxonomy=True)
+        
+        errors.sort(key=lambda e: e.row)
+        logger.info(f"Imported {imported} blogs ({len(errors)} rows rejected)")
+        return BlogImportResult(imported=imported, failed=len(errors), errors=errors)
+    
+    async def _import_batch(
+        self,
+        batch: List[Tuple[int, str, tuple]],
+        errors: List[BlogImportError]
+    ) -> int:
+        """Write one batch, recording rejected rows in errors."""
+        try:
+            inserted = set(await self.blog_repo.import_batch(batch))
+        except (DatabaseError, QueryTimeoutError) as e:
+            logger.error(f"Import batch starting at row {batch[0][0]} failed: {e}")
+            errors.extend(
+                BlogImportError(row=row_no, error=f"Batch rejected by database: {e}")
+                for row_no, _, _ in batch
+            )
+            return 0
+        
+        errors.extend(
+            BlogImportError(row=row_no, error=f"Slug '{slug}' already exists")
+            for row_no, slug, _ in batch
+            if row_no not in inserted
+        )
+        return len(inserted)
@@ -0,0 +1,122 @@
+"""
+Blog change feed - cache eviction driven by the database.
+A trigger on blogs NOTIFYs the ids and slugs each committed statement
+changed (see BLOGS_CHANGE_FEED_SQL). Every process LISTENs on its own
+connection and evicts exactly the cache entries those posts feed, so
+writes from other workers, direct SQL edits and imports all invalidate,
+and eviction happens after commit, when a refill can no longer read the
+old row.
+"""
+import asyncio
+import json
+from contextlib import aclosing
+from typing import Optional
+
+from app.core.cache import cache_service
+from app.core.config import settings
+from app.core.database import database, db_router
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CHANNEL = "blog_changes"
+
+# Without notifications for this long, ping the connection so a silently
+# dropped one is noticed and replaced
+HEARTBEAT_SECONDS = 60.0
+
+# Reconnect backoff bounds
+RETRY_MIN_SECONDS = 1.0
+RETRY_MAX_SECONDS = 30.0
+
+
+class BlogChangeFeed:
+    """LISTEN loop that evicts cache entries for changed posts."""
+    
+    def __init__(self):
+        """Initialize a stopped feed."""
+        self._task: Optional[asyncio.Task] = None
+        self._retry_delay = RETRY_MIN_SECONDS
+    
+    async def handle(self, payload: str) -> None:
+        """
+        Evict the cache entries for one change notification.
+        
+        Args:
+            payload: JSON with op, ids, slugs and taxonomy
+        """
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            logger.error(f"Ignoring malformed blog change: {payload!r}")
+            return
+        
+        # Replicas may not have the change yet; keep reads on the primary
+        db_router.mark_write()
+        await cache_service.evict_blogs(change["slugs"], taxonomy=change["taxonomy"])
+        logger.debug(f"Evicted cache for {change['op']} of blogs {change['ids']}")
+    
+    async def _listen(self, catch_up: bool) -> None:
+        """
+        Hold one LISTEN connection until it fails.
+        
+        Args:
+            catch_up: Flush blog caches once listening, because changes
+                made while the feed was down were never seen
+        """
+        conn = await database.connect(autocommit=True)
+        async with conn:
+            await conn.execute(f"LISTEN {CHANNEL}")
+            logger.info(f"Listening for blog changes on '{CHANNEL}'")
+            self._retry_delay = RETRY_MIN_SECONDS
+            if catch_up:
+                await cache_service.invalidate_blog_cache()
+                await cache_service.invalidate_taxonomy_cache()
+            while True:
+                # Closed explicitly: the generator holds the connection
+                # lock, so leaving it suspended on cancel blocks close()
+                async with aclosing(conn.notifies(timeout=HEARTBEAT_SECONDS)) as notifies:
+                    async for notify in notifies:
+                        await self.handle(notify.payload)
+                        # redis.asyncio absorbs a cancel that lands
+                        # mid-command, which would leave stop() waiting
+                        if asyncio.current_task().cancelling():
+                            raise asyncio.CancelledError
+                await conn.execute("SELECT 1")
+    
+    async def _run(self) -> None:
+        """Listen, reconnecting with backoff after failures."""
+        catch_up = False
+        while True:
+            try:
+                await self._listen(catch_up)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = self._retry_delay
+                logger.warning(f"Blog change feed lost: {e} - reconnecting in {delay:.0f}s")
+                catch_up = True
+                await asyncio.sleep(delay)
+                self._retry_delay = min(delay * 2, RETRY_MAX_SECONDS)
+    
+    def start(self) -> None:
+        """Start listening in the background (if CACHE_CHANGE_FEED is on)."""
+        if not settings.CACHE_CHANGE_FEED:
+            logger.info("Blog change feed disabled")
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="blog-change-feed")
+    
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Singleton instance
+change_feed = BlogChangeFeed()
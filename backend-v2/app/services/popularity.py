@@ -0,0 +1,96 @@
+"""
+Popularity service - time-decayed ranking for the "popular" list.
+A view at time t is worth exp(-decay * (now - t)), so the ranking is the
+sum of exp(decay * t) over a post's views scaled by a factor shared by
+every post. blog_popularity.score stores the log of that sum: recording
+views only ever adds to it, old scores never need a decay pass, and the
+page-data endpoint reads the top N straight off the score index.
+Scores are only comparable under one decay rate, so the rate in use is
+stored in blog_popularity_settings and a change reseeds every score.
+"""
+import time
+from typing import List
+
+from app.core.config import settings
+from app.core.database import DBSession, database, session_scope
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Folds a batch of views into each score with log-sum-exp (the gap is capped
+# because exp() errors on underflow); views of posts deleted since they were
+# counted are dropped by the join
+RECORD_VIEWS_SQL = """
+INSERT INTO blog_popularity AS p (blog_id, score)
+SELECT v.id, ln(v.views) + %s
+FROM unnest(%s::int[], %s::int[]) AS v(id, views)
+JOIN blogs b ON b.id = v.id
+ON CONFLICT (blog_id) DO UPDATE
+SET score = GREATEST(p.score, EXCLUDED.score)
+    + ln(1 + exp(-LEAST(abs(p.score - EXCLUDED.score), 50)))
+"""
+
+# Scores rebuilt from view_count, as if every view happened at publication
+RESEED_SQL = """
+INSERT INTO blog_popularity (blog_id, score)
+SELECT id, ln(view_count + 1) + %s * extract(epoch FROM created_at)
+FROM blogs
+ON CONFLICT (blog_id) DO UPDATE SET score = EXCLUDED.score
+"""
+
+STORE_RATE_SQL = """
+INSERT INTO blog_popularity_settings (decay_rate) VALUES (%s)
+ON CONFLICT (id) DO UPDATE SET decay_rate = EXCLUDED.decay_rate
+"""
+
+
+async def _stored_rate(session: DBSession):
+    """Decay rate the current scores were built with, or None."""
+    await session.execute("SELECT decay_rate FROM blog_popularity_settings")
+    row = await session.fetchone()
+    return row["decay_rate"] if row else None
+
+
+async def sync_decay_rate() -> bool:
+    """
+    Store the configured decay rate, reseeding scores if it changed.
+    With the rate unchanged this is one SELECT. Otherwise the settings
+    table is locked, so workers starting together reseed once and the
+    seed trigger waits rather than scoring new posts at the old rate.
+    
+    Returns:
+        True if scores were reseeded
+    """
+    rate = settings.popularity_decay_rate
+    try:
+        async with session_scope(database) as session:
+            if await _stored_rate(session) == rate:
+                return False
+        
+        async with session_scope(database) as session:
+            await session.execute("LOCK TABLE blog_popularity_settings IN ACCESS EXCLUSIVE MODE")
+            if await _stored_rate(session) == rate:
+                return False
+            await session.execute(STORE_RATE_SQL, (rate,))
+            await session.execute(RESEED_SQL, (rate,))
+    except Exception as e:
+        logger.error(f"Popularity seeding failed: {e}")
+        return False
+    
+    logger.info(
+        f"Seeded popularity scores for a {settings.POPULARITY_HALF_LIFE_HOURS}h half-life"
+    )
+    return True
+
+
+async def record_views(session: DBSession, blog_ids: List[int], views: List[int]) -> None:
+    """
+    Add a batch of views, timestamped now, to the popularity scores.
+    
+    Args:
+        session: Database session (the caller's transaction)
+        blog_ids: Blog IDs, sorted so concurrent writers lock in one order
+        views: View count for each blog ID
+    """
+    now = settings.popularity_decay_rate * time.time()
+    await session.execute(RECORD_VIEWS_SQL, (now, blog_ids, views))
@@ -0,0 +1,97 @@
+"""
+View counter service - write-behind tracking of blog views.
+Hits are counted in process memory and flushed to blogs.view_count in one
+batched UPDATE every VIEW_COUNT_FLUSH_SECONDS, so a read costs a dict
+increment instead of a row lock on the hottest posts. Flushes add to the
+stored value, so every worker can flush its own counts independently.
+The same flush folds the batch into the decayed popularity scores.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.database import database, session_scope
+from app.core.logging import get_logger
+from app.services.popularity import record_views
+
+logger = get_logger(__name__)
+
+# One statement for the whole batch; ids are sorted so concurrent flushes
+# from several workers lock rows in the same order
+FLUSH_VIEWS_SQL = """
+UPDATE blogs AS b
+SET view_count = b.view_count + v.views
+FROM unnest(%s::int[], %s::int[]) AS v(id, views)
+WHERE b.id = v.id
+"""
+
+
+class ViewCounter:
+    """In-memory view counts with periodic batched flushes."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._pending: Dict[int, int] = defaultdict(int)
+        self._task: Optional[asyncio.Task] = None
+    
+    def record(self, blog_id: int) -> None:
+        """Count one view of a blog (no I/O)."""
+        self._pending[blog_id] += 1
+    
+    async def flush(self) -> int:
+        """
+        Write pending counts and popularity in one transaction.
+        Counts are put back if the write fails, so no views are lost.
+        
+        Returns:
+            Number of views flushed
+        """
+        if not self._pending:
+            return 0
+        
+        # Swap before awaiting so views recorded during the flush are kept
+        pending, self._pending = self._pending, defaultdict(int)
+        blog_ids = sorted(pending)
+        
+        try:
+            views = [pending[blog_id] for blog_id in blog_ids]
+            async with session_scope(database) as session:
+                await session.execute(FLUSH_VIEWS_SQL, (blog_ids, views))
+                await record_views(session, blog_ids, views)
+        except Exception as e:
+            logger.error(f"View count flush failed, will retry: {e}")
+            for blog_id, views in pending.items():
+                self._pending[blog_id] += views
+            return 0
+        
+        flushed = sum(pending.values())
+        logger.debug(f"Flushed {flushed} views for {len(blog_ids)} blogs")
+        return flushed
+    
+    async def _run(self) -> None:
+        """Flush on a fixed interval until cancelled."""
+        while True:
+            await asyncio.sleep(settings.VIEW_COUNT_FLUSH_SECONDS)
+            await self.flush()
+    
+    def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="view-counter-flush")
+            logger.info(f"View counter flushing every {settings.VIEW_COUNT_FLUSH_SECONDS}s")
+    
+    async def stop(self) -> None:
+        """Stop the flush loop and write out whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# Singleton instance
+view_counter = ViewCounter()
@@ -0,0 +1,15 @@
+"""
+Shared test configuration.
+Database tests run against TEST_DATABASE_URL and are skipped without it;
+the remaining required settings get dummy values so app modules import.
+"""
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-test-secret-key-0000")
+os.environ.setdefault(
+    "DATABASE_URL",
+    os.environ.get("TEST_DATABASE_URL", "postgresql://localhost/test")
+)
+os.environ.setdefault("CLOUDINARY_CLOUD_NAME", "test")
+os.environ.setdefault("CLOUDINARY_API_KEY", "test")
+os.environ.setdefault("CLOUDINARY_API_SECRET", "test")
@@ -0,0 +1,229 @@
+"""
+Cache tests: in-process entries expire, the byte budget evicts least
+recently used keys first, pattern deletes match Redis globs, keys are
+stamped with the generations of their longest matching prefix, and
+concurrent misses share one load. Against fakeredis, with one
+CacheService per simulated process: invalidation and eviction reach
+other processes, fills racing an eviction store nothing, the fill lock
+shares a load across processes, and stale values are served while one
+refresh runs.
+"""
+import asyncio
+
+import pytest
+
+from app.core.cache import FILL_LOCK_KEY, CacheService, LocalCache, _generations
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+requires_redis = pytest.mark.skipif(fakeredis is None, reason="fakeredis is not installed")
+
+
+def test_entries_expire_at_the_shorter_ttl(monkeypatch):
+    """An entry lives for min(requested ttl, cache ttl)."""
+    now = [1000.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    cache = LocalCache(max_bytes=1000, ttl=30)
+    cache.set("short", 1, size=1, ttl=5)
+    cache.set("long", 2, size=1, ttl=600)
+    
+    now[0] += 10
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    now[0] += 25
+    assert cache.get("long") is None
+
+
+def test_budget_evicts_least_recently_used():
+    """Going over budget drops the entries read longest ago."""
+    cache = LocalCache(max_bytes=30, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.set(key, key, size=10, ttl=60)
+    cache.get("a")
+    cache.set("d", "d", size=10, ttl=60)
+    
+    assert [cache.get(key) for key in "abcd"] == ["a", None, "c", "d"]
+    cache.set("huge", "x", size=31, ttl=60)
+    assert cache.get("huge") is None and cache.get("a") == "a"
+
+
+def test_delete_matches_patterns():
+    """Patterns remove matching keys; plain keys remove only themselves."""
+    cache = LocalCache(max_bytes=100, ttl=60)
+    for key in ("blog:slug:a", "blog:slug:b", "blog:page_data", "taxonomy:tags:100"):
+        cache.set(key, key, size=1, ttl=60)
+    cache.delete("blog:slug:*")
+    cache.delete("blog:page_data")
+    
+    assert cache.get("blog:slug:a") is None and cache.get("blog:page_data") is None
+    assert cache.get("taxonomy:tags:100") == "taxonomy:tags:100"
+
+
+def test_disabled_when_budget_is_zero():
+    """A zero budget stores nothing."""
+    cache = LocalCache(max_bytes=0, ttl=60)
+    cache.set("a", 1, size=1, ttl=60)
+    assert cache.get("a") is None
+
+
+def test_keys_take_generations_of_longest_prefix():
+    """List pages follow both blog and list generations; detail pages their own too."""
+    assert _generations("blog:slug:post") == ("blog", "blog:slug:post")
+    assert _generations("blog:tag:python:10:") == ("blog", "blog_lists")
+    assert _generations("taxonomy:tags:100") == ("taxonomy",)
+    assert _generations("other") == ()
+
+
+def test_concurrent_misses_share_one_load():
+    """Requests missing the same key wait for a single load; None is not cached."""
+    cache = CacheService()
+    loads = []
+    
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": len(loads)}
+    
+    async def burst(key):
+        return await asyncio.gather(*(cache.get_or_load(key, load, ttl=60) for _ in range(20)))
+    
+    assert asyncio.run(burst("blog:page_data")) == [{"value": 1}] * 20
+    assert len(loads) == 1
+    
+    async def missing():
+        loads.append(1)
+    
+    async def twice():
+        return [await cache.get_or_load("blog:slug:nope", missing, ttl=60) for _ in range(2)]
+    
+    assert asyncio.run(twice()) == [None, None]
+    assert len(loads) == 3
+
+
+def _process(server) -> CacheService:
+    """A CacheService connected to a fakeredis server, like one worker's."""
+    cache = CacheService()
+    cache._client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    cache._available = True
+    return cache
+
+
+async def _in_redis(cache: CacheService, key: str):
+    """Fresh value another process would read from Redis, or None."""
+    entry = await cache._read(key)
+    return entry[0] if entry and entry[1] else None
+
+
+@requires_redis
+def test_invalidation_reaches_other_processes():
+    """Evicting a post drops its page and lists; a generation bump drops its keys."""
+    server = fakeredis.FakeServer()
+    
+    async def scenario():
+        writer, reader = _process(server), _process(server)
+        keys = ("blog:slug:a", "blog:slug:b", "blog:page_data", "taxonomy:tags:100")
+        for key in keys:
+            await writer.set(key, {"key": key}, ttl=60)
+        assert [await _in_redis(reader, key) for key in keys] == [{"key": key} for key in keys]
+        
+        await writer.evict_blogs(["a"])
+        assert [bool(await _in_redis(reader, key)) for key in keys] == [False, True, False, True]
+        assert writer._local.get("blog:slug:a") is None
+        assert writer._local.get("blog:slug:b") == {"key": "blog:slug:b"}
+        
+        await writer.invalidate("blog")
+        assert [bool(await _in_redis(reader, key)) for key in keys] == [False, False, False, True]
+    
+    asyncio.run(scenario())
+
+
+@requires_redis
+@pytest.mark.parametrize("key,slugs", [("blog:slug:post", ["post"]), ("blog:page_data", [])])
+def test_fill_racing_an_eviction_stores_nothing(key, slugs):
+    """A value loaded before an eviction is neither stored in Redis nor in the L1."""
+    server = fakeredis.FakeServer()
+    
+    async def scenario():
+        cache = _process(server)
+        started, release = asyncio.Event(), asyncio.Event()
+        
+        async def load_old():
+            started.set()
+            await release.wait()
+            return {"v": "old"}
+        
+        fill = asyncio.create_task(cache.get_or_load(key, load_old, ttl=600))
+        await started.wait()
+        await cache.evict_blogs(slugs)
+        release.set()
+        assert await fill == {"v": "old"}
+        
+        assert await _in_redis(_process(server), key) is None
+        assert cache._local.get(key) is None
+        
+        async def load_new():
+            return {"v": "new"}
+        
+        assert await cache.get_or_load(key, load_new, ttl=600) == {"v": "new"}
+        assert await _in_redis(_process(server), key) == {"v": "new"}
+    
+    asyncio.run(scenario())
+
+
+@requires_redis
+def test_fill_lock_shares_one_load_across_processes():
+    """A process missing a key another is loading waits for its value."""
+    server = fakeredis.FakeServer()
+    loads = []
+    
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.2)
+        return {"value": len(loads)}
+    
+    async def scenario():
+        processes = [_process(server) for _ in range(3)]
+        values = await asyncio.gather(
+            *(cache.get_or_load("blog:page_data", load, ttl=60) for cache in processes)
+        )
+        assert values == [{"value": 1}] * 3
+        assert not await processes[0]._client.exists(FILL_LOCK_KEY.format("blog:page_data"))
+    
+    asyncio.run(scenario())
+    assert len(loads) == 1
+
+
+@requires_redis
+def test_stale_values_are_served_while_one_refresh_runs(monkeypatch):
+    """Past its TTL a value is still returned, and a single background load replaces it."""
+    server = fakeredis.FakeServer()
+    now = [1_000_000.0]
+    monkeypatch.setattr("app.core.cache.time.time", lambda: now[0])
+    loads = []
+    
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.05)
+        return {"v": "new"}
+    
+    async def scenario():
+        await _process(server).set("blog:page_data", {"v": "old"}, ttl=60)
+        now[0] += 61
+        cache = _process(server)
+        values = await asyncio.gather(
+            *(cache.get_or_load("blog:page_data", load, ttl=60) for _ in range(5))
+        )
+        assert values == [{"v": "old"}] * 5
+        await asyncio.gather(*cache._refreshes.values())
+        assert await _in_redis(_process(server), "blog:page_data") == {"v": "new"}
+        
+        # Invalidated values are never served, stale or not
+        await cache.invalidate("blog_lists")
+        now[0] += 61
+        assert await _process(server).get_or_load("blog:page_data", load, ttl=60) == {"v": "new"}
+    
+    asyncio.run(scenario())
+    assert len(loads) == 2
@@ -0,0 +1,81 @@
+"""
+Change feed trigger tests: statements touching many posts with long slugs
+commit, and their notifications fit the NOTIFY payload limit while still
+naming every post. Notifications are only sent on commit, so the schema
+is built in a throwaway PostgreSQL schema that is dropped afterwards.
+"""
+import json
+import os
+
+import psycopg
+import pytest
+
+from app.core.migrations import schema_statements
+from app.services.change_feed import CHANNEL
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+SCHEMA = "change_feed_test"
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+PAYLOAD_LIMIT = 8000
+
+POSTS = 100
+
+
+@pytest.fixture
+def conn():
+    """Autocommit connection with the schema migrated into SCHEMA."""
+    with psycopg.connect(TEST_DATABASE_URL, autocommit=True) as connection:
+        connection.execute(f"CREATE SCHEMA {SCHEMA}")
+        try:
+            connection.execute(f"SET search_path TO {SCHEMA}")
+            for sql in schema_statements(transactional=False):
+                connection.execute(sql)
+            yield connection
+        finally:
+            connection.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+
+@pytest.fixture
+def listener():
+    """Connection listening on the change feed channel."""
+    with psycopg.connect(TEST_DATABASE_URL, autocommit=True) as connection:
+        connection.execute(f"LISTEN {CHANNEL}")
+        yield connection
+
+
+def _changes(listener) -> list:
+    """Payloads of the notifications received so far, checking their size."""
+    payloads = [notify.payload for notify in listener.notifies(timeout=1.0)]
+    for payload in payloads:
+        assert len(payload.encode()) < PAYLOAD_LIMIT, len(payload.encode())
+    return [json.loads(payload) for payload in payloads]
+
+
+def test_long_slugs_are_chunked_under_the_payload_limit(conn, listener):
+    """Bulk inserts and renames of maximum-length slugs notify every post."""
+    conn.execute(
+        """
+        INSERT INTO blogs (title, slug, content, published)
+        SELECT 'Post ' || n, lpad(n::text, 500, 'é'), 'Body', TRUE
+        FROM generate_series(1, %s) AS n
+        """,
+        (POSTS,)
+    )
+    inserted = _changes(listener)
+    assert len(inserted) > 1
+    assert {change["op"] for change in inserted} == {"INSERT"}
+    assert len({blog_id for change in inserted for blog_id in change["ids"]}) == POSTS
+    old_slugs = {slug for change in inserted for slug in change["slugs"]}
+    assert len(old_slugs) == POSTS and all(change["taxonomy"] for change in inserted)
+    
+    conn.execute("UPDATE blogs SET slug = lpad(id::text, 500, 'ü')")
+    renamed = _changes(listener)
+    slugs = {slug for change in renamed for slug in change["slugs"]}
+    assert old_slugs < slugs and len(slugs) == 2 * POSTS
+    assert not any(change["taxonomy"] for change in renamed)
@@ -0,0 +1,168 @@
+"""
+Content processing tests: rendering strips scripts, handlers, foreign
+iframes and unsafe links, anchors headings with unique ids, derives the
+excerpt, word count and read time, and search snippets are escaped text
+with only the matches marked, whatever markup the post held.
+"""
+import json
+import os
+
+import psycopg
+import pytest
+from psycopg.rows import dict_row
+
+from app.core.content import (
+    EXCERPT_MAX_CHARS,
+    SNIPPET_START,
+    SNIPPET_STOP,
+    render_content,
+    sanitize_html,
+    search_snippet,
+)
+from app.core.migrations import schema_statements
+from app.repositories.blog_repository import SEARCH_SQL
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Markup a search snippet must never pass through as tags
+HOSTILE_CONTENT = (
+    '<p>Searchable <script>alert("searchable")</script> text with '
+    "&lt;img src=x onerror=alert(1)&gt; in it</p>"
+)
+
+
+def test_snippet_escapes_everything_but_marks():
+    """Tags and entities in the headline come out escaped; markers become <mark>."""
+    headline = (
+        f"<script>{SNIPPET_START}alert{SNIPPET_STOP}(1)</script> "
+        f"&lt;img onerror=x&gt; {SNIPPET_START}alert{SNIPPET_STOP}"
+    )
+    assert search_snippet(headline) == (
+        "&lt;script&gt;<mark>alert</mark>(1)&lt;/script&gt; "
+        "&lt;img onerror=x&gt; <mark>alert</mark>"
+    )
+    assert search_snippet(None) is None
+
+
+def test_scripts_and_handlers_are_stripped():
+    """<script> elements and on* attributes do not survive rendering."""
+    rendered = render_content(
+        '<p>Hi<script>alert(1)</script></p>'
+        '<p><img src="https://example.com/a.png" onerror="alert(2)" alt="a"></p>'
+    )["content_html"]
+    assert "<script" not in rendered and "alert(1)" not in rendered
+    assert "onerror" not in rendered and "alert(2)" not in rendered
+    assert 'src="https://example.com/a.png"' in rendered
+
+
+def test_only_video_iframes_keep_their_src():
+    """YouTube and Vimeo embeds pass; any other iframe loses its source."""
+    youtube = "https://www.youtube.com/embed/abc123"
+    vimeo = "https://player.vimeo.com/video/42"
+    sanitized = sanitize_html(
+        f'<iframe src="{youtube}"></iframe>'
+        f'<iframe src="{vimeo}"></iframe>'
+        '<iframe src="https://evil.example.com/embed/abc123"></iframe>'
+        '<iframe src="https://www.youtube.com.evil.example.com/embed/x"></iframe>'
+    )
+    assert f'src="{youtube}"' in sanitized and f'src="{vimeo}"' in sanitized
+    assert "evil.example.com" not in sanitized
+    assert sanitized.count("src=") == 2
+
+
+def test_javascript_links_are_neutralized():
+    """javascript: hrefs are dropped, in HTML and in Markdown links."""
+    html_link = sanitize_html(
+        '<a href="javascript:alert(1)">x</a><a href="JaVaScRiPt:alert(2)">y</a>'
+    )
+    assert "javascript" not in html_link.lower() and "href" not in html_link
+    
+    markdown = render_content("Click [here](javascript:alert(1)) or [there](https://example.com)")
+    assert "javascript" not in markdown["content_html"].lower()
+    assert 'href="https://example.com"' in markdown["content_html"]
+    
+    assert 'href="mailto:a@example.com"' in sanitize_html('<a href="mailto:a@example.com">m</a>')
+
+
+def test_duplicate_headings_get_unique_ids():
+    """Repeated and colliding headings get suffixed ids; set ids are kept."""
+    derived = render_content(
+        '<h2>Intro</h2><p>a</p><h2>Intro</h2><h3 id="intro-2">Taken</h3>'
+        "<h2>Intro</h2><h2>!!!</h2><h5>Not listed</h5>"
+    )
+    toc = json.loads(derived["toc"])
+    assert [entry["id"] for entry in toc] == ["intro", "intro-3", "intro-2", "intro-4", "section"]
+    assert [entry["level"] for entry in toc] == [2, 2, 3, 2, 2]
+    assert toc[2]["text"] == "Taken"
+    for entry in toc:
+        assert derived["content_html"].count(f'id="{entry["id"]}"') == 1
+
+
+def test_excerpt_and_word_count():
+    """Paragraph text makes the excerpt; long text is cut at a word with an ellipsis."""
+    short = render_content("## Heading\n\nFirst **bold** paragraph.\n\nSecond one.")
+    assert short["auto_excerpt"] == "First bold paragraph. Second one."
+    assert short["word_count"] == 6
+    assert short["read_time"] == 1
+    
+    long = render_content("<p>" + "word " * 450 + "</p>")
+    assert long["word_count"] == 450
+    assert long["read_time"] == 2
+    assert long["auto_excerpt"].endswith("…")
+    assert len(long["auto_excerpt"]) <= EXCERPT_MAX_CHARS + 1
+    assert set(long["auto_excerpt"][:-1].split()) == {"word"}
+    
+    assert render_content("<p></p>")["auto_excerpt"] is None
+    assert render_content("<p></p>")["read_time"] == 1
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+@pytest.mark.parametrize("rendered", [True, False])
+def test_search_snippet_of_hostile_post(rendered):
+    """Search over a post with <script> yields a snippet without live markup."""
+    with psycopg.connect(TEST_DATABASE_URL, row_factory=dict_row) as conn:
+        try:
+            for sql in schema_statements():
+                conn.execute(sql)
+            # Rows saved before content_html existed fall back to raw content
+            derived = render_content(HOSTILE_CONTENT) if rendered else {"content_html": None}
+            conn.execute(
+                """
+                INSERT INTO blogs (title, slug, content, content_html, published)
+                VALUES ('Hostile', 'snippet-test-hostile', %s, %s, TRUE)
+                """,
+                (HOSTILE_CONTENT, derived["content_html"])
+            )
+            params = {"query": "searchable", "candidates": 100, "limit": 10}
+            rows = conn.execute(SEARCH_SQL[(True, False)], params).fetchall()
+        finally:
+            conn.rollback()
+    
+    [row] = [row for row in rows if row["slug"] == "snippet-test-hostile"]
+    snippet = search_snippet(row["snippet"])
+    assert "<mark>Searchable</mark>" in snippet
+    assert "<script" not in snippet and "<img" not in snippet
+    assert "<" not in snippet.replace("<mark>", "").replace("</mark>", "")
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+def test_huge_post_is_saved_and_searchable():
+    """Content whose full tsvector would pass PostgreSQL's 1MB limit still saves."""
+    content = "<p>Needle</p> " + " ".join(f"w{n:07d}" for n in range(300_000))
+    with psycopg.connect(TEST_DATABASE_URL, row_factory=dict_row) as conn:
+        try:
+            for sql in schema_statements():
+                conn.execute(sql)
+            conn.execute(
+                """
+                INSERT INTO blogs (title, slug, content, published)
+                VALUES ('Huge', 'snippet-test-huge', %s, TRUE)
+                """,
+                (content,)
+            )
+            params = {"query": "needle", "candidates": 100, "limit": 10}
+            rows = conn.execute(SEARCH_SQL[(True, False)], params).fetchall()
+        finally:
+            conn.rollback()
+    
+    assert "snippet-test-huge" in [row["slug"] for row in rows]
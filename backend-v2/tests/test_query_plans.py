@@ -0,0 +1,293 @@
+"""
+Query plan regression tests.
+Seeds a large dataset into TEST_DATABASE_URL and EXPLAINs every registered
+repository statement, every search variant and the unprepared admin,
+export, import, revision and view-count statements, failing if a query
+falls back to a sequential scan of blogs or stops using the index it was
+built for. Everything runs in one transaction that is rolled back, so the
+database is left as it was. Run with:
+
+    TEST_DATABASE_URL=postgresql://postgres@localhost:5432/cms_test pytest tests/
+"""
+import os
+
+import psycopg
+import pytest
+from psycopg.rows import dict_row
+
+from app.core.config import settings
+from app.core.migrations import schema_statements
+from app.repositories import user_repository  # noqa: F401 - registers statements
+from app.repositories.blog_repository import (
+    BULK_DELETE_SQL, BULK_UPDATE_PUBLISHED_SQL, DELETE_SQL, EXPORT_CSV_SQL,
+    EXPORT_NDJSON_SQL, IMPORT_INSERT_SQL, IMPORT_STAGING_SQL, PROJECTIONS,
+    SEARCH_SQL, STATS_SQL, TOGGLE_FEATURED_SQL, TOGGLE_PUBLISHED_SQL, UPDATE_SQL
+)
+from app.repositories.revision_repository import CHAIN_SQL
+from app.repositories.statements import statements
+from app.services.popularity import RECORD_VIEWS_SQL, RESEED_SQL
+from app.services.view_counter import FLUSH_VIEWS_SQL
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+SEED_ROWS = 50_000
+
+# 5% drafts, 1% featured, 20 categories, 50 + 7 overlapping tags,
+# one post every 30 minutes going back about three years
+SEED_SQL = """
+INSERT INTO blogs (
+    title, slug, content, excerpt, category, tags,
+    published, is_featured, created_at
+)
+SELECT
+    'Post ' || n || ' on ' || (ARRAY['python', 'postgres', 'caching', 'design'])[n %% 4 + 1],
+    'plan-test-' || n,
+    repeat('Body of post ' || n || ' with a handful of ordinary words. ', 5),
+    'Excerpt for post ' || n,
+    'category-' || (n %% 20),
+    jsonb_build_array('tag-' || (n %% 50), 'topic-' || (n %% 7)),
+    n %% 20 <> 0,
+    n %% 100 = 0,
+    now() - n * interval '30 minutes'
+FROM generate_series(1, %s) AS n
+"""
+
+# 20 revisions for each of 2000 posts, a snapshot every 10
+REVISIONS_SQL = """
+INSERT INTO blog_revisions (blog_id, revision, is_snapshot, data, fields)
+SELECT b.id, r, r % 10 = 1, '\\x00'::bytea, '{}'
+FROM (SELECT id FROM blogs ORDER BY id LIMIT 2000) b, generate_series(1, 20) AS r
+"""
+
+# Keyset cursor about a year into the data
+CURSOR_SQL = "SELECT created_at, id FROM blogs WHERE slug = 'plan-test-17520'"
+
+# Posts targeted by the single-row and bulk writes
+TARGETS_SQL = "SELECT id FROM blogs WHERE slug = ANY(%s) ORDER BY id"
+TARGET_SLUGS = ["plan-test-100", "plan-test-2500", "plan-test-40000"]
+
+# Representative parameters per statement; projection variants
+# ("blog.get_page_first.list") share their base statement's entry
+STATEMENT_PARAMS = {
+    "blog.get_by_slug": lambda c: ("plan-test-100",),
+    "blog.get_by_id": lambda c: (100,),
+    "blog.get_page_first": lambda c: (20,),
+    "blog.get_page_after": lambda c: (*c, 20),
+    "blog.get_published_page_first": lambda c: (20,),
+    "blog.get_published_page_after": lambda c: (*c, 20),
+    "blog.get_draft_page_first": lambda c: (20,),
+    "blog.get_draft_page_after": lambda c: (*c, 20),
+    "blog.get_featured_page_first": lambda c: (20,),
+    "blog.get_featured_page_after": lambda c: (*c, 20),
+    "blog.get_tag_page_first": lambda c: ('["tag-3"]', 20),
+    "blog.get_tag_page_after": lambda c: ('["tag-3"]', *c, 20),
+    "blog.get_category_page_first": lambda c: ("category-3", 20),
+    "blog.get_category_page_after": lambda c: ("category-3", *c, 20),
+    "blog.get_tag_counts": lambda c: (50,),
+    "blog.get_category_counts": lambda c: None,
+    "blog.get_page_data": lambda c: (6, 6),
+    "user.get_by_email": lambda c: ("admin@example.com",),
+}
+
+# Indexes the hot public reads were designed around
+EXPECTED_INDEXES = {
+    "blog.get_by_slug": "blogs_slug_key",
+    "blog.get_by_id": "blogs_pkey",
+    "blog.get_published_page_first": "idx_blogs_published_created_at_id",
+    "blog.get_published_page_after": "idx_blogs_published_created_at_id",
+    "blog.get_draft_page_first": "idx_blogs_draft_created_at_id",
+    "blog.get_draft_page_after": "idx_blogs_draft_created_at_id",
+    "blog.get_featured_page_first": "idx_blogs_featured_created_at_id",
+    "blog.get_featured_page_after": "idx_blogs_featured_created_at_id",
+    "blog.get_page_data": "idx_blogs_featured_created_at",
+    "blog.get_category_page_first": "idx_blogs_published_category_created_at_id",
+    "blog.get_category_page_after": "idx_blogs_published_category_created_at_id",
+    "blog.get_page_after": "idx_blogs_created_at_id",
+}
+
+
+# Search finds rare terms through the GIN index and walks common ones in
+# created_at order, over the partial index when only published posts count
+SEARCH_INDEXES = {
+    "zebra crossing": {False: "idx_blogs_search", True: "idx_blogs_search"},
+    "postgres": {
+        False: "idx_blogs_created_at_id",
+        True: "idx_blogs_published_created_at_id",
+    },
+}
+
+# update() values: 20 text fields (tags is JSON), published, is_featured,
+# then the derived content columns
+UPDATE_VALUES = (
+    *["x"] * 5, "[]", *["x"] * 14, True, False, "<p>x</p>", 1, 1, "[]", "x"
+)
+
+# Unprepared statements: SQL, parameters for the target ids, and the
+# index they must use
+UNPREPARED_STATEMENTS = {
+    "update": (UPDATE_SQL, lambda ids: (*UPDATE_VALUES, ids[0]), "blogs_pkey"),
+    "delete": (DELETE_SQL, lambda ids: (ids[0],), "blogs_pkey"),
+    "toggle_published": (TOGGLE_PUBLISHED_SQL, lambda ids: (ids[0],), "blogs_pkey"),
+    "toggle_featured": (TOGGLE_FEATURED_SQL, lambda ids: (ids[0],), "blogs_pkey"),
+    "bulk_update_published": (
+        BULK_UPDATE_PUBLISHED_SQL, lambda ids: (True, ids), "blogs_pkey"
+    ),
+    "bulk_delete": (BULK_DELETE_SQL, lambda ids: (ids,), "blogs_pkey"),
+    "export_csv": (EXPORT_CSV_SQL, lambda ids: None, "blogs_pkey"),
+    "export_ndjson": (EXPORT_NDJSON_SQL, lambda ids: None, "blogs_pkey"),
+    "revision_chain": (
+        CHAIN_SQL, lambda ids: {"blog_id": ids[0], "revision": 15}, "blog_revisions_pkey"
+    ),
+    "flush_views": (FLUSH_VIEWS_SQL, lambda ids: (ids, [1] * len(ids)), "blogs_pkey"),
+    "record_views": (
+        RECORD_VIEWS_SQL, lambda ids: (1.0, ids, [1] * len(ids)), "blogs_pkey"
+    ),
+}
+
+
+def _base_name(name: str) -> str:
+    """Strip a projection suffix from a statement name."""
+    for projection in PROJECTIONS:
+        if name.endswith(f".{projection}"):
+            return name[:-len(projection) - 1]
+    return name
+
+
+def _plan_nodes(plan: dict):
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(conn, sql: str, params) -> list:
+    """Plan a query and return its nodes."""
+    row = conn.execute(f"EXPLAIN (FORMAT JSON) {sql}", params).fetchone()
+    return list(_plan_nodes(row["QUERY PLAN"][0]["Plan"]))
+
+
+def _indexes_used(nodes: list) -> set:
+    """Indexes scanned, or checked for ON CONFLICT, by a plan."""
+    used = {node["Index Name"] for node in nodes if "Index Name" in node}
+    for node in nodes:
+        used.update(node.get("Conflict Arbiter Indexes", []))
+    return used
+
+
+def _assert_no_blogs_seq_scan(nodes: list) -> None:
+    """Fail if any plan node reads blogs sequentially."""
+    seq_scans = [
+        node for node in nodes
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "blogs"
+    ]
+    assert not seq_scans, f"sequential scan of blogs: {seq_scans}"
+
+
+@pytest.fixture(scope="module")
+def conn():
+    """Connection holding the schema and seed data in an open transaction."""
+    with psycopg.connect(TEST_DATABASE_URL, row_factory=dict_row) as connection:
+        try:
+            for sql in schema_statements():
+                connection.execute(sql)
+            # Per-row count upserts on a few hot rows make a 50k-row insert
+            # crawl; the counts tables play no part in the plans checked here
+            connection.execute(
+                "ALTER TABLE blogs DISABLE TRIGGER blogs_taxonomy_counts_insert_delete"
+            )
+            connection.execute(SEED_SQL, (SEED_ROWS,))
+            connection.execute(RESEED_SQL, (settings.popularity_decay_rate,))
+            connection.execute(REVISIONS_SQL)
+            connection.execute("ANALYZE blogs")
+            connection.execute("ANALYZE blog_popularity")
+            connection.execute("ANALYZE blog_revisions")
+            yield connection
+        finally:
+            connection.rollback()
+
+
+@pytest.fixture(scope="module")
+def cursor_position(conn) -> tuple:
+    """(created_at, id) keyset cursor about a year into the data."""
+    row = conn.execute(CURSOR_SQL).fetchone()
+    return row["created_at"], row["id"]
+
+
+@pytest.fixture(scope="module")
+def target_ids(conn) -> list:
+    """Ids of the posts the write statements are planned against."""
+    return [row["id"] for row in conn.execute(TARGETS_SQL, (TARGET_SLUGS,))]
+
+
+def test_every_statement_has_plan_params():
+    """New statements must be added to STATEMENT_PARAMS to be checked."""
+    missing = {_base_name(name) for name in statements.names()} - set(STATEMENT_PARAMS)
+    assert not missing, f"add EXPLAIN parameters for: {sorted(missing)}"
+
+
+@pytest.mark.parametrize("name", statements.names())
+def test_statement_plan(conn, cursor_position, name):
+    """Registered statements never scan blogs and keep their index."""
+    base = _base_name(name)
+    nodes = _explain(conn, statements.sql(name), STATEMENT_PARAMS[base](cursor_position))
+    _assert_no_blogs_seq_scan(nodes)
+    
+    if base in EXPECTED_INDEXES:
+        used = _indexes_used(nodes)
+        assert EXPECTED_INDEXES[base] in used, f"{name} uses {used}"
+
+
+@pytest.mark.parametrize("variant", sorted(SEARCH_SQL))
+@pytest.mark.parametrize("query", ["postgres", "zebra crossing"])
+def test_search_plan(conn, variant, query):
+    """Search uses the GIN index for rare terms and an index for common ones."""
+    params = {
+        "query": query,
+        "candidates": 2000,
+        "limit": 20,
+        "rank": 0.5,
+        "id": 1_000_000,
+    }
+    nodes = _explain(conn, SEARCH_SQL[variant], params)
+    _assert_no_blogs_seq_scan(nodes)
+    
+    published_only, _ = variant
+    expected = SEARCH_INDEXES[query][published_only]
+    used = _indexes_used(nodes)
+    assert expected in used, f"search {variant} for {query!r} uses {used}"
+
+
+@pytest.mark.parametrize("name", sorted(UNPREPARED_STATEMENTS))
+def test_unprepared_statement_plan(conn, target_ids, name):
+    """Admin, export, revision and view-count statements keep their index."""
+    sql, params, expected = UNPREPARED_STATEMENTS[name]
+    nodes = _explain(conn, sql, params(target_ids))
+    _assert_no_blogs_seq_scan(nodes)
+    
+    used = _indexes_used(nodes)
+    assert expected in used, f"{name} uses {used}"
+
+
+def test_import_plan(conn):
+    """Import batches check slugs against blogs_slug_key, not a scan of blogs."""
+    with conn.transaction(force_rollback=True):
+        conn.execute(IMPORT_STAGING_SQL)
+        conn.execute("ANALYZE blog_import")
+        nodes = _explain(conn, IMPORT_INSERT_SQL, None)
+    _assert_no_blogs_seq_scan(nodes)
+    
+    used = _indexes_used(nodes)
+    assert "blogs_slug_key" in used, f"import uses {used}"
+
+
+def test_stats_plan(conn):
+    """Dashboard totals come from a single pass over blogs."""
+    scans = [
+        node for node in _explain(conn, STATS_SQL, None)
+        if node.get("Relation Name") == "blogs"
+    ]
+    assert len(scans) == 1, f"stats reads blogs {len(scans)} times"
@@ -0,0 +1,62 @@
+"""
+Revision encoding tests: deltas rebuild the saved revision exactly and
+stay proportional to the edit, not the post.
+"""
+from app.core.revisions import (
+    apply_delta, decode_snapshot, encode_delta, encode_snapshot, revision_state,
+    tokenize
+)
+
+PARAGRAPHS = [
+    f"<p>Paragraph {n} of a long post, with some ordinary words in it.</p>"
+    for n in range(500)
+]
+
+
+def _post(**fields) -> dict:
+    """Revision state of a post with the default long content."""
+    return revision_state({
+        "title": "Post", "content": "".join(PARAGRAPHS), "tags": ["a"], **fields
+    })
+
+
+def test_tokenize_round_trips():
+    """Joining tokens gives the text back, for HTML and Markdown."""
+    for text in ("".join(PARAGRAPHS), "## Heading\n\nBody\nline\n", "no breaks"):
+        assert "".join(tokenize(text)) == text
+
+
+def test_snapshot_round_trips():
+    """A snapshot decodes to the same revision."""
+    post = _post(category="news")
+    assert decode_snapshot(encode_snapshot(post)) == post
+
+
+def test_delta_rebuilds_next_revision():
+    """Applying a delta to its base gives the new revision."""
+    old = _post()
+    paragraphs = list(PARAGRAPHS)
+    paragraphs[250] = "<p>Rewritten.</p>"
+    del paragraphs[10]
+    paragraphs.append("<h2>New section</h2>\n<p>Added.</p>")
+    new = _post(title="Post, edited", content="".join(paragraphs), tags=["a", "b"], excerpt=None)
+    
+    assert apply_delta(old, encode_delta(old, new)) == new
+
+
+def test_delta_from_and_to_empty_content():
+    """Fields that were or become empty are stored whole."""
+    old = _post(content="", cta_text="Go")
+    new = _post(cta_text=None)
+    assert apply_delta(old, encode_delta(old, new)) == new
+    assert apply_delta(new, encode_delta(new, old)) == old
+
+
+def test_delta_size_follows_edit_size():
+    """A one-paragraph edit costs a small fraction of a snapshot."""
+    old = _post()
+    paragraphs = list(PARAGRAPHS)
+    paragraphs[100] = "<p>A different paragraph.</p>"
+    new = _post(content="".join(paragraphs))
+    
+    assert len(encode_delta(old, new)) * 20 < len(encode_snapshot(new))
@@ -262,7 +262,28 @@ const Api = {
  * Blogs API namespace.
  */
 const BlogsApi = {
-    getAll: () => Api.get('/api/admin/blogs', true),
+    /**
+     * One keyset page of blogs ({ items, next_cursor }), optionally only
+     * 'published', 'draft' or 'featured' ones.
+     */
+    getPage: (limit = 50, cursor = null, status = null) => {
+        const params = new URLSearchParams({ limit: String(limit) });
+        if (cursor) params.set('cursor', cursor);
+        if (status) params.set('status', status);
+        return Api.get(`/api/admin/blogs?${params}`, true);
+    },
+    /**
+     * One page of full-text search results over all blogs, drafts included.
+     */
+    search: (query, limit = 50, cursor = null) => {
+        const params = new URLSearchParams({ q: query, limit: String(limit) });
+        if (cursor) params.set('cursor', cursor);
+        return Api.get(`/api/admin/blogs/search?${params}`, true);
+    },
+    /**
+     * Dashboard totals ({ total, published, draft, featured }).
+     */
+    getStats: () => Api.get('/api/admin/blogs/stats', true),
     getById: (id) => Api.get(`/api/admin/blogs/${id}`, true),
     create: (data) => Api.post('/api/admin/blogs', data, true),
     update: (id, data) => Api.put(`/api/admin/blogs/${id}`, data, true),
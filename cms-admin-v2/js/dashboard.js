@@ -13,8 +13,12 @@
     // ============================================
     // State
     // ============================================
+    const PAGE_SIZE = 50;
+
     let blogs = [];
     let filteredBlogs = [];
+    let nextCursor = null;
+    let listRequest = 0;
     let selectedIds = new Set();
     let currentFilter = 'all';
     let searchQuery = '';
@@ -49,6 +53,8 @@
 
     // Blog List
     const blogList = document.getElementById('blog-list');
+    const loadMoreBar = document.getElementById('load-more');
+    const loadMoreBtn = document.getElementById('load-more-btn');
     const emptyState = document.getElementById('empty-state');
     const emptyTitle = document.getElementById('empty-title');
     const emptySubtitle = document.getElementById('empty-subtitle');
@@ -99,7 +105,7 @@
         searchInput.addEventListener('input', Utils.debounce((e) => {
             searchQuery = e.target.value.trim();
             clearSearchBtn.classList.toggle('hidden', !searchQuery);
-            applyFilters();
+            refreshList();
         }, 300));
 
         // Clear search
@@ -107,7 +113,7 @@
             searchInput.value = '';
             searchQuery = '';
             clearSearchBtn.classList.add('hidden');
-            applyFilters();
+            refreshList();
         });
 
         // Filter tabs
@@ -116,10 +122,13 @@
                 filterTabs.forEach(t => t.classList.remove('active'));
                 tab.classList.add('active');
                 currentFilter = tab.dataset.filter;
-                applyFilters();
+                refreshList();
             });
         });
 
+        // Next page
+        loadMoreBtn.addEventListener('click', loadMore);
+
         // Bulk actions
         bulkPublishBtn.addEventListener('click', handleBulkPublish);
         bulkUnpublishBtn.addEventListener('click', handleBulkUnpublish);
@@ -150,9 +159,8 @@
         showLoading();
 
         try {
-            blogs = await BlogsApi.getAll();
-            updateStats();
-            applyFilters();
+            const [stats] = await Promise.all([BlogsApi.getStats(), loadList()]);
+            updateStats(stats);
             showContent();
         } catch (error) {
             console.error('Failed to load blogs:', error);
@@ -160,6 +168,54 @@
         }
     }
 
+    /**
+     * One page of the current view: search results when searching,
+     * otherwise the newest blogs for the active filter tab.
+     */
+    function fetchPage(cursor) {
+        if (searchQuery) {
+            return BlogsApi.search(searchQuery, PAGE_SIZE, cursor);
+        }
+        const status = currentFilter === 'all' ? null : currentFilter;
+        return BlogsApi.getPage(PAGE_SIZE, cursor, status);
+    }
+
+    /**
+     * Reload the list from its first page. Responses to superseded
+     * requests (earlier keystrokes or tabs) are dropped.
+     */
+    async function loadList() {
+        const request = ++listRequest;
+        const page = await fetchPage(null);
+        if (request !== listRequest) return;
+
+        blogs = page.items;
+        nextCursor = page.next_cursor;
+        applyFilters();
+    }
+
+    function refreshList() {
+        loadList().catch((error) => showError(error.message));
+    }
+
+    async function loadMore() {
+        if (!nextCursor) return;
+        const request = listRequest;
+        loadMoreBtn.disabled = true;
+
+        try {
+            const page = await fetchPage(nextCursor);
+            if (request !== listRequest) return;
+            blogs = blogs.concat(page.items);
+            nextCursor = page.next_cursor;
+            applyFilters();
+        } catch (error) {
+            Utils.showToast(error.message, 'error');
+        } finally {
+            loadMoreBtn.disabled = false;
+        }
+    }
+
     // ============================================
     // UI State Management
     // ============================================
@@ -178,6 +234,7 @@
         loadingScreen.classList.add('hidden');
         mainContent.classList.remove('hidden');
         blogList.classList.add('hidden');
+        loadMoreBar.classList.add('hidden');
         emptyState.classList.add('hidden');
         errorState.classList.remove('hidden');
         errorMessage.textContent = message;
@@ -186,16 +243,11 @@
     // ============================================
     // Stats
     // ============================================
-    function updateStats() {
-        const total = blogs.length;
-        const published = blogs.filter(b => b.published).length;
-        const draft = blogs.filter(b => !b.published).length;
-        const featured = blogs.filter(b => b.is_featured).length;
-
-        statTotal.textContent = total;
-        statPublished.textContent = published;
-        statDraft.textContent = draft;
-        statFeatured.textContent = featured;
+    function updateStats(stats) {
+        statTotal.textContent = stats.total;
+        statPublished.textContent = stats.published;
+        statDraft.textContent = stats.draft;
+        statFeatured.textContent = stats.featured;
     }
 
     // ============================================
@@ -204,23 +256,16 @@
     function applyFilters() {
         let result = [...blogs];
 
-        // Apply filter
-        if (currentFilter === 'published') {
-            result = result.filter(b => b.published);
-        } else if (currentFilter === 'draft') {
-            result = result.filter(b => !b.published);
-        } else if (currentFilter === 'featured') {
-            result = result.filter(b => b.is_featured);
-        }
-
-        // Apply search
+        // The server filters list pages by tab; search results cover every
+        // status, so the tab is applied to them here
         if (searchQuery) {
-            const query = searchQuery.toLowerCase();
-            result = result.filter(b =>
-                b.title.toLowerCase().includes(query) ||
-                (b.category && b.category.toLowerCase().includes(query)) ||
-                (b.author_name && b.author_name.toLowerCase().includes(query))
-            );
+            if (currentFilter === 'published') {
+                result = result.filter(b => b.published);
+            } else if (currentFilter === 'draft') {
+                result = result.filter(b => !b.published);
+            } else if (currentFilter === 'featured') {
+                result = result.filter(b => b.is_featured);
+            }
         }
 
         filteredBlogs = result;
@@ -234,6 +279,7 @@
         // Clear previous
         blogList.innerHTML = '';
         errorState.classList.add('hidden');
+        loadMoreBar.classList.toggle('hidden', !nextCursor);
 
         if (filteredBlogs.length === 0) {
             blogList.classList.add('hidden');
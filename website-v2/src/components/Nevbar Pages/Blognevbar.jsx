@@ -272,7 +272,7 @@ const BlogPage = () => {
             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-8">
               {pageData.categories.map((cat) => (
                 <div
-                  key={cat.id}
+                  key={cat.slug || cat.name}
                   className="bg-gray-800 rounded-2xl p-6 hover:bg-blue-700 transition-all duration-300 cursor-pointer shadow-md transform hover:-translate-y-1"
                 >
                   <h4 className="text-xl font-bold mb-2">{cat.name}</h4>
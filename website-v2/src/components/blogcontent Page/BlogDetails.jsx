@@ -368,10 +368,18 @@ const BlogDetails = () => {
               {/* CTA TOP */}
               {renderCTA('top')}
 
-              {/* BLOG CONTENT */}
-              <div className="blog-content prose prose-lg max-w-none">
-                {renderContent(blog.content)}
-              </div>
+              {/* BLOG CONTENT - rendered and sanitized by the backend on save;
+                  posts it has not processed yet fall back to client rendering */}
+              {blog.content_html ? (
+                <div
+                  className="blog-content prose prose-lg max-w-none blog-content-html"
+                  dangerouslySetInnerHTML={{ __html: blog.content_html }}
+                />
+              ) : (
+                <div className="blog-content prose prose-lg max-w-none">
+                  {renderContent(blog.content)}
+                </div>
+              )}
 
               {/* CTA BOTTOM */}
               {renderCTA('bottom')}
@@ -70,6 +70,56 @@ class BlogService {
     }
   }
 
+  /**
+   * Get one page of the published blog archive, newest first.
+   *
+   * @param {{ cursor?: string | null, limit?: number }} [options]
+   * @returns {Promise<{ items: object[], next_cursor: string | null }>}
+   */
+  async getArchive({ cursor = null, limit = 20 } = {}) {
+    try {
+      const params = new URLSearchParams({ limit: String(limit) });
+      if (cursor) params.set('cursor', cursor);
+
+      const data = await fetchJson(`${this.baseURL}/api/blogs/archive?${params}`);
+
+      if (!data?.success) {
+        throw new Error(data?.error || 'Failed to fetch archive');
+      }
+
+      return data.data;
+    } catch (error) {
+      console.error('BlogService.getArchive error:', error);
+      throw error;
+    }
+  }
+
+  /**
+   * Full-text search over published blogs, best match first.
+   * Snippets wrap matched terms in <mark></mark>.
+   *
+   * @param {string} query
+   * @param {{ cursor?: string | null, limit?: number }} [options]
+   * @returns {Promise<{ items: object[], next_cursor: string | null }>}
+   */
+  async search(query, { cursor = null, limit = 20 } = {}) {
+    try {
+      const params = new URLSearchParams({ q: query, limit: String(limit) });
+      if (cursor) params.set('cursor', cursor);
+
+      const data = await fetchJson(`${this.baseURL}/api/blogs/search?${params}`);
+
+      if (!data?.success) {
+        throw new Error(data?.error || 'Search failed');
+      }
+
+      return data.data;
+    } catch (error) {
+      console.error(`BlogService.search("${query}") error:`, error);
+      throw error;
+    }
+  }
+
   /**
    * Get single blog by slug.
    *